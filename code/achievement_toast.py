@@ -0,0 +1,74 @@
+"""
+Aviso de conquista desbloqueada durante o jogo.
+
+O AchievementEngine chama notify() no momento do desbloqueio; nada é
+consultado por frame. Cada aviso é renderizado uma vez e fica na tela por
+TOAST_DURATION ms, um de cada vez, na ordem em que saíram.
+"""
+from collections import deque
+
+import pygame
+
+from settings import WIDTH, UI_BG_COLOR
+from font_manager import font_manager
+
+TOAST_DURATION = 3000
+TOAST_FADE = 400     # ms de entrada/saída
+TOAST_MARGIN = 20
+TOAST_PADDING = 10
+HEADER_COLOR = (255, 215, 0)
+TEXT_COLOR = (255, 255, 255)
+DESCRIPTION_COLOR = (200, 200, 200)
+
+
+class AchievementToast:
+    def __init__(self):
+        self.queue = deque()   # conquistas esperando a vez
+        self.surface = None    # aviso atual, já renderizado
+        self.shown_at = 0
+
+    def notify(self, achievement):
+        """Ouvinte do AchievementEngine"""
+        self.queue.append(achievement)
+
+    def render(self, achievement):
+        header = font_manager.get('achievement').render("CONQUISTA DESBLOQUEADA", True, HEADER_COLOR)
+        name = font_manager.get('ui').render(achievement.name, True, TEXT_COLOR)
+        description = font_manager.get('tiny').render(achievement.description, True, DESCRIPTION_COLOR)
+        lines = (header, name, description)
+
+        width = max(line.get_width() for line in lines) + TOAST_PADDING * 2
+        height = sum(line.get_height() for line in lines) + TOAST_PADDING * 2 + 4
+        surface = pygame.Surface((width, height))
+        surface.fill(UI_BG_COLOR)
+        pygame.draw.rect(surface, HEADER_COLOR, surface.get_rect(), 2)
+        y = TOAST_PADDING
+        for line in lines:
+            surface.blit(line, (TOAST_PADDING, y))
+            y += line.get_height() + 2
+        return surface.convert()
+
+    def draw(self, display_surface):
+        """Desenha o aviso atual (não faz nada se não houver nenhum)"""
+        if self.surface is None:
+            if not self.queue:
+                return
+            self.surface = self.render(self.queue.popleft())
+            self.shown_at = pygame.time.get_ticks()
+
+        elapsed = pygame.time.get_ticks() - self.shown_at
+        if elapsed >= TOAST_DURATION:
+            self.surface = None
+            return
+        fade = min(elapsed, TOAST_DURATION - elapsed, TOAST_FADE) / TOAST_FADE
+        self.surface.set_alpha(int(255 * fade))
+        # Centralizado no topo (o canto direito é dos botões de áudio)
+        display_surface.blit(self.surface, ((WIDTH - self.surface.get_width()) // 2, TOAST_MARGIN))
+
+    def clear(self):
+        self.queue.clear()
+        self.surface = None
+
+
+# Instância global
+achievement_toast = AchievementToast()
@@ -0,0 +1,176 @@
+"""
+Conquistas avaliadas por eventos.
+
+Cada conquista declara os caminhos das estatísticas de que depende (por
+exemplo "combat_stats.enemies_killed"). Quando PlayerStats avisa que um caminho
+mudou, só as conquistas inscritas nele (ou num prefixo dele) e ainda
+bloqueadas são reavaliadas. Os desbloqueios ficam gravados nas próprias
+estatísticas ("unlocked_achievements") e os ouvintes registrados com
+add_listener() recebem cada conquista nova uma vez, sem polling.
+"""
+from datetime import datetime
+
+
+class Achievement:
+    """Uma conquista: nome, descrição, caminhos observados e condição"""
+    __slots__ = ('name', 'description', 'topics', 'condition')
+
+    def __init__(self, name, description, topics, condition):
+        self.name = name
+        self.description = description
+        self.topics = topics
+        self.condition = condition
+
+
+def _levels(stats):
+    return len(stats["levels_completed"])
+
+
+def _orbs(stats):
+    return sum(stats["collection_stats"].values())
+
+
+def _magic(stats):
+    return sum(stats["combat_stats"]["magic_by_type"].values())
+
+
+def _best_time_under(stats, seconds):
+    return any(t is not None and t < seconds for t in stats["performance"]["best_times"].values())
+
+
+LEVELS = ("levels_completed",)
+DEATHS_AND_LEVELS = ("levels_completed", "combat_stats.deaths")
+KILLS = ("combat_stats.enemies_killed",)
+ORBS = ("collection_stats",)
+PLAYTIME = ("total_playtime",)
+BEST_TIMES = ("performance.best_times",)
+DAMAGE = ("combat_stats.damage_dealt",)
+MAGIC = ("combat_stats.magic_by_type",)
+SESSIONS = ("game_sessions",)
+
+# Na ordem em que aparecem nas telas
+ACHIEVEMENTS = (
+    # Progressão
+    Achievement("🏁 Primeiro Passo", "Complete a primeira fase", LEVELS, lambda s: _levels(s) >= 1),
+    Achievement("🚀 Em Movimento", "Complete duas fases", LEVELS, lambda s: _levels(s) >= 2),
+    Achievement("💪 Quase Lá", "Complete três fases", LEVELS, lambda s: _levels(s) >= 3),
+    Achievement("🏆 Campeão", "Complete todas as fases", LEVELS, lambda s: _levels(s) >= 4),
+    # Sobrevivência
+    Achievement("🛡️ Invencível", "Complete uma fase sem morrer", DEATHS_AND_LEVELS,
+                lambda s: s["combat_stats"]["deaths"] == 0 and _levels(s) >= 1),
+    Achievement("💀 Imortal", "Complete o jogo sem morrer", DEATHS_AND_LEVELS,
+                lambda s: s["combat_stats"]["deaths"] == 0 and _levels(s) >= 4),
+    # Combate
+    Achievement("⚔️ Caçador", "Derrote 10 inimigos", KILLS, lambda s: s["combat_stats"]["enemies_killed"] >= 10),
+    Achievement("🗡️ Guerreiro", "Derrote 50 inimigos", KILLS, lambda s: s["combat_stats"]["enemies_killed"] >= 50),
+    Achievement("⚡ Devastador", "Derrote 100 inimigos", KILLS, lambda s: s["combat_stats"]["enemies_killed"] >= 100),
+    Achievement("🔥 Lenda", "Derrote 200 inimigos", KILLS, lambda s: s["combat_stats"]["enemies_killed"] >= 200),
+    # Coleta
+    Achievement("💎 Coletor", "Colete 10 orbs", ORBS, lambda s: _orbs(s) >= 10),
+    Achievement("🔮 Colecionador", "Colete 25 orbs", ORBS, lambda s: _orbs(s) >= 25),
+    Achievement("💰 Tesouro", "Colete 50 orbs", ORBS, lambda s: _orbs(s) >= 50),
+    Achievement("👑 Rei dos Orbs", "Colete 100 orbs", ORBS, lambda s: _orbs(s) >= 100),
+    # Tempo de jogo
+    Achievement("⏰ Dedicado", "Jogue por 30 minutos", PLAYTIME, lambda s: s["total_playtime"] >= 1800),
+    Achievement("🕐 Persistente", "Jogue por 1 hora", PLAYTIME, lambda s: s["total_playtime"] >= 3600),
+    Achievement("⌚ Veterano", "Jogue por 2 horas", PLAYTIME, lambda s: s["total_playtime"] >= 7200),
+    # Performance
+    Achievement("🚄 Velocista", "Complete uma fase em menos de 2 minutos", BEST_TIMES,
+                lambda s: _best_time_under(s, 120)),
+    Achievement("💨 Relâmpago", "Complete uma fase em menos de 1 minuto", BEST_TIMES,
+                lambda s: _best_time_under(s, 60)),
+    # Dano
+    Achievement("💥 Destruidor", "Cause 1000 de dano", DAMAGE, lambda s: s["combat_stats"]["damage_dealt"] >= 1000),
+    Achievement("🌪️ Tempestade", "Cause 5000 de dano", DAMAGE, lambda s: s["combat_stats"]["damage_dealt"] >= 5000),
+    # Magia
+    Achievement("🔮 Mago Novato", "Lance 20 magias", MAGIC, lambda s: _magic(s) >= 20),
+    Achievement("✨ Feiticeiro", "Lance 50 magias", MAGIC, lambda s: _magic(s) >= 50),
+    Achievement("🌟 Arcano", "Lance 100 magias", MAGIC, lambda s: _magic(s) >= 100),
+    # Sessões
+    Achievement("🔄 Habitual", "Jogue 5 sessões", SESSIONS, lambda s: s["game_sessions"] >= 5),
+    Achievement("📅 Frequente", "Jogue 10 sessões", SESSIONS, lambda s: s["game_sessions"] >= 10),
+    # Por tipo de inimigo
+    Achievement("🐉 Caçador de Golus", "Derrote 20 Golus", ("combat_stats.enemies_by_type.golu",),
+                lambda s: s["combat_stats"]["enemies_by_type"]["golu"] >= 20),
+    Achievement("🖤 Sombras Vencidas", "Derrote 15 Blacks", ("combat_stats.enemies_by_type.black",),
+                lambda s: s["combat_stats"]["enemies_by_type"]["black"] >= 15),
+    Achievement("👹 Gigante Slayer", "Derrote 5 Bigbois", ("combat_stats.enemies_by_type.bigboi",),
+                lambda s: s["combat_stats"]["enemies_by_type"]["bigboi"] >= 5),
+    # Por tipo de orb
+    Achievement("❤️ Curandeiro", "Colete 20 Health Orbs", ("collection_stats.health_orbs",),
+                lambda s: s["collection_stats"]["health_orbs"] >= 20),
+    Achievement("💪 Berserker", "Colete 20 Attack Orbs", ("collection_stats.attack_orbs",),
+                lambda s: s["collection_stats"]["attack_orbs"] >= 20),
+    Achievement("💨 Corredor", "Colete 20 Speed Orbs", ("collection_stats.speed_orbs",),
+                lambda s: s["collection_stats"]["speed_orbs"] >= 20),
+)
+
+
+def _prefixes(path):
+    """"a.b.c" -> "a", "a.b", "a.b.c" (quem observa o todo também é avisado)"""
+    parts = path.split('.')
+    return ['.'.join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+class AchievementEngine:
+    """Avalia só as conquistas afetadas por cada mudança e guarda os desbloqueios"""
+
+    def __init__(self, achievements=ACHIEVEMENTS):
+        self.achievements = achievements
+        self.by_name = {achievement.name: achievement for achievement in achievements}
+        self.subscribers = {}  # caminho -> [Achievement]
+        for achievement in achievements:
+            for topic in achievement.topics:
+                self.subscribers.setdefault(topic, []).append(achievement)
+        self.listeners = []
+        self._storage = None   # lista [[nome, data], ...] dentro das estatísticas
+        self._unlocked = set()
+
+    def add_listener(self, callback):
+        """callback(achievement) a cada conquista desbloqueada (no main thread)"""
+        self.listeners.append(callback)
+
+    def _sync(self, stats):
+        """Acompanha a lista de desbloqueios das estatísticas (pode ser trocada por um save)"""
+        storage = stats["unlocked_achievements"]
+        if storage is not self._storage:
+            self._storage = storage
+            self._unlocked = {entry[0] for entry in storage}
+
+    def _evaluate(self, stats, candidates, notify):
+        for achievement in candidates:
+            if achievement.name in self._unlocked or not achievement.condition(stats):
+                continue
+            self._unlocked.add(achievement.name)
+            self._storage.append([achievement.name, datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
+            if notify:
+                print(f"🏅 Conquista desbloqueada: {achievement.name}")
+                for listener in self.listeners:
+                    listener(achievement)
+
+    def changed(self, stats, paths, notify=True):
+        """Reavalia as conquistas bloqueadas que observam algum dos `paths`"""
+        self._sync(stats)
+        candidates = []
+        seen = set()
+        for path in paths:
+            for topic in _prefixes(path):
+                for achievement in self.subscribers.get(topic, ()):
+                    if achievement.name not in seen:
+                        seen.add(achievement.name)
+                        candidates.append(achievement)
+        self._evaluate(stats, candidates, notify)
+
+    def evaluate_all(self, stats, notify=False):
+        """Avalia tudo uma vez (ao carregar estatísticas antigas, sem avisos)"""
+        self._sync(stats)
+        self._evaluate(stats, self.achievements, notify)
+
+    def unlocked(self, stats):
+        """Nomes desbloqueados, na ordem da tabela"""
+        self._sync(stats)
+        return [achievement.name for achievement in self.achievements if achievement.name in self._unlocked]
+
+    def description(self, name):
+        achievement = self.by_name.get(name)
+        return achievement.description if achievement else "Conquista especial"
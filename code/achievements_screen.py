@@ -3,6 +3,7 @@ import sys
 import math
 from settings import *
 from player_stats import player_stats
+from achievements import ACHIEVEMENTS
 from font_manager import font_manager
 
 class AchievementsScreen:
@@ -53,40 +54,7 @@ class AchievementsScreen:
     
     def get_all_possible_achievements(self) -> list:
         """Retorna todas as conquistas possíveis com suas descrições"""
-        return [
-            ("🏁 Primeiro Passo", "Complete a primeira fase"),
-            ("🚀 Em Movimento", "Complete duas fases"),
-            ("💪 Quase Lá", "Complete três fases"),
-            ("🏆 Campeão", "Complete todas as fases"),
-            ("🛡️ Invencível", "Complete uma fase sem morrer"),
-            ("💀 Imortal", "Complete o jogo sem morrer"),
-            ("⚔️ Caçador", "Derrote 10 inimigos"),
-            ("🗡️ Guerreiro", "Derrote 50 inimigos"),
-            ("⚡ Devastador", "Derrote 100 inimigos"),
-            ("🔥 Lenda", "Derrote 200 inimigos"),
-            ("💎 Coletor", "Colete 10 orbs"),
-            ("🔮 Colecionador", "Colete 25 orbs"),
-            ("💰 Tesouro", "Colete 50 orbs"),
-            ("👑 Rei dos Orbs", "Colete 100 orbs"),
-            ("⏰ Dedicado", "Jogue por 30 minutos"),
-            ("🕐 Persistente", "Jogue por 1 hora"),
-            ("⌚ Veterano", "Jogue por 2 horas"),
-            ("🚄 Velocista", "Complete uma fase em menos de 2 minutos"),
-            ("💨 Relâmpago", "Complete uma fase em menos de 1 minuto"),
-            ("💥 Destruidor", "Cause 1000 de dano"),
-            ("🌪️ Tempestade", "Cause 5000 de dano"),
-            ("🔮 Mago Novato", "Lance 20 magias"),
-            ("✨ Feiticeiro", "Lance 50 magias"),
-            ("🌟 Arcano", "Lance 100 magias"),
-            ("🔄 Habitual", "Jogue 5 sessões"),
-            ("📅 Frequente", "Jogue 10 sessões"),
-            ("🐉 Caçador de Golus", "Derrote 20 Golus"),
-            ("🖤 Sombras Vencidas", "Derrote 15 Blacks"),
-            ("👹 Gigante Slayer", "Derrote 5 Bigbois"),
-            ("❤️ Curandeiro", "Colete 20 Health Orbs"),
-            ("💪 Berserker", "Colete 20 Attack Orbs"),
-            ("💨 Corredor", "Colete 20 Speed Orbs")
-        ]
+        return [(achievement.name, achievement.description) for achievement in ACHIEVEMENTS]
     
     def handle_events(self, events):
         """Handle input events"""
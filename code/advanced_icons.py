@@ -5,6 +5,7 @@ Cria ícones vetoriais de alta qualidade usando pygame
 import pygame
 import math
 from typing import Tuple, List, Dict, Optional
+import gradients
 
 class AdvancedIconRenderer:
     """Renderizador de ícones vetoriais avançados"""
@@ -274,15 +275,9 @@ class AdvancedIconRenderer:
                            rect: Tuple[int, int, int, int]):
         """Desenha retângulo com gradiente"""
         x, y, width, height = rect
-        
-        for i in range(height):
-            ratio = i / height
-            gradient_color = self._lerp_color(
-                self._lighten_color(color, 0.2), 
-                self._darken_color(color, 0.2), 
-                ratio
-            )
-            pygame.draw.line(surface, gradient_color, (x, y + i), (x + width, y + i))
+        gradient = gradients.linear_gradient(width + 1, height, self._lighten_color(color, 0.2),
+                                             self._darken_color(color, 0.2))
+        surface.blit(gradient, (x, y))
     
     def _draw_arc_smooth(self, surface: pygame.Surface, color: Tuple[int, int, int], 
                         rect: Tuple[int, int, int, int], start_angle: float, 
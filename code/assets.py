@@ -0,0 +1,289 @@
+"""
+Pipeline de assets: cache único de imagens, pastas de animação e sons.
+
+Cada arquivo é decodificado uma vez só, não uma vez por inimigo/orbe. Com
+preload() a decodificação (pygame.image.load / mixer.Sound, que liberam o GIL)
+roda num pool de threads e o main thread só faz o convert()/convert_alpha(),
+em fatias de tempo, enquanto a tela de carregamento continua animando:
+
+    job = asset_pipeline.preload(['level1'], on_progress=loading.set_progress)
+    while not job.poll(budget_ms=8):
+        loading.update(); pygame.display.update()
+
+O que não foi pré-carregado é carregado na hora, no main thread, na primeira
+vez que for pedido. As surfaces retornadas são compartilhadas: quem for alterá-las
+(set_alpha, fill, blit por cima) deve usar .copy().
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from settings import weapon_data, magic_data, monster_data, sound_paths
+from utils.logger import game_logger
+
+ASSET_WORKERS = min(4, os.cpu_count() or 1)
+
+# Estados de animação de player e monstros (uma pasta cada)
+ANIMATION_STATES = ('up', 'down', 'left', 'right',
+                    'right_idle', 'left_idle', 'up_idle', 'down_idle',
+                    'right_attack', 'left_attack', 'up_attack', 'down_attack')
+
+
+def _animation_folders(root):
+    return [f'{root}/{state}' for state in ANIMATION_STATES]
+
+
+# Manifestos: o que cada parte do jogo usa. 'requires' lista manifestos que
+# precisam estar carregados antes (carregados primeiro, uma vez só).
+# 'images' usam convert_alpha(); 'opaque_images' usam convert().
+ASSET_MANIFESTS = {
+    'player': {
+        'images': ['../graphics/player/down_idle/tile000.png'],
+        'folders': _animation_folders('../graphics/player'),
+    },
+    'weapons': {
+        'images': [data['graphic'] for data in weapon_data.values()] +
+                  [f'../graphics/weapons/{name}/{direction}.png'
+                   for name in weapon_data for direction in ('up', 'down', 'left', 'right')],
+    },
+    'hud': {
+        'requires': ['weapons'],
+        'images': [data['graphic'] for data in magic_data.values()],
+    },
+    'sfx': {
+        'sounds': list(dict.fromkeys(list(sound_paths.values()) +
+                                     [data[key] for data in monster_data.values()
+                                      for key in ('attack_sound', 'death_sound') if key in data])),
+    },
+    'orbs': {
+        'folders': ['../graphics/objects/healthOrbs', '../graphics/objects/speedOrbs',
+                    '../graphics/objects/attackOrbs'],
+    },
+    'level1': {
+        'requires': ['player', 'hud', 'orbs', 'sfx'],
+        'opaque_images': ['../map new/map.png'],
+        'images': ['../map new/map1.png'],
+        'folders': ['../graphics/grass'] + _animation_folders('../graphics/monsters/golu'),
+    },
+    'level2': {
+        'requires': ['player', 'hud', 'orbs', 'sfx'],
+        'opaque_images': ['../map new/maze1.png'],
+        'images': ['../map new/maze2.png'],
+        'folders': ['../graphics/grass'] + _animation_folders('../graphics/monsters/golu') +
+                   _animation_folders('../graphics/monsters/bigboi'),
+    },
+    'level3': {
+        'requires': ['player', 'hud', 'orbs', 'sfx'],
+        'opaque_images': ['../map new/dungeon ground.png'],
+        'images': ['../map new/ala.png'],
+        'folders': ['../graphics/objects/EldrichGem', '../graphics/objects/key'] +
+                   _animation_folders('../graphics/monsters/bigboi') +
+                   _animation_folders('../graphics/monsters/black'),
+    },
+    'level4': {
+        'requires': ['player', 'hud', 'orbs', 'sfx'],
+        'opaque_images': ['../map new/last level.png'],
+        'images': ['../map new/last level1.png'],
+        'folders': _animation_folders('../graphics/monsters/golu') +
+                   _animation_folders('../graphics/monsters/bigboi') +
+                   _animation_folders('../graphics/monsters/black'),
+    },
+}
+
+
+def resolve_manifests(names):
+    """Nomes de manifestos em ordem de dependência (cada um uma vez só)"""
+    ordered = []
+
+    def visit(name, path=()):
+        if name in ordered:
+            return
+        if name in path:
+            raise ValueError(f"dependência circular entre manifestos: {' -> '.join(path + (name,))}")
+        for required in ASSET_MANIFESTS[name].get('requires', ()):
+            visit(required, path + (name,))
+        ordered.append(name)
+
+    for name in names:
+        visit(name)
+    return ordered
+
+
+def list_folder(path):
+    """Arquivos de uma pasta na mesma ordem de support.import_folder"""
+    files = []
+    for _, __, img_files in os.walk(path):
+        for image in img_files:
+            files.append(path + '/' + image)
+    return files
+
+
+class AssetJob:
+    """Um preload em andamento: decodifica em threads, finaliza no main thread"""
+
+    def __init__(self, pipeline, entries, on_progress=None):
+        self.pipeline = pipeline
+        self.on_progress = on_progress
+        self.total = len(entries)
+        self.done = 0
+        self.errors = []
+        # Futures na ordem dos manifestos: finalizar em ordem respeita as dependências
+        executor = pipeline.executor()
+        self.pending = [(entry, executor.submit(pipeline.decode, entry)) for entry in entries]
+        self.report()
+
+    @property
+    def finished(self):
+        return not self.pending
+
+    def report(self, label=None):
+        if self.on_progress is not None:
+            self.on_progress(self.done, self.total, label)
+
+    def poll(self, budget_ms=8):
+        """Finaliza o que já foi decodificado, por no máximo `budget_ms`.
+
+        Retorna True quando tudo terminou. Para no primeiro item ainda em
+        decodificação, então o chamador pode desenhar um frame e voltar depois.
+        """
+        deadline = time.perf_counter() + budget_ms / 1000
+        label = None
+        while self.pending and time.perf_counter() < deadline:
+            entry, future = self.pending[0]
+            if not future.done():
+                break
+            self.pending.pop(0)
+            try:
+                self.pipeline.finalize(entry, future.result())
+            except (pygame.error, OSError) as e:
+                self.errors.append((entry, e))
+                game_logger.warning("⚠️ Asset não carregado %s: %s", entry[1], e)
+            self.done += 1
+            label = entry[1]
+        if label is not None or self.finished:
+            self.report(label)
+        if self.finished:
+            self.pipeline.finish_folders()
+        return self.finished
+
+    def wait(self):
+        """Bloqueia até tudo ser finalizado"""
+        while not self.poll(budget_ms=50):
+            time.sleep(0.001)
+
+
+class AssetPipeline:
+    """Cache de assets com carregamento em segundo plano"""
+
+    def __init__(self, workers=ASSET_WORKERS):
+        self.workers = workers
+        self.images = {}   # (caminho, alpha) -> Surface convertida
+        self.folders = {}  # pasta -> [Surface] na ordem de list_folder
+        self.sounds = {}   # caminho -> pygame.mixer.Sound
+        self._executor = None
+        self._folder_files = {}  # pastas pré-carregadas esperando todas as imagens
+
+    def executor(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='assets')
+        return self._executor
+
+    # --- Acesso (main thread) -------------------------------------------
+
+    def image(self, path, alpha=True):
+        """Imagem convertida para o formato da tela (carrega se preciso)"""
+        key = (path, alpha)
+        surface = self.images.get(key)
+        if surface is None:
+            surface = self.finalize(('image' if alpha else 'opaque', path), pygame.image.load(path))
+        return surface
+
+    def folder(self, path):
+        """Frames de uma pasta (nova lista, surfaces compartilhadas)"""
+        frames = self.folders.get(path)
+        if frames is None:
+            frames = self.folders[path] = [self.image(file) for file in list_folder(path)]
+        return list(frames)
+
+    def sound(self, path):
+        """Som decodificado (carrega se preciso)"""
+        sound = self.sounds.get(path)
+        if sound is None:
+            sound = self.sounds[path] = pygame.mixer.Sound(path)
+        return sound
+
+    # --- Preload ---------------------------------------------------------
+
+    def entries(self, names):
+        """Itens (tipo, caminho) dos manifestos que ainda não estão no cache"""
+        entries = []
+        seen = set()
+
+        def add(kind, path):
+            cached = (self.sounds if kind == 'sound' else self.images)
+            key = path if kind == 'sound' else (path, kind == 'image')
+            if key not in cached and (kind, path) not in seen:
+                seen.add((kind, path))
+                entries.append((kind, path))
+
+        for name in resolve_manifests(names):
+            manifest = ASSET_MANIFESTS[name]
+            for path in manifest.get('opaque_images', ()):
+                add('opaque', path)
+            for path in manifest.get('images', ()):
+                add('image', path)
+            for folder in manifest.get('folders', ()):
+                if folder in self.folders:
+                    continue
+                files = self._folder_files[folder] = list_folder(folder)
+                for path in files:
+                    add('image', path)
+            for path in manifest.get('sounds', ()):
+                add('sound', path)
+        return entries
+
+    def preload(self, names, on_progress=None):
+        """Começa a carregar os manifestos `names` (e dependências) em segundo plano.
+
+        `on_progress(done, total, label)` é chamado no main thread, de dentro de
+        AssetJob.poll(), a cada lote finalizado.
+        """
+        return AssetJob(self, self.entries(names), on_progress)
+
+    @staticmethod
+    def decode(entry):
+        """Roda numa thread do pool: só leitura e decodificação"""
+        kind, path = entry
+        if kind == 'sound':
+            return pygame.mixer.Sound(path)
+        return pygame.image.load(path)
+
+    def finalize(self, entry, decoded):
+        """Main thread: converte para o formato da tela e guarda no cache"""
+        kind, path = entry
+        if kind == 'sound':
+            self.sounds[path] = decoded
+            return decoded
+        surface = decoded.convert_alpha() if kind == 'image' else decoded.convert()
+        self.images[(path, kind == 'image')] = surface
+        return surface
+
+    def finish_folders(self):
+        """Monta as listas de frames das pastas cujas imagens já estão no cache"""
+        for folder, files in list(self._folder_files.items()):
+            if all((path, True) in self.images for path in files):
+                self.folders[folder] = [self.images[(path, True)] for path in files]
+                del self._folder_files[folder]
+
+    def clear(self):
+        """Esvazia o cache (ex.: depois de trocar o modo de vídeo)"""
+        self.images.clear()
+        self.folders.clear()
+        self.sounds.clear()
+        self._folder_files.clear()
+
+
+# Instância global
+asset_pipeline = AssetPipeline()
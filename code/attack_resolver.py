@@ -0,0 +1,58 @@
+from spatial_hash import SpatialHash
+
+
+class AttackResolver:
+    """Fase ampla dos ataques do jogador (armas e projéteis mágicos).
+
+    Os alvos atacáveis (entidades) ficam num SpatialHash que eles mesmos
+    atualizam ao mudar de célula ou morrer, então um tick com ataque custa só as
+    consultas, não uma varredura do grupo. Cada par ataque-alvo é resolvido uma
+    única vez por golpe, mesmo que a sobreposição dure vários frames.
+    """
+
+    def __init__(self, attackable_sprites, cell_size=128):
+        self.attackable_sprites = attackable_sprites
+        self.index = SpatialHash(cell_size)
+        self.resolved_pairs = {}  # ataque -> alvos já atingidos neste golpe
+
+    def track_targets(self):
+        """Registra alvos que entraram no grupo (os que morrem saem sozinhos)"""
+        group, index = self.attackable_sprites, self.index
+        if len(index) == len(group):
+            return
+        for sprite in [s for s in group if s not in index]:
+            index.track(sprite)
+        # Removidos do grupo sem kill(): não devem mais ser atingidos
+        if len(index) != len(group):
+            index.sync(group)
+
+    def forget(self, attack_sprite):
+        """Descarta o histórico de um ataque (ex.: sprite reaproveitado)"""
+        self.resolved_pairs.pop(attack_sprite, None)
+
+    def resolve(self, attack_sprites):
+        """Retorna os pares (ataque, alvo) que colidiram pela primeira vez neste tick"""
+        if not attack_sprites:
+            self.resolved_pairs.clear()
+            return []
+
+        # Golpes que terminaram não precisam mais do cache
+        for attack in [a for a in self.resolved_pairs if not a.alive()]:
+            del self.resolved_pairs[attack]
+
+        self.track_targets()
+        hits = []
+        for attack in attack_sprites:
+            # Only process actual weapons and magic projectiles, not effects
+            if getattr(attack, 'sprite_type', None) not in ('weapon', 'magic'):
+                continue
+            already_hit = self.resolved_pairs.setdefault(attack, set())
+            attack_rect = attack.rect
+            for target in self.index.query(attack_rect):
+                if target not in already_hit and attack_rect.colliderect(target.rect):
+                    # Alvos invulneráveis são tentados de novo no próximo tick,
+                    # como antes; só um golpe que pode acertar fecha o par
+                    if getattr(target, 'vulnerable', True):
+                        already_hit.add(target)
+                    hits.append((attack, target))
+        return hits
@@ -1,5 +1,322 @@
+import math
 import pygame
 import threading
+from collections import OrderedDict
+
+from assets import asset_pipeline
+from settings import sound_paths, music_paths
+
+# Categorias de efeitos: vozes simultâneas e prioridade (maior rouba a voz da menor)
+SOUND_CATEGORIES = {
+    'ui':          {'voices': 2, 'priority': 4},  # Sons de interface
+    'combat':      {'voices': 6, 'priority': 3},  # Sons de combate (attack, hit)
+    'collection':  {'voices': 4, 'priority': 2},  # Sons de coleta (pickup, heal)
+    'environment': {'voices': 3, 'priority': 1},  # Sons de ambiente
+    'movement':    {'voices': 1, 'priority': 0},  # Sons de movimento (walking, running)
+}
+DEFAULT_CATEGORY = 'environment'
+
+VOICE_POOL_SIZE = 12        # canais do mixer reservados para efeitos
+SAME_SOUND_WINDOW_MS = 40   # o mesmo som não reinicia dentro desta janela
+
+# Som posicional (pixels do mundo): volume cheio até FULL_VOLUME_RADIUS, cai
+# linearmente até AUDIBLE_RANGE e além disso o som nem chega ao mixer
+FULL_VOLUME_RADIUS = 150
+AUDIBLE_RANGE = 900
+PAN_DISTANCE = 640          # meia tela: a esta distância lateral o som sai de um lado só
+
+MUSIC_DECKS = 2             # canais 0 e 1: duas faixas tocando durante o crossfade
+MUSIC_CROSSFADE_MS = 1500
+MUSIC_CACHE_SIZE = 3        # faixas decodificadas mantidas em memória
+
+_reserved_channels = 0
+
+
+def reserve_channels(count):
+    """Reserva os canais 0..count-1: Sound.play() sem canal não cai neles.
+
+    Música (canais 0 e 1) e vozes (logo depois) dividem a reserva, então ela
+    só cresce - quem chega depois não devolve os canais do outro.
+    """
+    global _reserved_channels
+    if count > _reserved_channels:
+        if pygame.mixer.get_num_channels() < count + 2:
+            pygame.mixer.set_num_channels(count + 2)
+        _reserved_channels = pygame.mixer.set_reserved(count)
+
+
+class Voice:
+    """Um canal do pool e o que está tocando nele"""
+    __slots__ = ('channel', 'category', 'priority', 'sound_file', 'started', 'volume', 'position', 'gains')
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.category = None
+        self.priority = -1
+        self.sound_file = None
+        self.started = 0
+        self.volume = 1.0
+        self.position = None  # posição no mundo (sons posicionais)
+        self.gains = None     # (esquerda, direita) do pan/atenuação
+
+    @property
+    def active(self):
+        return self.category is not None and self.channel.get_busy()
+
+    def apply_volume(self):
+        if self.gains is None:
+            self.channel.set_volume(self.volume)
+        else:
+            self.channel.set_volume(self.volume * self.gains[0], self.volume * self.gains[1])
+
+
+def spatial_gains(listener, position):
+    """Ganhos (esquerda, direita) de um som em `position` ouvido em `listener`.
+
+    None quando o som está fora do alcance audível.
+    """
+    dx = position[0] - listener[0]
+    dy = position[1] - listener[1]
+    distance_sq = dx * dx + dy * dy
+    if distance_sq >= AUDIBLE_RANGE * AUDIBLE_RANGE:
+        return None
+    distance = math.sqrt(distance_sq)
+    if distance <= FULL_VOLUME_RADIUS:
+        gain = 1.0
+    else:
+        gain = 1.0 - (distance - FULL_VOLUME_RADIUS) / (AUDIBLE_RANGE - FULL_VOLUME_RADIUS)
+    pan = max(-1.0, min(1.0, dx / PAN_DISTANCE))
+    return gain * min(1.0, 1.0 - pan), gain * min(1.0, 1.0 + pan)
+
+
+class VoicePool:
+    """Alocador de vozes: limite por categoria, roubo por prioridade e rate limit.
+
+    Os canais do pool (depois dos da música) ficam reservados, então
+    Sound.play() de outros módulos nunca cai num deles. Com o pool cheio o som
+    novo rouba a voz mais antiga de prioridade menor ou igual; se não houver,
+    é descartado. A carga do mixer fica limitada a `size` efeitos.
+    """
+
+    def __init__(self, size=VOICE_POOL_SIZE, categories=SOUND_CATEGORIES,
+                 same_sound_window_ms=SAME_SOUND_WINDOW_MS, first_channel=MUSIC_DECKS):
+        self.size = size
+        self.first_channel = first_channel
+        self.categories = categories
+        self.same_sound_window_ms = same_sound_window_ms
+        self.voices = []           # criadas quando o mixer já existe
+        self.last_started = {}     # arquivo -> ticks do último início
+        self.dropped = 0           # sons descartados (rate limit ou sem voz)
+
+    def resize(self, size):
+        """Muda o tamanho do pool (para tudo que está tocando nele)"""
+        self.stop()
+        self.size = size
+        self.voices = []
+
+    def _ensure_voices(self):
+        if len(self.voices) != self.size:
+            last = self.first_channel + self.size
+            reserve_channels(last)
+            self.voices = [Voice(pygame.mixer.Channel(i)) for i in range(self.first_channel, last)]
+        return self.voices
+
+    def _pick_voice(self, category, priority):
+        """Voz livre, ou a que deve ser roubada; None se o som deve ser descartado"""
+        limit = self.categories.get(category, self.categories[DEFAULT_CATEGORY])['voices']
+        free = None
+        same_category = []
+        victim = None
+        for voice in self._ensure_voices():
+            if not voice.active:
+                if free is None:
+                    free = voice
+                continue
+            if voice.category == category:
+                same_category.append(voice)
+            if voice.priority <= priority and (victim is None or
+                                               (voice.priority, voice.started) < (victim.priority, victim.started)):
+                victim = voice
+        # Categoria no limite: reaproveita a voz mais antiga dela
+        if len(same_category) >= limit:
+            return min(same_category, key=lambda voice: voice.started)
+        return free or victim
+
+    def play(self, sound, sound_file, category, priority, volume, loops=0, position=None, gains=None):
+        """Toca `sound` numa voz do pool; retorna o canal ou None se descartado"""
+        now = pygame.time.get_ticks()
+        last = self.last_started.get(sound_file)
+        if last is not None and now - last < self.same_sound_window_ms:
+            self.dropped += 1
+            return None
+        voice = self._pick_voice(category, priority)
+        if voice is None:
+            self.dropped += 1
+            return None
+        voice.channel.play(sound, loops=loops)
+        voice.volume = volume
+        voice.position = position
+        voice.gains = gains
+        voice.apply_volume()
+        voice.category = category
+        voice.priority = priority
+        voice.sound_file = sound_file
+        voice.started = now
+        self.last_started[sound_file] = now
+        return voice.channel
+
+    def apply_volumes(self, category_volumes, default_volume):
+        """Atualiza o volume das vozes tocando (só quando o volume muda)"""
+        for voice in self.voices:
+            if voice.category is not None:
+                voice.volume = category_volumes.get(voice.category, default_volume)
+                voice.apply_volume()
+
+    def update_positions(self, listener):
+        """Recalcula pan/atenuação das vozes posicionais para o ouvinte atual"""
+        for voice in self.voices:
+            if voice.position is None or not voice.active:
+                continue
+            gains = spatial_gains(listener, voice.position)
+            voice.gains = gains or (0.0, 0.0)
+            voice.apply_volume()
+
+    def active_counts(self):
+        """Vozes tocando por categoria"""
+        counts = {}
+        for voice in self.voices:
+            if voice.active:
+                counts[voice.category] = counts.get(voice.category, 0) + 1
+        return counts
+
+    def stop(self, category=None):
+        """Para as vozes de uma categoria (ou todas)"""
+        for voice in self.voices:
+            if voice.category is not None and (category is None or voice.category == category):
+                voice.channel.stop()
+                voice.category = None
+
+
+class MusicPlayer:
+    """Música em dois canais com crossfade e decodificação fora do frame.
+
+    A faixa é decodificada inteira (pygame.mixer.Sound) numa thread do
+    asset_pipeline; play() nunca abre arquivo no main thread. Enquanto a faixa
+    nova não fica pronta a antiga continua tocando, e update() (uma vez por
+    frame) inicia o crossfade quando ela chega. prefetch() adianta a faixa da
+    próxima fase para a troca ser imediata.
+    """
+
+    def __init__(self, crossfade_ms=MUSIC_CROSSFADE_MS, cache_size=MUSIC_CACHE_SIZE):
+        self.crossfade_ms = crossfade_ms
+        self.cache_size = cache_size
+        self.tracks = OrderedDict()  # caminho -> Sound decodificado (LRU)
+        self.loading = {}            # caminho -> Future da decodificação
+        self.failed = set()
+        self.decks = []              # criados quando o mixer já existe
+        self.active = 0
+        self.current = None          # faixa pedida por último (tocando ou decodificando)
+        self.playing = None          # faixa tocando de fato
+        self.requested = None        # (caminho, loops) esperando a decodificação
+        self.volume = 0.5
+        self.fade_until = 0          # fim do crossfade em andamento (ticks)
+
+    def _ensure_decks(self):
+        if not self.decks:
+            reserve_channels(MUSIC_DECKS)
+            self.decks = [pygame.mixer.Channel(i) for i in range(MUSIC_DECKS)]
+        return self.decks
+
+    def prefetch(self, path):
+        """Começa a decodificar `path` em segundo plano (se ainda não estiver pronta)"""
+        if path in self.tracks or path in self.loading or path in self.failed:
+            return
+        self.loading[path] = asset_pipeline.executor().submit(pygame.mixer.Sound, path)
+
+    def _collect(self):
+        """Guarda as faixas que terminaram de decodificar"""
+        for path, future in list(self.loading.items()):
+            if not future.done():
+                continue
+            del self.loading[path]
+            try:
+                self.tracks[path] = future.result()
+            except (pygame.error, FileNotFoundError) as e:
+                self.failed.add(path)
+                print(f"❌ Erro ao carregar música {path}: {e}")
+                continue
+            print(f"🎵 Música carregada: {path}")
+        # Descarta as mais antigas, nunca a que está tocando
+        while len(self.tracks) > self.cache_size:
+            oldest = next(path for path in self.tracks if path not in (self.current, self.playing))
+            del self.tracks[oldest]
+
+    def play(self, path, loops=-1):
+        """Troca para `path` com crossfade; False se a faixa não pode ser carregada"""
+        if path in self.failed:
+            return False
+        if path == self.current and (self.requested or self.is_playing()):
+            return True
+        if path == self.playing and self.is_playing():
+            # Voltou para a faixa que já está tocando antes da outra ficar pronta
+            self.current = path
+            self.requested = None
+            return True
+        self.current = path
+        if path in self.tracks:
+            self.requested = None
+            self._start(path, loops)
+        else:
+            self.requested = (path, loops)
+            self.prefetch(path)
+        return True
+
+    def _start(self, path, loops):
+        sound = self.tracks[path]
+        self.tracks.move_to_end(path)
+        decks = self._ensure_decks()
+        decks[self.active].fadeout(self.crossfade_ms)
+        self.active = 1 - self.active
+        deck = decks[self.active]
+        deck.set_volume(self.volume)
+        deck.play(sound, loops=loops, fade_ms=self.crossfade_ms)
+        self.fade_until = pygame.time.get_ticks() + self.crossfade_ms
+        self.playing = path
+        print(f"▶️ Reproduzindo música (volume: {int(self.volume * 100)}%)")
+
+    def update(self):
+        """Uma vez por frame: inicia a faixa pedida quando ela fica pronta"""
+        if self.loading:
+            self._collect()
+        if self.requested and self.requested[0] not in self.loading:
+            path, loops = self.requested
+            self.requested = None
+            if path in self.tracks:
+                self._start(path, loops)
+            elif self.current == path:
+                self.current = self.playing  # falhou: segue a faixa antiga
+        # O fade-in termina no volume do início; reaplica se mudou no meio
+        if self.fade_until and pygame.time.get_ticks() >= self.fade_until:
+            self.fade_until = 0
+            self.decks[self.active].set_volume(self.volume)
+
+    def set_volume(self, volume):
+        self.volume = volume
+        if self.decks:
+            self.decks[self.active].set_volume(volume)
+
+    def stop(self, fade_ms=0):
+        self.requested = None
+        self.current = self.playing = None
+        for deck in self.decks:
+            if fade_ms:
+                deck.fadeout(fade_ms)
+            else:
+                deck.stop()
+
+    def is_playing(self):
+        return bool(self.decks) and self.decks[self.active].get_busy()
+
 
 class AudioManager:
     """Gerenciador centralizado de áudio para todo o jogo"""
@@ -24,34 +341,34 @@ class AudioManager:
             self.music_muted = False
             self.sfx_muted = False
             
-            # Cache de sons carregados para performance
-            self.loaded_sounds = {}
+            # Banco de sons: caminho -> Sound já decodificado. Os arquivos de
+            # sound_paths são pré-carregados pelo asset_pipeline (manifesto 'sfx')
+            # junto com as fases; o que faltar é carregado no primeiro uso.
+            self.loaded_sounds = asset_pipeline.sounds
+            self.failed_sounds = set()  # não tenta decodificar de novo a cada play
             
             # Mapeamento de sons para facilitar o uso
-            self.sound_paths = {
-                'heal': '../audio/heal.wav',
-                'walk': '../audio/walk.wav', 
-                'stomp': '../audio/stomp.wav',
-                'ambience': '../audio/Light Ambience 1.mp3',
-                'sword': '../audio/sword.wav',
-                'hit': '../audio/hit.wav',
-                'monster_scream': '../audio/monsterScream.wav',
-                'bigboi_death': '../audio/bigboi death.wav',
-                'slash': '../audio/attack/slash.wav',
-                'claw': '../audio/attack/claw.wav',
-                'fireball': '../audio/attack/fireball.wav'
-            }
+            self.sound_paths = dict(sound_paths)
+            
+            # Vozes de efeitos (canais reservados do mixer)
+            self.voices = VoicePool()
             
-            # Canais dedicados para diferentes tipos de som
-            self.channels = {
-                'movement': 1,    # Sons de movimento (walking, running)
-                'combat': 2,      # Sons de combate (attack, hit)
-                'collection': 3,  # Sons de coleta (pickup, heal)
-                'environment': 4, # Sons de ambiente
-                'ui': 5          # Sons de interface
-            }
+            # Ganho por categoria (multiplica o volume de efeitos) e o volume
+            # final de cada categoria, recalculado só quando algo muda
+            self.category_gains = {category: 1.0 for category in SOUND_CATEGORIES}
+            self.category_volumes = {}
+            self._update_category_volumes()
             
-            self.current_music = None
+            # Sons posicionais: ouvinte (jogador) e os pedidos do frame, tocados
+            # juntos em update() - um por arquivo, o mais alto
+            self.listener = None
+            self.mixed_listener = None  # ouvinte usado no último update()
+            self.pending_spatial = {}
+            self.spatial_culled = 0
+            
+            # Música: caminho ou nome de music_paths
+            self.music_paths = dict(music_paths)
+            self.music = MusicPlayer()
             self._initialized = True
             print("🎵 AudioManager inicializado com controles separados")
     
@@ -72,6 +389,22 @@ class AudioManager:
         if abs(new_volume - self.sfx_volume) > 0.05:
             print(f"🔊 Volume dos efeitos: {int(new_volume * 100)}%")
         self.sfx_volume = new_volume
+        self._update_category_volumes()
+    
+    def set_category_volume(self, category, volume):
+        """Define o ganho de uma categoria de efeitos (0.0 a 1.0)"""
+        self.category_gains[category] = max(0.0, min(1.0, volume))
+        self._update_category_volumes()
+    
+    def _update_category_volumes(self):
+        """Recalcula o volume efetivo de cada categoria e aplica nas vozes tocando"""
+        base = 0.0 if self.sfx_muted else self.sfx_volume
+        self.category_volumes = {category: base * gain for category, gain in self.category_gains.items()}
+        self.voices.apply_volumes(self.category_volumes, base)
+    
+    def set_voice_count(self, count):
+        """Define quantos canais do mixer ficam para efeitos sonoros"""
+        self.voices.resize(max(1, count))
     
     def toggle_music_mute(self):
         """Liga/desliga apenas a música de fundo"""
@@ -83,13 +416,14 @@ class AudioManager:
     def toggle_sfx_mute(self):
         """Liga/desliga apenas os efeitos sonoros"""
         self.sfx_muted = not self.sfx_muted
+        self._update_category_volumes()
         status = "MUDO" if self.sfx_muted else f"{int(self.sfx_volume * 100)}%"
         print(f"🔊 Efeitos: {status}")
     
     def _apply_music_volume(self):
         """Aplica o volume atual à música"""
         effective_volume = 0.0 if self.music_muted else self.music_volume
-        pygame.mixer.music.set_volume(effective_volume)
+        self.music.set_volume(effective_volume)
     
     # Métodos de compatibilidade com código existente
     def set_volume(self, volume):
@@ -103,91 +437,159 @@ class AudioManager:
         self.toggle_sfx_mute()
     
     def load_music(self, music_file):
-        """Carrega uma nova música"""
-        try:
-            if self.current_music != music_file:
-                pygame.mixer.music.load(music_file)
-                self.current_music = music_file
-                print(f"🎵 Música carregada: {music_file}")
-            return True
-        except Exception as e:
-            print(f"❌ Erro ao carregar música {music_file}: {e}")
-            return False
+        """Começa a carregar uma música em segundo plano (nome ou caminho)"""
+        self.music.prefetch(self.music_paths.get(music_file, music_file))
+        return True
+    
+    def prefetch_music(self, music_file):
+        """Adianta a decodificação da próxima música (ex.: da próxima fase)"""
+        if music_file:
+            self.load_music(music_file)
     
     def play_music(self, music_file=None, loops=-1):
-        """Reproduz música (loops=-1 para loop infinito)"""
-        try:
-            if music_file and self.load_music(music_file):
-                pass  # Música já carregada
-            
-            pygame.mixer.music.play(loops)
-            self._apply_music_volume()  # Garante que o volume está correto
-            print(f"▶️ Reproduzindo música (volume: {int(self.music_volume * 100)}%)")
-            return True
-        except Exception as e:
-            print(f"❌ Erro ao reproduzir música: {e}")
+        """Troca para a música com crossfade (loops=-1 para loop infinito).
+        
+        Não bloqueia: se a faixa ainda não foi decodificada a atual continua
+        até ela ficar pronta (ver update()).
+        """
+        music_file = self.music_paths.get(music_file, music_file) or self.current_music
+        if not music_file:
             return False
+        self._apply_music_volume()  # Garante que o volume está correto
+        return self.music.play(music_file, loops)
+    
+    @property
+    def current_music(self):
+        """Última música pedida (pode ainda estar sendo decodificada)"""
+        return self.music.current
     
-    def stop_music(self):
+    def reserve_music_channels(self):
+        """Reserva os canais da música logo após iniciar o mixer, antes de qualquer Sound.play()"""
+        self.music._ensure_decks()
+    
+    def stop_music(self, fadeout_ms=0):
         """Para a música"""
-        pygame.mixer.music.stop()
+        self.music.stop(fadeout_ms)
         print("⏹️ Música parada")
     
     def is_playing(self):
         """Verifica se a música está tocando"""
-        return pygame.mixer.music.get_busy()
+        return self.music.is_playing()
+    
+    def update(self):
+        """Chamado uma vez por frame: música (troca e crossfade) e sons posicionais"""
+        self.music.update()
+        self.flush_spatial()
     
     # Novos métodos para efeitos sonoros
+    def preload_sounds(self, on_progress=None):
+        """Começa a decodificar todos os efeitos em segundo plano (AssetJob)"""
+        return asset_pipeline.preload(['sfx'], on_progress)
+    
     def load_sound(self, sound_file):
-        """Carrega um efeito sonoro no cache"""
-        if sound_file not in self.loaded_sounds:
-            try:
-                self.loaded_sounds[sound_file] = pygame.mixer.Sound(sound_file)
-                print(f"🔊 Som carregado: {sound_file}")
-            except Exception as e:
-                print(f"❌ Erro ao carregar som {sound_file}: {e}")
-                return None
-        return self.loaded_sounds[sound_file]
-    
-    def play_sound(self, sound_file, category='environment', loops=0):
-        """Reproduz um efeito sonoro com controle de volume"""
+        """Som do banco (carrega na hora se não foi pré-carregado)"""
+        sound = self.loaded_sounds.get(sound_file)
+        if sound is not None or sound_file in self.failed_sounds:
+            return sound
+        try:
+            sound = asset_pipeline.sound(sound_file)
+        except (pygame.error, FileNotFoundError) as e:
+            self.failed_sounds.add(sound_file)
+            print(f"❌ Erro ao carregar som {sound_file}: {e}")
+            return None
+        print(f"🔊 Som carregado: {sound_file}")
+        return sound
+    
+    def sound_memory_usage(self):
+        """Bytes de PCM decodificado por som do banco (caminho -> bytes)"""
+        mixer_format = pygame.mixer.get_init()
+        if mixer_format is None:
+            return {}
+        frequency, sample_format, channels = mixer_format
+        bytes_per_frame = abs(sample_format) // 8 * channels
+        return {path: int(round(sound.get_length() * frequency)) * bytes_per_frame
+                for path, sound in self.loaded_sounds.items()}
+    
+    def play_sound(self, sound_file, category='environment', loops=0, priority=None):
+        """Reproduz um efeito sonoro numa voz do pool, com o volume da categoria.
+        
+        Retorna o canal usado, ou None se o som foi descartado (mudo, mesmo som
+        repetido rápido demais, ou sem voz livre de prioridade menor para roubar).
+        """
         if self.sfx_muted:
             return None
         
         # Permitir uso por nome ou caminho completo
-        if sound_file in self.sound_paths:
-            sound_file = self.sound_paths[sound_file]
+        sound_file = self.sound_paths.get(sound_file, sound_file)
             
         sound = self.load_sound(sound_file)
         if sound:
+            if priority is None:
+                priority = SOUND_CATEGORIES.get(category, SOUND_CATEGORIES[DEFAULT_CATEGORY])['priority']
+            volume = self.category_volumes.get(category, self.sfx_volume)
             try:
-                # Definir volume do som baseado no volume de efeitos
-                sound.set_volume(self.sfx_volume)
-                
-                # Usar canal dedicado se especificado
-                if category in self.channels:
-                    channel = pygame.mixer.Channel(self.channels[category])
-                    return channel.play(sound, loops=loops)
-                else:
-                    return sound.play(loops=loops)
-            except Exception as e:
+                return self.voices.play(sound, sound_file, category, priority, volume, loops)
+            except pygame.error as e:
                 print(f"❌ Erro ao reproduzir som {sound_file}: {e}")
         return None
     
+    def set_listener(self, position):
+        """Posição do ouvinte no mundo (o jogador), atualizada a cada tick"""
+        self.listener = (position[0], position[1])
+    
+    def play_at(self, sound_file, position, category='combat', priority=None):
+        """Pede um som posicional em `position` (coordenadas do mundo).
+        
+        Sons fora do alcance são descartados aqui, sem tocar no mixer. Os
+        pedidos são tocados juntos no próximo update(); pedidos repetidos do
+        mesmo arquivo no mesmo frame viram um só. Retorna False se descartado.
+        """
+        if self.sfx_muted:
+            return False
+        sound_file = self.sound_paths.get(sound_file, sound_file)
+        gains = (1.0, 1.0) if self.listener is None else spatial_gains(self.listener, position)
+        if gains is None:
+            self.spatial_culled += 1
+            return False
+        queued = self.pending_spatial.get(sound_file)
+        if queued is None or max(gains) > max(queued[3]):
+            self.pending_spatial[sound_file] = (category, priority, position, gains)
+        return True
+    
+    def flush_spatial(self):
+        """Toca os sons posicionais do frame e atualiza o pan das vozes tocando"""
+        if self.listener is not None and self.listener != self.mixed_listener:
+            self.voices.update_positions(self.listener)
+            self.mixed_listener = self.listener
+        if not self.pending_spatial:
+            return
+        for sound_file, (category, priority, position, gains) in self.pending_spatial.items():
+            sound = self.load_sound(sound_file)
+            if sound is None:
+                continue
+            if priority is None:
+                priority = SOUND_CATEGORIES.get(category, SOUND_CATEGORIES[DEFAULT_CATEGORY])['priority']
+            volume = self.category_volumes.get(category, self.sfx_volume)
+            try:
+                self.voices.play(sound, sound_file, category, priority, volume,
+                                 position=position, gains=gains)
+            except pygame.error as e:
+                print(f"❌ Erro ao reproduzir som {sound_file}: {e}")
+        self.pending_spatial.clear()
+    
     def play_sound_by_name(self, sound_name, category='environment', loops=0):
         """Reproduz um som por nome (método conveniente)"""
         return self.play_sound(sound_name, category, loops)
     
     def stop_all_sounds(self):
-        """Para todos os efeitos sonoros"""
-        pygame.mixer.stop()
+        """Para todos os efeitos sonoros (a música, nos canais 0 e 1, continua)"""
+        self.voices.stop()
         print("⏹️ Todos os efeitos sonoros parados")
     
     def stop_sound_category(self, category):
         """Para sons de uma categoria específica"""
-        if category in self.channels:
-            channel = pygame.mixer.Channel(self.channels[category])
-            channel.stop()
+        if category in SOUND_CATEGORIES:
+            self.voices.stop(category)
             print(f"⏹️ Sons de {category} parados")
     
     # Métodos de informação atualizados
@@ -0,0 +1,7 @@
+"""
+Benchmarks reproduzíveis das fases (rodam sem janela).
+
+A partir de code/:
+    python -m bench.run_bench                      # todos os cenários
+    python -m bench.run_bench level3_stress --out resultados.json
+"""
@@ -0,0 +1,141 @@
+"""
+Porteiro de regressões de desempenho.
+
+Roda os cenários de benchmark algumas vezes, compara com os baselines salvos
+em bench/baselines/<cenário>.json e termina com código 1 se alguma métrica
+piorou além da tolerância. Uso (a partir de code/):
+
+    python -m bench.compare --update      # na main: grava os baselines
+    python -m bench.compare               # no branch: compara e mostra a tabela
+
+A tolerância de cada métrica é a maior entre uma margem fixa (relativa +
+absoluta) e três desvios robustos (MAD) das repetições do baseline, então
+máquinas ruidosas não geram falsos alarmes e máquinas estáveis pegam
+regressões pequenas.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from bench.run_bench import run_in_subprocess
+from bench.scenarios import SCENARIOS
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+DEFAULT_SCENARIOS = [name for name in SCENARIOS if name.endswith('_baseline')]
+DEFAULT_TICKS = 600
+DEFAULT_REPEATS = 3
+
+# métrica -> (rótulo, unidade, função que extrai do resultado, tolerância relativa, absoluta)
+METRICS = {
+    'frame_median': ('frame mediana', 'ms', lambda r: r['frame_ms']['median'], 0.10, 0.2),
+    'frame_p95':    ('frame p95', 'ms', lambda r: r['frame_ms']['p95'], 0.15, 0.5),
+    'level_load':   ('carregamento', 's', lambda r: r['level_load_s'], 0.15, 0.05),
+    'startup':      ('inicialização', 's', lambda r: r['startup_s'], 0.20, 0.05),
+    'peak_memory':  ('pico de memória', 'MB', lambda r: (r['peak_rss_kb'] or 0) / 1024, 0.10, 5.0),
+}
+
+
+def collect(name, ticks, repeats):
+    """Amostras de cada métrica em `repeats` execuções de um cenário"""
+    samples = {metric: [] for metric in METRICS}
+    for _ in range(repeats):
+        result = run_in_subprocess(name, ticks)
+        for metric, (_, _, extract, _, _) in METRICS.items():
+            samples[metric].append(round(extract(result), 4))
+    return samples
+
+
+def baseline_path(name):
+    return os.path.join(BASELINE_DIR, f'{name}.json')
+
+
+def save_baseline(name, ticks, samples):
+    os.makedirs(BASELINE_DIR, exist_ok=True)
+    with open(baseline_path(name), 'w', encoding='utf-8') as file:
+        json.dump({'scenario': name, 'ticks': ticks, 'samples': samples}, file, indent=2)
+
+
+def load_baseline(name):
+    path = baseline_path(name)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def tolerance(values, relative, absolute):
+    """Folga aceitável acima da mediana do baseline"""
+    median = statistics.median(values)
+    spread = statistics.median(abs(value - median) for value in values) * 1.4826
+    return max(median * relative + absolute, 3 * spread)
+
+
+def compare(name, baseline, samples):
+    """Linhas da tabela para um cenário: (métrica, base, novo, delta %, limite, status)"""
+    rows = []
+    for metric, (label, unit, _, relative, absolute) in METRICS.items():
+        old_values = baseline['samples'].get(metric)
+        if not old_values:
+            continue
+        old = statistics.median(old_values)
+        new = statistics.median(samples[metric])
+        limit = old + tolerance(old_values, relative, absolute)
+        delta = (new - old) / old * 100 if old else 0.0
+        status = 'REGRESSÃO' if new > limit else ('melhorou' if new < old - (limit - old) else 'ok')
+        rows.append((f'{label} ({unit})', old, new, delta, limit, status))
+    return rows
+
+
+def print_table(name, rows):
+    print(f'\n{name}')
+    print(f"  {'métrica':<24}{'base':>10}{'novo':>10}{'Δ%':>9}{'limite':>10}  status")
+    for label, old, new, delta, limit, status in rows:
+        print(f'  {label:<24}{old:>10.3f}{new:>10.3f}{delta:>+8.1f}%{limit:>10.3f}  {status}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compara benchmarks com os baselines salvos')
+    parser.add_argument('scenarios', nargs='*', help=f"padrão: {', '.join(DEFAULT_SCENARIOS)}")
+    parser.add_argument('--update', action='store_true', help='grava os resultados como novos baselines')
+    parser.add_argument('--ticks', type=int, default=DEFAULT_TICKS)
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or DEFAULT_SCENARIOS
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(unknown)}")
+
+    regressions = []
+    for name in names:
+        print(f'⏱️ {name} ({args.repeats}x {args.ticks} ticks)...', file=sys.stderr)
+        samples = collect(name, args.ticks, args.repeats)
+        baseline = load_baseline(name)
+
+        if args.update or baseline is None:
+            save_baseline(name, args.ticks, samples)
+            print(f'💾 Baseline de {name} gravado em {baseline_path(name)}')
+            continue
+        if baseline['ticks'] != args.ticks:
+            print(f"⚠️ Baseline de {name} foi gravado com {baseline['ticks']} ticks; "
+                  f"rode com --ticks {baseline['ticks']} ou --update")
+            regressions.append(name)
+            continue
+
+        rows = compare(name, baseline, samples)
+        print_table(name, rows)
+        regressions += [f'{name}: {row[0]}' for row in rows if row[5] == 'REGRESSÃO']
+
+    if regressions:
+        print(f'\n❌ {len(regressions)} regressão(ões):')
+        for regression in regressions:
+            print(f'  - {regression}')
+        return 1
+    print('\n✅ Sem regressões')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+"""Sequências de input roteirizadas usadas pelos cenários de benchmark"""
+import pygame
+
+# Quadrado: direita, baixo, esquerda, cima - 120 ticks em cada direção
+_PATROL = (pygame.K_RIGHT, pygame.K_DOWN, pygame.K_LEFT, pygame.K_UP)
+
+
+def idle(tick):
+    return ()
+
+
+def patrol(tick):
+    """Anda em quadrado atacando a cada 45 ticks"""
+    keys = {_PATROL[(tick // 120) % 4]}
+    if tick % 45 == 0:
+        keys.add(pygame.K_SPACE)
+    return keys
+
+
+def combat(tick):
+    """Patrulha correndo, com ataques frequentes e magia a cada 90 ticks"""
+    keys = {_PATROL[(tick // 120) % 4], pygame.K_LSHIFT}
+    if tick % 20 == 0:
+        keys.add(pygame.K_SPACE)
+    if tick % 90 == 45:
+        keys.add(pygame.K_LCTRL)
+    return keys
+
+
+INPUT_SCRIPTS = {
+    'idle': idle,
+    'patrol': patrol,
+    'combat': combat,
+}
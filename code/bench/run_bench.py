@@ -0,0 +1,190 @@
+"""
+Executa os cenários de benchmark e gera um relatório JSON.
+
+Cada cenário roda num processo separado para que o pico de memória (RSS) de
+um não contamine o outro. Por cenário o relatório traz: tempo de inicialização
+e de carregamento da fase, ticks por segundo, mediana/p95/p99 do tempo de frame,
+média/p95/p99 por subsistema (frame_profiler), blocos de memória alocados,
+coletas do GC e pico de RSS.
+"""
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench.scenarios import SCENARIOS, get_scenario
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_kb():
+    """Pico de memória residente do processo em KB (None se indisponível)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak  # macOS reporta bytes
+
+
+def percentile(ordered, fraction):
+    """Percentil (vizinho mais próximo) de uma lista já ordenada"""
+    if not ordered:
+        return 0.0
+    return ordered[round((len(ordered) - 1) * fraction)]
+
+
+def _timings(report):
+    return {name: {'avg_ms': round(avg, 4), 'p95_ms': round(p95, 4), 'p99_ms': round(p99, 4)}
+            for name, (avg, p95, p99) in report.items()}
+
+
+def run_scenario(scenario):
+    """Roda um cenário neste processo e retorna o resultado como dict"""
+    import random
+    from importlib import import_module
+    from headless import LEVELS, init_headless
+
+    # Inicialização: pygame + imports do jogo até a fase poder ser criada
+    start = time.perf_counter()
+    init_headless()
+    import_module(LEVELS[scenario['level']][0])
+    startup_seconds = time.perf_counter() - start
+
+    import pygame
+    from input_source import ScriptedInput
+    from cheat_system import cheat_system
+    from frame_profiler import frame_profiler
+    from headless import HeadlessRunner
+    from bench.inputs import INPUT_SCRIPTS
+    from bench.stress import multiply_enemies, multiply_orbs, ParticleStorm
+
+    # O jogador não pode morrer no meio da medição
+    cheat_system.god_mode = True
+    cheat_system.max_energy_cheat = True
+
+    if scenario.get('replay'):
+        from replay import Recording, ReplayInput
+        recording = Recording.load(scenario['replay'])
+        source = ReplayInput(recording)
+        scenario = dict(scenario, level=recording.level_number, seed=recording.seed,
+                        ticks=min(scenario['ticks'], recording.ticks))
+    else:
+        source = ScriptedInput(INPUT_SCRIPTS[scenario['input']])
+
+    start = time.perf_counter()
+    runner = HeadlessRunner(scenario['level'], source)
+    load_seconds = time.perf_counter() - start
+
+    level = runner.level
+    enemies = multiply_enemies(level, scenario['enemies'])
+    orbs = multiply_orbs(level, scenario['orbs'])
+    storm = ParticleStorm(level, scenario['particles'])
+    random.seed(scenario['seed'])
+
+    frame_profiler.history = scenario['ticks']  # guarda todos os ticks da medição
+    frame_profiler.reset()
+    frame_profiler.enabled = True
+    gc.collect()
+    gc_before = [stats['collections'] for stats in gc.get_stats()]
+    blocks_before = sys.getallocatedblocks()
+
+    start = time.perf_counter()
+    for _ in range(scenario['ticks']):
+        frame_profiler.begin_frame()
+        storm.update()
+        level.update()
+        if scenario['render']:
+            level.draw()
+            with frame_profiler.scope('display flip'):
+                pygame.display.update()
+        frame_profiler.end_frame()
+    elapsed = time.perf_counter() - start
+
+    gc_after = [stats['collections'] for stats in gc.get_stats()]
+    frame_profiler.enabled = False
+    frame_times = sorted(frame_profiler.frame_times)
+
+    return {
+        'scenario': scenario,
+        'startup_s': round(startup_seconds, 4),
+        'level_load_s': round(load_seconds, 4),
+        'ticks': scenario['ticks'],
+        'elapsed_s': round(elapsed, 4),
+        'ticks_per_second': round(scenario['ticks'] / elapsed, 2) if elapsed else None,
+        'sprites': {'enemies': enemies, 'orbs': orbs, 'visible': len(level.visible_sprites)},
+        'frame_ms': {'median': round(percentile(frame_times, 0.50), 4),
+                     'p95': round(percentile(frame_times, 0.95), 4),
+                     'p99': round(percentile(frame_times, 0.99), 4)},
+        'timings': _timings(frame_profiler.report()),
+        'allocations': {
+            'allocated_blocks_delta': sys.getallocatedblocks() - blocks_before,
+            'gc_collections': [after - before for before, after in zip(gc_before, gc_after)],
+        },
+        'peak_rss_kb': peak_rss_kb(),
+    }
+
+
+def run_in_subprocess(name, ticks=None, replay=None):
+    """Roda um cenário num processo novo (a partir de code/) e lê o resultado"""
+    code_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as tmp:
+        result_path = os.path.join(tmp, 'result.json')
+        command = [sys.executable, '-m', 'bench.run_bench', '--worker', name, '--result', result_path]
+        if ticks is not None:
+            command += ['--ticks', str(ticks)]
+        if replay:
+            command += ['--replay', replay]
+        completed = subprocess.run(command, cwd=code_dir, stdout=subprocess.DEVNULL,
+                                   stderr=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"cenário {name} falhou:\n{completed.stderr}")
+        with open(result_path, encoding='utf-8') as file:
+            return json.load(file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks headless das fases')
+    parser.add_argument('scenarios', nargs='*', help=f"padrão: todos ({', '.join(SCENARIOS)})")
+    parser.add_argument('--ticks', type=int, help='sobrescreve a duração dos cenários')
+    parser.add_argument('--replay', help='usa um replay gravado como input')
+    parser.add_argument('--out', help='arquivo JSON de saída (padrão: stdout)')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        scenario = get_scenario(args.worker, args.ticks)
+        if args.replay:
+            scenario['replay'] = args.replay
+        result = run_scenario(scenario)
+        with open(args.result, 'w', encoding='utf-8') as file:
+            json.dump(result, file)
+        return 0
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"cenários desconhecidos: {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        print(f"⏱️ {name}...", file=sys.stderr)
+        results[name] = run_in_subprocess(name, args.ticks, args.replay)
+
+    report = json.dumps({'python': sys.version.split()[0], 'results': results}, indent=2)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as file:
+            file.write(report)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
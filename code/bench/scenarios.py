@@ -0,0 +1,29 @@
+"""Cenários de benchmark: fase, duração, input e multiplicadores de carga.
+
+enemies/orbs multiplicam os inimigos e orbs do mapa (1 = mapa original);
+particles é o número de partículas criadas ao redor do jogador a cada 30 ticks.
+`replay` (opcional) usa um arquivo gravado com replay.py no lugar de `input`.
+"""
+
+DEFAULT_TICKS = 1200
+
+SCENARIOS = {
+    'level1_baseline': {'level': 1, 'input': 'patrol'},
+    'level1_stress':   {'level': 1, 'input': 'combat', 'enemies': 4, 'orbs': 4, 'particles': 40},
+    'level2_baseline': {'level': 2, 'input': 'patrol'},
+    'level2_stress':   {'level': 2, 'input': 'combat', 'enemies': 2, 'orbs': 4, 'particles': 40},
+    'level3_baseline': {'level': 3, 'input': 'patrol'},
+    'level3_stress':   {'level': 3, 'input': 'combat', 'enemies': 4, 'orbs': 4, 'particles': 40},
+    'level4_baseline': {'level': 4, 'input': 'patrol'},
+    'level4_stress':   {'level': 4, 'input': 'combat', 'enemies': 4, 'orbs': 4, 'particles': 40},
+}
+
+
+def get_scenario(name, ticks=None):
+    """Cenário com os valores padrão preenchidos"""
+    scenario = {'name': name, 'ticks': DEFAULT_TICKS, 'input': 'idle',
+                'enemies': 1, 'orbs': 1, 'particles': 0, 'render': True, 'seed': 1}
+    scenario.update(SCENARIOS[name])
+    if ticks is not None:
+        scenario['ticks'] = ticks
+    return scenario
@@ -0,0 +1,62 @@
+"""Aumenta a carga de uma fase já carregada (mais inimigos, orbs e partículas)"""
+from collectables import HealthOrbs, AttackOrbs, SpeedOrbs
+from enemy import Enemy
+from particles import CollectParticle
+
+# Deslocamento de cada cópia em relação ao original, para não ficarem empilhadas
+_OFFSETS = [(0, 0), (24, 0), (0, 24), (-24, 0), (0, -24), (24, 24), (-24, -24), (24, -24), (-24, 24)]
+
+_ORB_GROUPS = (('health_orbs', HealthOrbs, 'health'),
+               ('attack_orbs', AttackOrbs, 'attack'),
+               ('speed_orbs', SpeedOrbs, 'speed'))
+
+
+def _offset(index):
+    dx, dy = _OFFSETS[index % len(_OFFSETS)]
+    ring = index // len(_OFFSETS) + 1
+    return dx * ring, dy * ring
+
+
+def multiply_enemies(level, factor):
+    """Cria factor-1 cópias de cada inimigo do mapa"""
+    originals = [sprite for sprite in level.attackable_sprites
+                 if getattr(sprite, 'sprite_type', None) == 'enemy']
+    for enemy in originals:
+        for copy in range(1, factor):
+            dx, dy = _offset(copy)
+            Enemy(enemy.monster_name, (enemy.rect.x + dx, enemy.rect.y + dy),
+                  [level.visible_sprites, level.attackable_sprites],
+                  level.obstacle_sprites, level.damage_player, enemy.monster_level,
+                  visible_sprites=level.visible_sprites)
+    return len(originals) * factor
+
+
+def multiply_orbs(level, factor):
+    """Cria factor-1 cópias de cada orb e registra todas nas coletas da fase"""
+    total = 0
+    for group_name, orb_class, kind in _ORB_GROUPS:
+        group = getattr(level, group_name)
+        for orb in list(group):
+            for copy in range(1, factor):
+                dx, dy = _offset(copy)
+                orb_class((orb.rect.x + dx, orb.rect.y + dy), [group, level.visible_sprites])
+        level.pickups.register(group, kind)
+        total += len(group)
+    return total
+
+
+class ParticleStorm:
+    """Solta `count` partículas ao redor do jogador a cada `interval` ticks"""
+
+    def __init__(self, level, count, interval=30):
+        self.level = level
+        self.count = count
+        self.interval = interval
+        self.tick = 0
+
+    def update(self):
+        if self.count and self.tick % self.interval == 0:
+            center = self.level.player.rect.center
+            for _ in range(self.count):
+                CollectParticle(center, [self.level.visible_sprites], color=(255, 200, 100))
+        self.tick += 1
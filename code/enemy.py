@@ -7,6 +7,8 @@ from particles import DeathParticle, EnemyDeathAnimation
 from player_stats import player_stats
 from difficulty_manager import difficulty_manager
 from audio_manager import audio_manager
+from timer_scheduler import timer_scheduler
+from utils.logger import game_logger
 
 
 class Enemy(Entity):
@@ -59,18 +61,22 @@ class Enemy(Entity):
         self.attack_radius = monster_info['attack_radius']
         self.notice_radius = monster_info['notice_radius']
         self.attack_type = monster_info['attack_type']
+        self.attack_sound = monster_info['attack_sound']
+        self.death_sound = monster_info.get('death_sound')
 
         # player interaction
         self.can_attack = True
         self.attack_time = None
         self.attack_cooldown = 400
         self.damage_player = damage_player
-        # Audio now handled by AudioManager - removed monsta sound
+        # Audio now handled by AudioManager (positional, see play_at)
+        self.attack_sound_time = None
 
         # invincibility timer
         self.vulnerable = True
         self.hit_time = 200
         self.invincibility_duration = 300
+        self.invincibility_timer = None
         
         # Health bar properties
         self.health_bar_width = 60
@@ -84,10 +90,13 @@ class Enemy(Entity):
         self.fire_effect_duration = 3000  # 3 seconds
         self.fire_damage_interval = 500   # Damage every 0.5 seconds
         self.last_fire_damage = 0
+        self.fire_tick_timer = None
+        self.fire_end_timer = None
         
         self.water_effect = False
         self.water_effect_time = 0  
         self.water_effect_duration = 2000  # 2 seconds
+        self.water_end_timer = None
         self.original_speed = self.speed
 
     def import_graphics(self, name):
@@ -158,8 +167,12 @@ class Enemy(Entity):
 
     def actions(self, player):
         if 'attack' in self.status:
-            self.attack_time = pygame.time.get_ticks()
+            self.attack_time = timer_scheduler.now
             self.damage_player(self.attack_damage, self.attack_type)
+            # Attack status lasts many ticks: one swing sound per cooldown
+            if self.attack_sound_time is None or self.attack_time - self.attack_sound_time >= self.attack_cooldown:
+                self.attack_sound_time = self.attack_time
+                audio_manager.play_at(self.attack_sound, self.rect.center, 'combat')
         elif 'idle' not in self.status and self.movestatus:
             self.get_status(player)
             self.direction = self.get_player_distance_direction(player)[1]
@@ -188,24 +201,13 @@ class Enemy(Entity):
 
         if not self.vulnerable:
             alpha = self.wave_value()
+            # Frames são compartilhados entre inimigos (cache de assets)
+            if self.image is animation[int(self.frame_index)]:
+                self.image = self.image.copy()
             self.image.set_alpha(alpha)
         else:
             self.image.set_alpha(255)
 
-    def cooldowns(self):
-        current_time = pygame.time.get_ticks()
-        if not self.can_attack:
-            if current_time - self.attack_time >= self.attack_cooldown:
-                self.can_attack = True
-            else:
-                self.vulnerable = False
-
-        if not self.vulnerable:
-            if current_time - self.hit_time >= self.invincibility_duration:
-                self.vulnerable = True
-            else:
-                self.vulnerable = False
-
     def get_damage(self, player, attack_type):
         if self.vulnerable:
             self.direction = self.get_player_distance_direction(player)[1]
@@ -217,8 +219,10 @@ class Enemy(Entity):
             else:
                 pass
             # magic damage
-            self.hit_time = pygame.time.get_ticks()
+            self.hit_time = timer_scheduler.now
             self.vulnerable = False
+            timer_scheduler.cancel(self.invincibility_timer)
+            self.invincibility_timer = timer_scheduler.schedule(self.invincibility_duration, setattr, self, 'vulnerable', True)
 
     def draw_health_bar(self, surface):
         """Draw health bar above the monster"""
@@ -255,6 +259,9 @@ class Enemy(Entity):
         if self.health <= 0:
             # STATS: Record enemy kill
             player_stats.record_enemy_kill(self.monster_name)
+            self.cancel_timers()
+            if self.death_sound:
+                audio_manager.play_at(self.death_sound, self.rect.center, 'combat', priority=4)
             
             # Create death animation if visible_sprites is available
             if self.visible_sprites:
@@ -275,7 +282,6 @@ class Enemy(Entity):
     def update(self):
         self.hit_reaction()
         self.move(self.speed)
-        self.cooldowns()
         self.check_death()
         if self.movestatus:
             self.animate()
@@ -284,64 +290,75 @@ class Enemy(Entity):
         self.actions(player)
         self.move(self.speed)
         self.animate()
-        self.cooldowns()
         self.update_magic_effects()  # Update magic effects
         self.check_death()
     
     
     def apply_fire_effect(self, damage):
         """Apply fire effect to enemy"""
-        print(f"🔥 {self.monster_name} pegou fogo!")
+        game_logger.debug("🔥 %s pegou fogo!", self.monster_name)
         self.fire_effect = True
-        self.fire_effect_time = pygame.time.get_ticks()
+        self.fire_effect_time = timer_scheduler.now
         self.fire_damage = damage // 3  # Fire does damage over time
-        self.last_fire_damage = pygame.time.get_ticks()
+        self.last_fire_damage = timer_scheduler.now
+        
+        # Restart the burn: one timer per damage tick plus one for the end
+        timer_scheduler.cancel(self.fire_tick_timer)
+        timer_scheduler.cancel(self.fire_end_timer)
+        self.fire_tick_timer = timer_scheduler.schedule(self.fire_damage_interval, self.fire_tick)
+        self.fire_end_timer = timer_scheduler.schedule(self.fire_effect_duration, self.end_fire_effect)
     
     def apply_water_effect(self, slow_amount=0.5):
         """Apply water/ice effect to enemy (slows down)"""
-        print(f"❄️ {self.monster_name} foi congelado!")
+        game_logger.debug("❄️ %s foi congelado!", self.monster_name)
         self.water_effect = True
-        self.water_effect_time = pygame.time.get_ticks()
+        self.water_effect_time = timer_scheduler.now
         self.speed = self.original_speed * slow_amount  # Slow down
+        timer_scheduler.cancel(self.water_end_timer)
+        self.water_end_timer = timer_scheduler.schedule(self.water_effect_duration, self.end_water_effect)
     
-    def update_magic_effects(self):
-        """Update ongoing magic effects"""
-        current_time = pygame.time.get_ticks()
-        
-        # Fire effect - continuous damage
-        if self.fire_effect:
-            if current_time - self.fire_effect_time > self.fire_effect_duration:
-                self.fire_effect = False
-                print(f"🔥 {self.monster_name} parou de queimar")
-            else:
-                # Apply fire damage periodically
-                if current_time - self.last_fire_damage > self.fire_damage_interval:
-                    self.health -= self.fire_damage
-                    self.last_fire_damage = current_time
-                    print(f"🔥 {self.monster_name} queimando! Vida: {self.health}")
-                    
-                    # Create fire particles
-                    if self.visible_sprites:
-                        from particles import FireParticle
-                        try:
-                            FireParticle(self.rect.center, [self.visible_sprites])
-                        except:
-                            pass
+    def fire_tick(self):
+        """Apply one tick of fire damage (scheduled every fire_damage_interval)"""
+        if not self.alive():
+            return
+        self.health -= self.fire_damage
+        self.last_fire_damage = timer_scheduler.now
+        game_logger.debug("🔥 %s queimando! Vida: %s", self.monster_name, self.health)
+        audio_manager.play_at('fireball', self.rect.center, 'environment')
         
-        # Water/ice effect - slow movement
-        if self.water_effect:
-            if current_time - self.water_effect_time > self.water_effect_duration:
-                self.water_effect = False
-                self.speed = self.original_speed  # Restore original speed
-                print(f"❄️ {self.monster_name} saiu do gelo")
-            else:
-                # Create ice particles
-                if self.visible_sprites:
-                    from particles import IceParticle
-                    try:
-                        IceParticle(self.rect.center, [self.visible_sprites])
-                    except:
-                        pass
+        # Create fire particles
+        if self.visible_sprites:
+            from particles import FireParticle
+            try:
+                FireParticle(self.rect.center, [self.visible_sprites])
+            except:
+                pass
+        self.fire_tick_timer = timer_scheduler.schedule(self.fire_damage_interval, self.fire_tick)
+    
+    def end_fire_effect(self):
+        self.fire_effect = False
+        timer_scheduler.cancel(self.fire_tick_timer)
+        game_logger.debug("🔥 %s parou de queimar", self.monster_name)
+    
+    def end_water_effect(self):
+        self.water_effect = False
+        self.speed = self.original_speed  # Restore original speed
+        game_logger.debug("❄️ %s saiu do gelo", self.monster_name)
+    
+    def cancel_timers(self):
+        """Drop pending timers so a dead enemy never fires callbacks"""
+        for timer in (self.invincibility_timer, self.fire_tick_timer, self.fire_end_timer, self.water_end_timer):
+            timer_scheduler.cancel(timer)
+    
+    def update_magic_effects(self):
+        """Update ongoing magic effects (expiry and fire damage are timers)"""
+        # Water/ice effect - ice particles while slowed
+        if self.water_effect and self.visible_sprites:
+            from particles import IceParticle
+            try:
+                IceParticle(self.rect.center, [self.visible_sprites])
+            except:
+                pass
     
     def draw_magic_effects(self, surface, offset):
         """Draw visual indicators for magic effects"""
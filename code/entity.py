@@ -1,5 +1,6 @@
 import pygame
 from math import sin
+from timer_scheduler import timer_scheduler
 
 class Entity(pygame.sprite.Sprite):
 	def __init__(self,groups):
@@ -7,6 +8,7 @@ class Entity(pygame.sprite.Sprite):
 		self.frame_index = 0
 		self.animation_speed = 0.15
 		self.direction = pygame.math.Vector2()
+		self.spatial_index = None  # SpatialHash que acompanha este sprite (ver SpatialHash.track)
 
 	def move(self,speed):
 		if self.direction.magnitude() != 0:
@@ -17,6 +19,14 @@ class Entity(pygame.sprite.Sprite):
 		self.hitbox.y += self.direction.y * speed
 		self.collision('vertical')
 		self.rect.center = self.hitbox.center
+		if self.spatial_index is not None:
+			self.spatial_index.insert(self)  # só mexe na grade se mudou de célula
+
+	def kill(self):
+		if self.spatial_index is not None:
+			self.spatial_index.remove(self)
+			self.spatial_index = None
+		super().kill()
 
 	def collision(self,direction):
 		if direction == 'horizontal':
@@ -36,7 +46,7 @@ class Entity(pygame.sprite.Sprite):
 						self.hitbox.top = sprite.hitbox.bottom
 
 	def wave_value(self):
-		value = sin(pygame.time.get_ticks())
+		value = sin(timer_scheduler.now)  # relógio da simulação: piscar reproduzível em replays
 		if value >= 0: 
 			return 255
 		else: 
@@ -1,11 +1,37 @@
 import pygame
 import os
+import json
 from typing import Dict, Optional
 
+# Cache em disco da fonte do sistema resolvida (chave = lista de candidatas)
+FONT_CACHE_FILE = 'font_cache.json'
+
+# Fontes configuradas: tipo -> (origem, tamanho, negrito)
+# 'system' usa a melhor fonte do sistema; as demais são chaves de font_paths
+FONT_SPECS = {
+    'title': ('system', 32, True),
+    'subtitle': ('system', 20, True),
+    'button': ('system', 16, True),
+    'text': ('system', 14, False),
+    'small': ('system', 12, False),
+    'tiny': ('system', 10, False),
+    'ui': ('system', 16, True),
+    'menu': ('system', 18, True),
+    'stats': ('system', 14, False),
+    'input': ('system', 16, False),
+    'achievement': ('system', 12, True),
+    'pixel_title': ('pixel', 24, False),  # Mantém pixel para título se quiser
+    'pixel_small': ('pixel', 10, False)   # Pixel pequeno para detalhes
+}
+
 class FontManager:
-    """Gerenciador de fontes do jogo com fallback para fontes mais legíveis"""
+    """Gerenciador de fontes do jogo com fallback para fontes mais legíveis.
+
+    Nada é carregado na importação: a fonte do sistema é resolvida uma vez (e
+    guardada em FONT_CACHE_FILE) e cada fonte é criada no primeiro get().
+    """
     
-    def __init__(self):
+    def __init__(self, cache_file: str = FONT_CACHE_FILE):
         self.fonts = {}
         self.font_paths = {
             'pixel': '../graphics/font/PressStart2P.ttf',
@@ -25,76 +51,117 @@ class FontManager:
             'sans-serif'
         ]
         
+        self.cache_file = cache_file
+        self._system_font_paths = None  # {'regular': caminho, 'bold': caminho}
+        
+        # Objetos Font por (arquivo, tamanho, negrito) - compartilhados com
+        # enhanced_font_system e icon_manager
+        self._font_cache: Dict[tuple, pygame.font.Font] = {}
+        
         # Inicializar pygame fonts
         pygame.font.init()
-        
-        # Configurar fontes padrão
-        self.setup_default_fonts()
     
     def setup_default_fonts(self):
-        """Configura as fontes padrão do jogo"""
-        # Encontrar a melhor fonte do sistema
-        best_system_font = self.find_best_system_font()
-        
-        # Configurar diferentes tamanhos e estilos
-        self.fonts = {
-            'title': self.get_font(best_system_font, 32, bold=True),
-            'subtitle': self.get_font(best_system_font, 20, bold=True),
-            'button': self.get_font(best_system_font, 16, bold=True),
-            'text': self.get_font(best_system_font, 14),
-            'small': self.get_font(best_system_font, 12),
-            'tiny': self.get_font(best_system_font, 10),
-            'ui': self.get_font(best_system_font, 16, bold=True),
-            'menu': self.get_font(best_system_font, 18, bold=True),
-            'stats': self.get_font(best_system_font, 14),
-            'input': self.get_font(best_system_font, 16),
-            'achievement': self.get_font(best_system_font, 12, bold=True),
-            'pixel_title': self.get_font_from_file('pixel', 24),  # Mantém pixel para título se quiser
-            'pixel_small': self.get_font_from_file('pixel', 10)   # Pixel pequeno para detalhes
-        }
-        
-        print(f"✅ Fontes configuradas usando: {best_system_font}")
+        """Cria todas as fontes padrão de uma vez (normalmente é feito sob demanda)"""
+        for font_type in FONT_SPECS:
+            self.get(font_type)
     
-    def find_best_system_font(self) -> str:
-        """Encontra a melhor fonte do sistema disponível"""
-        available_fonts = pygame.font.get_fonts()
+    def _load_font_cache(self) -> dict:
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_font_cache(self, cache: dict):
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as file:
+                json.dump(cache, file, indent=2)
+        except OSError:
+            pass  # Sem cache em disco: resolve de novo na próxima execução
+    
+    def find_system_font_paths(self) -> Dict[str, Optional[str]]:
+        """Arquivos (normal e negrito) da melhor fonte do sistema disponível.
+
+        A varredura das fontes instaladas é cara, então o resultado fica no cache
+        em disco enquanto a lista de candidatas e os arquivos não mudarem.
+        """
+        if self._system_font_paths is not None:
+            return self._system_font_paths
         
-        for font_name in self.system_fonts:
-            # Normalizar nome da fonte
-            normalized_name = font_name.lower().replace(' ', '')
-            
-            # Procurar fonte similar
-            for available_font in available_fonts:
-                if normalized_name in available_font.lower():
-                    return available_font
+        key = ','.join(self.system_fonts)
+        cache = self._load_font_cache()
+        paths = cache.get(key)
+        if not paths or any(path and not os.path.exists(path) for path in paths.values()):
+            # None = nenhuma candidata instalada, usa a fonte padrão do pygame
+            paths = {
+                'regular': pygame.font.match_font(self.system_fonts),
+                'bold': pygame.font.match_font(self.system_fonts, bold=True)
+            }
+            cache[key] = paths
+            self._save_font_cache(cache)
+            print(f"✅ Fontes configuradas usando: {paths['regular'] or pygame.font.get_default_font()}")
         
-        # Se não encontrar nenhuma, usar a fonte padrão do sistema
-        return pygame.font.get_default_font()
+        self._system_font_paths = paths
+        return paths
+    
+    def font(self, path: Optional[str], size: int, bold: bool = False) -> pygame.font.Font:
+        """Fonte de um arquivo (None = fonte padrão do pygame), criada uma vez por tamanho"""
+        key = (path, size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            try:
+                font = pygame.font.Font(path, size)
+            except (OSError, pygame.error):
+                font = pygame.font.Font(None, size)
+            if bold:
+                font.set_bold(True)
+            self._font_cache[key] = font
+        return font
+    
+    def system_font(self, size: int, bold: bool = False) -> pygame.font.Font:
+        """Melhor fonte do sistema no tamanho pedido"""
+        paths = self.find_system_font_paths()
+        bold_path = paths['bold'] if bold else None
+        if bold_path and bold_path != paths['regular']:
+            # Arquivo com negrito de verdade, sem negrito sintético
+            return self.font(bold_path, size)
+        return self.font(paths['regular'], size, bold)
     
     def get_font(self, font_name: str, size: int, bold: bool = False) -> pygame.font.Font:
         """Cria uma fonte do sistema"""
-        try:
-            font = pygame.font.SysFont(font_name, size, bold=bold)
-            return font
-        except:
-            # Fallback para fonte padrão
-            return pygame.font.Font(None, size)
+        key = ('sys:' + font_name, size, bold)
+        font = self._font_cache.get(key)
+        if font is None:
+            try:
+                font = pygame.font.SysFont(font_name, size, bold=bold)
+            except:
+                # Fallback para fonte padrão
+                font = pygame.font.Font(None, size)
+            self._font_cache[key] = font
+        return font
     
     def get_font_from_file(self, font_key: str, size: int) -> pygame.font.Font:
         """Carrega fonte de arquivo"""
-        try:
-            if font_key in self.font_paths:
-                font_path = self.font_paths[font_key]
-                if os.path.exists(font_path):
-                    return pygame.font.Font(font_path, size)
+        font_path = self.font_paths.get(font_key)
+        if font_path is None or not os.path.exists(font_path):
             # Fallback para fonte padrão
-            return pygame.font.Font(None, size)
-        except:
-            return pygame.font.Font(None, size)
+            font_path = None
+        return self.font(font_path, size)
     
     def get(self, font_type: str) -> pygame.font.Font:
         """Retorna uma fonte configurada"""
-        return self.fonts.get(font_type, self.fonts['text'])
+        font = self.fonts.get(font_type)
+        if font is None:
+            if font_type not in FONT_SPECS:
+                return self.get('text')
+            source, size, bold = FONT_SPECS[font_type]
+            if source == 'system':
+                font = self.system_font(size, bold)
+            else:
+                font = self.get_font_from_file(source, size)
+            self.fonts[font_type] = font
+        return font
     
     def create_custom_font(self, font_name: str, size: int, bold: bool = False) -> pygame.font.Font:
         """Cria uma fonte personalizada"""
@@ -114,4 +181,4 @@ class FontManager:
             print(f"  ... e mais {len(fonts) - 20} fontes")
 
 # Instância singleton
-font_manager = FontManager()
\ No newline at end of file
+font_manager = FontManager()
@@ -0,0 +1,172 @@
+import os
+from collections import deque
+from time import perf_counter
+import pygame
+
+# Ordem fixa das linhas do overlay (escopos desconhecidos vão para o fim)
+PROFILER_SCOPES = ('input', 'enemy AI', 'sprite update', 'attack logic', 'pickups',
+                   'draw floor', 'draw sprites', 'HUD', 'audio controls', 'display flip')
+
+
+class _NullScope:
+    """Escopo vazio usado com o profiler desligado - custo de uma chamada"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Scope:
+    __slots__ = ('profiler', 'name', 'start', 'children')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = perf_counter()
+        self.children = 0.0
+        self.profiler._stack.append(self)
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = perf_counter() - self.start
+        stack = self.profiler._stack
+        stack.pop()
+        # Tempo exclusivo: escopos aninhados não contam duas vezes
+        current = self.profiler._current
+        current[self.name] = current.get(self.name, 0.0) + elapsed - self.children
+        if stack:
+            stack[-1].children += elapsed
+        return False
+
+
+class FrameProfiler:
+    """Tempo gasto por subsistema em cada frame, com médias móveis e percentis.
+
+    Uso: `with frame_profiler.scope('enemy AI'): ...`. Os tempos de um frame são
+    somados entre begin_frame() e end_frame() (vários ticks de simulação no mesmo
+    frame entram juntos). Desligado, scope() devolve um contexto vazio.
+    """
+
+    def __init__(self, history=240):
+        self.history = history
+        self.enabled = os.environ.get('GAME_PROFILE', '') not in ('', '0')
+        self.overlay = self.enabled
+        self.samples = {}                          # escopo -> deque de ms por frame
+        self.frame_times = deque(maxlen=history)   # ms do frame inteiro
+        self._current = {}
+        self._stack = []
+        self._frame_start = None
+        self._null_scope = _NullScope()
+        self._font = None
+        self._toggle_requested = False
+
+    def toggle(self):
+        """Liga/desliga coleta e overlay (F3 durante as fases) no próximo frame"""
+        self._toggle_requested = True
+
+    def reset(self):
+        """Descarta as amostras (e aplica uma nova `history`, se mudou)"""
+        self.samples.clear()
+        self.frame_times = deque(maxlen=self.history)
+        self._current.clear()
+        self._stack.clear()
+        self._frame_start = None
+
+    def scope(self, name):
+        if not self.enabled:
+            return self._null_scope
+        return _Scope(self, name)
+
+    def begin_frame(self):
+        if self._toggle_requested:
+            # Aplicado entre frames para não cortar um escopo aberto
+            self._toggle_requested = False
+            self.enabled = self.overlay = not self.enabled
+            self.reset()
+        if self.enabled:
+            self._frame_start = perf_counter()
+            self._current.clear()
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        self.frame_times.append((perf_counter() - self._frame_start) * 1000)
+        for name, seconds in self._current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.history)
+            self.samples[name].append(seconds * 1000)
+        # Escopos sem chamada neste frame entram como zero para a média ficar honesta
+        for name, values in self.samples.items():
+            if name not in self._current:
+                values.append(0.0)
+        self._frame_start = None
+
+    @staticmethod
+    def summarize(values):
+        """Média, p95 e p99 (ms) de uma janela de amostras"""
+        if not values:
+            return 0.0, 0.0, 0.0
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        return (sum(ordered) / len(ordered),
+                ordered[round(last * 0.95)],
+                ordered[round(last * 0.99)])
+
+    def report(self):
+        """Resumo por escopo: {'frame': (avg, p95, p99), 'input': ...}"""
+        result = {'frame': self.summarize(self.frame_times)}
+        for name in self._ordered_scopes():
+            result[name] = self.summarize(self.samples[name])
+        return result
+
+    def _ordered_scopes(self):
+        known = [name for name in PROFILER_SCOPES if name in self.samples]
+        return known + sorted(name for name in self.samples if name not in PROFILER_SCOPES)
+
+    def draw(self, surface):
+        """Tabela avg/p95/p99 e gráfico do tempo de frame no canto da tela"""
+        if not self.overlay or not self.frame_times:
+            return
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+
+        rows = [('frame', self.summarize(self.frame_times))]
+        rows += [(name, self.summarize(self.samples[name])) for name in self._ordered_scopes()]
+        line_height = 16
+        graph_height = 60
+        width = 300
+        height = 24 + line_height * len(rows) + graph_height + 10
+        x = surface.get_width() - width - 10
+        y = 10
+
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        header = self._font.render('ms            avg     p95     p99', True, (200, 200, 200))
+        panel.blit(header, (8, 6))
+        for index, (name, (avg, p95, p99)) in enumerate(rows):
+            color = (255, 230, 120) if name == 'frame' else (255, 255, 255)
+            text = f'{name:<14}{avg:6.2f}  {p95:6.2f}  {p99:6.2f}'
+            panel.blit(self._font.render(text, True, color), (8, 24 + index * line_height))
+
+        # Gráfico: cada coluna é um frame; linhas de referência em 60 e 30 FPS
+        graph_top = 24 + line_height * len(rows) + 4
+        graph_rect = pygame.Rect(8, graph_top, width - 16, graph_height)
+        pygame.draw.rect(panel, (40, 40, 40, 200), graph_rect)
+        scale = graph_height / 50.0  # 50 ms ocupam a altura inteira
+        for budget, color in ((1000 / 60, (80, 200, 80)), (1000 / 30, (200, 80, 80))):
+            line_y = graph_rect.bottom - budget * scale
+            pygame.draw.line(panel, color, (graph_rect.left, line_y), (graph_rect.right, line_y))
+        step = graph_rect.width / max(1, self.frame_times.maxlen - 1)
+        points = [(graph_rect.left + i * step, graph_rect.bottom - min(ms, 50.0) * scale)
+                  for i, ms in enumerate(self.frame_times)]
+        if len(points) > 1:
+            pygame.draw.lines(panel, (255, 230, 120), False, points)
+
+        surface.blit(panel, (x, y))
+
+
+# Instância global usada pelas fases e pelo loop principal
+frame_profiler = FrameProfiler()
@@ -0,0 +1,47 @@
+from settings import TICK_DURATION, MAX_TICKS_PER_FRAME, MAX_FRAME_TIME
+
+
+class FixedTimestep:
+    """Acumulador para simulação em passo fixo, desacoplada da taxa de renderização"""
+
+    def __init__(self, tick_duration=TICK_DURATION, max_ticks=MAX_TICKS_PER_FRAME):
+        self.tick_duration = tick_duration
+        self.max_ticks = max_ticks
+        self.accumulator = 0.0
+        self.alpha = 1.0  # fração do próximo passo já decorrida (para interpolação)
+        self.total_ticks = 0
+
+    def advance(self, frame_seconds):
+        """Acumula o tempo do frame e retorna quantos passos de simulação executar"""
+        self.accumulator += min(frame_seconds, MAX_FRAME_TIME)
+        ticks = int(self.accumulator // self.tick_duration)
+
+        if ticks > self.max_ticks:
+            # Sob carga descarta o excesso: o jogo desacelera um pouco em vez de
+            # entrar numa espiral de passos atrasados
+            ticks = self.max_ticks
+            self.accumulator = ticks * self.tick_duration + self.accumulator % self.tick_duration
+
+        self.accumulator -= ticks * self.tick_duration
+        self.alpha = self.accumulator / self.tick_duration
+        self.total_ticks += ticks
+        return ticks
+
+
+def snapshot_positions(sprites):
+    """Guarda a posição de cada sprite antes de um passo de simulação"""
+    for sprite in sprites:
+        sprite.previous_center = sprite.rect.center
+
+
+def interpolated_rect(sprite, alpha):
+    """Rect do sprite interpolado entre o passo anterior e o atual"""
+    previous = getattr(sprite, 'previous_center', None)
+    if previous is None or alpha >= 1.0:
+        return sprite.rect
+
+    current_x, current_y = sprite.rect.center
+    rect = sprite.rect.copy()
+    rect.center = (round(previous[0] + (current_x - previous[0]) * alpha),
+                   round(previous[1] + (current_y - previous[1]) * alpha))
+    return rect
@@ -0,0 +1,100 @@
+"""
+Gradientes de UI gerados com NumPy direto no buffer da surface.
+
+Substitui os loops de pygame.draw.line linha a linha. Cada gradiente é
+cacheado pelos parâmetros, então a surface retornada é compartilhada:
+quem for desenhar por cima dela deve usar .copy().
+"""
+from functools import lru_cache
+from typing import Tuple
+
+import pygame
+from lazy_import import lazy_module
+
+np = lazy_module('numpy')
+
+GRADIENT_CACHE_SIZE = 256
+
+
+def _ramp(length: int) -> 'np.ndarray':
+    """Fator de interpolação 0..1 (exclusivo) ao longo de `length` pixels, como i / length"""
+    return np.arange(length, dtype=np.float32) / max(1, length)
+
+
+def _rgba(color) -> tuple:
+    """Completa a cor com alpha opaco se vier só RGB"""
+    return (*color[:3], color[3] if len(color) > 3 else 255)
+
+
+def _mix(start, end, t) -> 'np.ndarray':
+    """Interpola as cores para cada t; trunca como int() nos loops antigos"""
+    start = np.asarray(start, dtype=np.float32)
+    end = np.asarray(end, dtype=np.float32)
+    return (start + (end - start) * t[:, None]).astype(np.uint8)
+
+
+def _fill(surface: pygame.Surface, rgba: 'np.ndarray', vertical: bool) -> pygame.Surface:
+    """Copia uma linha de cores (N x 3 ou N x 4) para a surface inteira"""
+    rgb = rgba[:, :3]
+    # surfarray é indexado [x, y]
+    if vertical:
+        pygame.surfarray.pixels3d(surface)[:] = rgb[None, :, :]
+    else:
+        pygame.surfarray.pixels3d(surface)[:] = rgb[:, None, :]
+    if rgba.shape[1] == 4:
+        alpha = rgba[:, 3]
+        pygame.surfarray.pixels_alpha(surface)[:] = alpha[None, :] if vertical else alpha[:, None]
+    return surface
+
+
+@lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def linear_gradient(width: int, height: int, start: Tuple[int, ...], end: Tuple[int, ...],
+                    vertical: bool = True) -> pygame.Surface:
+    """Gradiente linear de `start` a `end` (RGB, ou RGBA para uma surface com alpha)"""
+    has_alpha = len(start) > 3 or len(end) > 3
+    if has_alpha:
+        start, end = _rgba(start), _rgba(end)
+    surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA if has_alpha else 0)
+    length = surface.get_height() if vertical else surface.get_width()
+    return _fill(surface, _mix(start, end, _ramp(length)), vertical)
+
+
+@lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def alpha_gradient(width: int, height: int, color: Tuple[int, int, int],
+                   start_alpha: int, end_alpha: int, vertical: bool = True) -> pygame.Surface:
+    """Cor sólida com alpha variando de `start_alpha` a `end_alpha` (limitado a 0..255)"""
+    surface = pygame.Surface((max(1, width), max(1, height)), pygame.SRCALPHA)
+    length = surface.get_height() if vertical else surface.get_width()
+    alpha = start_alpha + (end_alpha - start_alpha) * _ramp(length)
+    rgba = np.empty((length, 4), dtype=np.uint8)
+    rgba[:, :3] = color[:3]
+    rgba[:, 3] = np.clip(alpha, 0, 255).astype(np.uint8)
+    return _fill(surface, rgba, vertical)
+
+
+@lru_cache(maxsize=GRADIENT_CACHE_SIZE)
+def radial_gradient(radius: int, inner: Tuple[int, ...], outer: Tuple[int, ...]) -> pygame.Surface:
+    """Gradiente radial num quadrado de lado 2 * radius, do centro (`inner`) à borda (`outer`).
+
+    As cores podem ter alpha; fora do círculo a cor é `outer`.
+    """
+    size = max(1, radius * 2)
+    coords = np.arange(size, dtype=np.float32) - (size - 1) / 2
+    distance = np.sqrt(coords[:, None] ** 2 + coords[None, :] ** 2)
+    t = np.clip(distance / max(1, radius), 0, 1)
+
+    inner_arr = np.asarray(_rgba(inner), dtype=np.float32)
+    outer_arr = np.asarray(_rgba(outer), dtype=np.float32)
+    rgba = (inner_arr + (outer_arr - inner_arr) * t[:, :, None]).astype(np.uint8)
+
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[:] = rgba[:, :, :3]
+    pygame.surfarray.pixels_alpha(surface)[:] = rgba[:, :, 3]
+    return surface
+
+
+def clear_cache():
+    """Descarta os gradientes cacheados (ex.: ao trocar de resolução)"""
+    linear_gradient.cache_clear()
+    alpha_gradient.cache_clear()
+    radial_gradient.cache_clear()
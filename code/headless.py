@@ -0,0 +1,102 @@
+"""
+Modo headless: roda qualquer fase sem janela, sem desenhar e com input injetado.
+
+Uso pela linha de comando (a partir de code/):
+    python headless.py --level 3 --ticks 3600
+
+Ou a partir de outro script (benchmarks, testes de longa duração, balanceamento):
+    from headless import HeadlessRunner
+    runner = HeadlessRunner(3, ScriptedInput(lambda tick: {pygame.K_RIGHT}))
+    runner.step(600)
+"""
+import argparse
+import os
+import sys
+import time
+from importlib import import_module
+
+# Fases disponíveis: número -> (módulo, classe)
+LEVELS = {
+    1: ('level', 'Level1'),
+    2: ('level2', 'Level2'),
+    3: ('level3', 'Level3'),
+    4: ('level4', 'Level4'),
+}
+
+
+def init_headless():
+    """Inicializa o pygame com os drivers dummy de vídeo e áudio.
+
+    A janela continua existindo (convert() e get_surface() precisam dela), mas
+    nada é mostrado e nenhum frame é desenhado.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    import pygame
+    from settings import WIDTH, HEIGTH
+
+    pygame.mixer.pre_init(44100, 16, 2, 4096)
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((WIDTH, HEIGTH))
+    return pygame.display.get_surface()
+
+
+class HeadlessRunner:
+    """Carrega uma fase e avança a simulação em ticks fixos, o mais rápido possível"""
+
+    def __init__(self, level_number, input_source=None):
+        init_headless()
+        from input_source import input_router, ScriptedInput
+
+        self.input_source = input_router.use(input_source or ScriptedInput())
+        module_name, class_name = LEVELS[level_number]
+        self.level_number = level_number
+        self.level = getattr(import_module(module_name), class_name)()
+        self.ticks = 0
+
+    @property
+    def finished(self):
+        return self.level.completed or self.level.gameover
+
+    def step(self, ticks, stop_when_finished=True):
+        """Avança `ticks` ticks de simulação e retorna quantos foram executados"""
+        done = 0
+        for _ in range(ticks):
+            if stop_when_finished and self.finished:
+                break
+            self.level.update()
+            done += 1
+        self.ticks += done
+        return done
+
+    def render(self, alpha=1.0):
+        """Desenha um frame (opcional - útil para capturar a tela no fim de um teste)"""
+        self.level.draw(alpha)
+        return self.level.display_surface
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Roda uma fase sem janela por N ticks')
+    parser.add_argument('--level', type=int, choices=sorted(LEVELS), default=1)
+    parser.add_argument('--ticks', type=int, default=600)
+    parser.add_argument('--keep-going', action='store_true',
+                        help='continua mesmo depois de game over ou fase concluída')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    runner = HeadlessRunner(args.level)
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ticks = runner.step(args.ticks, stop_when_finished=not args.keep_going)
+    elapsed = time.perf_counter() - start
+
+    rate = ticks / elapsed if elapsed > 0 else float('inf')
+    print(f"Fase {args.level}: {ticks} ticks em {elapsed:.2f}s ({rate:.0f} ticks/s), "
+          f"carregamento {load_time:.2f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
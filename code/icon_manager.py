@@ -5,8 +5,12 @@ Suporta emojis, ícones PNG, fontes de ícones e renderização vetorial avança
 import pygame
 import os
 from typing import Dict, Tuple, Optional
-from PIL import Image, ImageDraw, ImageFont
-import io
+from lazy_import import lazy_module
+from font_manager import font_manager
+
+# PIL só é necessário para ícones de emoji - carregado no primeiro uso
+Image = lazy_module('PIL.Image')
+ImageDraw = lazy_module('PIL.ImageDraw')
 
 # Importar sistema avançado de ícones
 try:
@@ -27,9 +31,8 @@ class IconManager:
             pygame.font.init()
             
         self.icons_cache = {}
-        self.emoji_font = None
+        self._emoji_font = None
         self.icon_font = None
-        self._load_fonts()
         
         # Emojis Unicode para diferentes controles
         self.emoji_map = {
@@ -69,6 +72,13 @@ class IconManager:
             'stop': '\uf04d'
         }
         
+    @property
+    def emoji_font(self) -> pygame.font.Font:
+        """Fonte de emojis, carregada no primeiro uso"""
+        if self._emoji_font is None:
+            self._load_fonts()
+        return self._emoji_font
+    
     def _load_fonts(self):
         """Carrega fontes para emojis e ícones"""
         # Tentar carregar fonte de emojis do sistema
@@ -82,15 +92,15 @@ class IconManager:
         for font_path in emoji_fonts:
             if os.path.exists(font_path):
                 try:
-                    self.emoji_font = pygame.font.Font(font_path, 24)
+                    self._emoji_font = font_manager.font(font_path, 24)
                     print(f"✅ Fonte de emojis carregada: {font_path}")
                     break
                 except pygame.error:
                     continue
         
         # Fallback para fonte do sistema
-        if not self.emoji_font:
-            self.emoji_font = pygame.font.SysFont('Arial', 24)
+        if not self._emoji_font:
+            self._emoji_font = font_manager.get_font('Arial', 24)
             print("⚠️ Usando fonte do sistema para emojis")
     
     def get_icon(self, icon_name: str, size: int = 24, color: Tuple[int, int, int] = (255, 255, 255)) -> pygame.Surface:
@@ -165,7 +175,7 @@ class IconManager:
             
         try:
             # Ajustar fonte para o tamanho desejado
-            font = pygame.font.Font(None, int(size * 1.2))
+            font = font_manager.font(None, int(size * 1.2))
             
             # Renderizar emoji
             emoji = self.emoji_map[icon_name]
@@ -0,0 +1,77 @@
+"""
+Mede quanto tempo cada módulo leva para importar (python -X importtime).
+
+Uso (a partir de code/):
+    python import_tracer.py                  # cadeia de imports do main.py
+    python import_tracer.py level3 --top 30
+    python import_tracer.py --budget-ms 300  # sai com código 1 se estourar
+
+O tempo acumulado inclui os imports feitos pelo módulo; o próprio é só o
+código do módulo. Módulos do jogo (arquivos em code/) são marcados com *.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def trace_imports(module):
+    """Lista de (módulo, próprio µs, acumulado µs, profundidade) na ordem do import"""
+    # os._exit pula os hooks de atexit (cleanup_on_exit e o gravador de estatísticas
+    # reescreveriam player_stats.json só por causa da medição)
+    code = f'import {module}; import os; os._exit(0)'
+    completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                               cwd=CODE_DIR, capture_output=True, text=True,
+                               env=dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy'))
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} falhou:\n{completed.stderr[-2000:]}")
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        entries.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return entries
+
+
+def is_game_module(name):
+    top = name.split('.')[0]
+    return (os.path.exists(os.path.join(CODE_DIR, f'{top}.py'))
+            or os.path.isdir(os.path.join(CODE_DIR, top)))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Tempo de import por módulo')
+    parser.add_argument('module', nargs='?', default='main')
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--game-only', action='store_true', help='mostra só os módulos do jogo')
+    parser.add_argument('--budget-ms', type=float, help='orçamento para o import completo')
+    args = parser.parse_args(argv)
+
+    entries = trace_imports(args.module)
+    total_ms = next((cumulative for name, _, cumulative, _ in entries if name == args.module), 0) / 1000
+
+    rows = [entry for entry in entries if not args.game_only or is_game_module(entry[0])]
+    rows.sort(key=lambda entry: entry[2], reverse=True)
+    print(f"{'módulo':<44}{'acumulado ms':>14}{'próprio ms':>12}")
+    for name, self_us, cumulative_us, _ in rows[:args.top]:
+        marker = '*' if is_game_module(name) else ' '
+        print(f"{marker}{name:<43}{cumulative_us / 1000:>14.1f}{self_us / 1000:>12.1f}")
+
+    # Quem pagou o quê entre os módulos do jogo (tempo próprio somado)
+    game_ms = sum(self_us for name, self_us, _, _ in entries if is_game_module(name)) / 1000
+    print(f"\nimport {args.module}: {total_ms:.1f} ms ({len(entries)} módulos, "
+          f"{game_ms:.1f} ms em código do jogo)")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"❌ Orçamento de {args.budget_ms:.0f} ms estourado em {total_ms - args.budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+import pygame
+
+
+class PressedKeys:
+    """Estado de teclas indexável como o retorno de pygame.key.get_pressed()"""
+    __slots__ = ('held',)
+
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class KeyboardInput:
+    """Fonte padrão: o teclado de verdade"""
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput:
+    """Teclas controladas por código (modo headless, benchmarks, testes de IA).
+
+    `script` é opcional: uma função tick -> teclas seguradas naquele tick. Sem
+    script, as teclas são controladas com press()/release()/hold().
+    """
+
+    def __init__(self, script=None):
+        self.script = script
+        self.tick = 0
+        self.held = frozenset()
+
+    def press(self, key):
+        self.held = self.held | {key}
+
+    def release(self, key):
+        self.held = self.held - {key}
+
+    def hold(self, keys):
+        """Substitui todas as teclas seguradas"""
+        self.held = frozenset(keys)
+
+    def advance(self):
+        """Chamado uma vez por tick pelo InputRouter"""
+        if self.script is not None:
+            self.held = frozenset(self.script(self.tick) or ())
+        self.tick += 1
+
+    def get_pressed(self):
+        return PressedKeys(self.held)
+
+
+class InputRouter:
+    """Ponto único de leitura de teclas do jogador.
+
+    O Player lê input_router.get_pressed() em vez de pygame.key.get_pressed(),
+    então qualquer fonte com get_pressed() pode ser injetada com use().
+    """
+
+    def __init__(self):
+        self.keyboard = KeyboardInput()
+        self.source = self.keyboard
+
+    def use(self, source=None):
+        """Troca a fonte de input (None volta para o teclado)"""
+        self.source = source or self.keyboard
+        return self.source
+
+    def advance(self):
+        """Avança fontes roteirizadas em um tick de simulação"""
+        advance = getattr(self.source, 'advance', None)
+        if advance is not None:
+            advance()
+
+    def get_pressed(self):
+        return self.source.get_pressed()
+
+
+# Instância global - lida pelo Player a cada tick
+input_router = InputRouter()
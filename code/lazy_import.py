@@ -0,0 +1,20 @@
+import importlib.util
+import sys
+
+
+def lazy_module(name):
+    """Retorna o módulo `name` sem executá-lo: o import de verdade acontece no
+    primeiro acesso a um atributo. Usado para dependências pesadas (PIL, telas
+    de menu) que não são necessárias até o primeiro frame.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -3,13 +3,14 @@ from settings import *
 from tile import Tile
 from player import Player
 from debug import debug
+from assets import asset_pipeline
 from support import *
 from random import choice
-from weapon import Weapon, Weapon360Damage, Magic
+from weapon import weapon_pool, damage_area_pool, magic_pool, prewarm_attack_pools
 from ui import UI
 from enemy import Enemy
 from collectables import*
-from particles import CollectParticle, GemCollectAnimation, DeathParticle, EnemyDeathAnimation, FloatingText
+from particles import DeathParticle, EnemyDeathAnimation
 # from settings_manager import SettingsManager  # REMOVED (using modern_audio_controls instead)
 # CHEAT: Import cheat system for testing (remove for final version)
 from cheat_system import cheat_system
@@ -18,6 +19,13 @@ from player_stats import player_stats
 from font_manager import font_manager
 from professional_renderer import professional_renderer
 from audio_manager import audio_manager
+from game_clock import snapshot_positions, interpolated_rect
+from timer_scheduler import timer_scheduler
+from utils.logger import game_logger
+from attack_resolver import AttackResolver
+from pickup_system import PickupSystem
+from frame_profiler import frame_profiler
+from input_source import input_router
 
 class Level3:
     def __init__(self):
@@ -46,6 +54,7 @@ class Level3:
         self.current_attack = None
         self.attack_sprites = pygame.sprite.Group()
         self.attackable_sprites = pygame.sprite.Group()
+        self.attack_resolver = AttackResolver(self.attackable_sprites)
         
         # magic sprites
         self.magic_sprites = pygame.sprite.Group()
@@ -53,9 +62,15 @@ class Level3:
         # animation sprites
         self.floating_text_sprites = pygame.sprite.Group()
 
+        # collectibles, doors and exits (indexed by create_map)
+        self.pickups = PickupSystem(self)
+
         # sprite setup
         self.create_map()
 
+        # load every weapon/magic graphic now instead of on the first swing
+        prewarm_attack_pools(self.player)
+
         # user interface
         self.ui = UI()
         self.ui.current_level = 3
@@ -73,6 +88,7 @@ class Level3:
 
     def reset(self):
         # Reset level-specific variables and clear sprites
+        player_stats.end_level_run()  # a próxima partida grava uma série nova
         self.gameover = False
         self.completed = False
         self.visible_sprites.empty()
@@ -85,6 +101,8 @@ class Level3:
         self.floating_text_sprites.empty()
         self.create_map()
     def create_map(self):
+        # Timers pendentes são da fase anterior (ou desta antes do reset)
+        timer_scheduler.clear()
 
         layouts = {
             'boundary': import_csv_layout('../map new/dungeon_collision.csv'),
@@ -137,19 +155,31 @@ class Level3:
                         if style == 'keys':
                             Key((x, y), [self.key, self.visible_sprites])
 
+        # index collectibles once; the player only queries its neighbourhood
+        self.pickups.clear()
+        self.pickups.register(self.health_orbs, 'health')
+        self.pickups.register(self.attack_orbs, 'attack')
+        self.pickups.register(self.speed_orbs, 'speed')
+        self.pickups.register(self.gem, 'gem')
+        self.pickups.register(self.key, 'key')
+        self.pickups.register(self.door, 'door')
+        self.pickups.register(self.next_sprites, 'next')
 
     def create_attack(self):
         # Create original visual weapon (shows in direction player is facing)
-        self.current_attack = Weapon(self.player, [self.visible_sprites, self.attack_sprites])
+        self.current_attack = weapon_pool.acquire(self.player, [self.visible_sprites, self.attack_sprites])
+        self.attack_resolver.forget(self.current_attack)
         
         # Add invisible 360-degree damage area
-        self.damage_area = Weapon360Damage(self.player, [self.attack_sprites])
+        self.damage_area = damage_area_pool.acquire(self.player, [self.attack_sprites])
+        self.attack_resolver.forget(self.damage_area)
 
     def create_magic(self, style, strength, cost):
         if self.player.energy >= cost:
             self.player.energy -= cost
-            magic_sprite = Magic(self.player, [self.visible_sprites, self.magic_sprites, self.attack_sprites], style, strength, cost)
-            print(f"Magia {style} usada! Energia restante: {self.player.energy}")
+            magic_sprite = magic_pool.acquire(self.player, [self.visible_sprites, self.magic_sprites, self.attack_sprites], style, strength, cost)
+            self.attack_resolver.forget(magic_sprite)
+            game_logger.debug("Magia %s usada! Energia restante: %s", style, self.player.energy)
 
     def destroy_attack(self):
         if self.current_attack:
@@ -157,20 +187,15 @@ class Level3:
         self.current_attack = None
 
     def player_attack_logic(self):
-        if self.attack_sprites:
-            for attack_sprite in self.attack_sprites:
-                # Only process actual weapons and magic projectiles, not effects
-                if hasattr(attack_sprite, 'sprite_type') and attack_sprite.sprite_type in ['weapon', 'magic']:
-                    collision_sprites = pygame.sprite.spritecollide(attack_sprite, self.attackable_sprites, False)
-                    if collision_sprites:
-                        for target_sprite in collision_sprites:
-                            if target_sprite.sprite_type == 'grass':
-                                target_sprite.kill()
-                            elif attack_sprite.sprite_type == 'magic':
-                                # Handle magic projectile collision
-                                self.handle_magic_collision(attack_sprite, target_sprite)
-                            else:
-                                target_sprite.get_damage(self.player, attack_sprite.sprite_type)
+        # Broad phase: only attackables near each attack, each pair once per swing
+        for attack_sprite, target_sprite in self.attack_resolver.resolve(self.attack_sprites):
+            if target_sprite.sprite_type == 'grass':
+                target_sprite.kill()
+            elif attack_sprite.sprite_type == 'magic':
+                # Handle magic projectile collision
+                self.handle_magic_collision(attack_sprite, target_sprite)
+            else:
+                target_sprite.get_damage(self.player, attack_sprite.sprite_type)
 
     def handle_magic_collision(self, magic_projectile, target):
         """Handle collision between magic projectile and target"""
@@ -192,8 +217,7 @@ class Level3:
         
         if self.player.vulnerable:
             self.player.health -= amount
-            self.player.vulnerable = False
-            self.player.hurt_time = pygame.time.get_ticks()
+            self.player.start_invulnerability()
         # spawn particles
 
     def draw_minimap(self, surface):
@@ -282,7 +306,7 @@ class Level3:
         )
         surface.blit(control_surface, (map_x + 5, controls_y))
 
-    def run(self):
+    def handle_events(self):
         # Handle settings events (only process settings-related events)
         for event in pygame.event.get():
             if event.type == pygame.KEYDOWN:
@@ -298,34 +322,62 @@ class Level3:
                 # consumed = self.settings.handle_mouse_click(pygame.mouse.get_pos())  # REMOVED
                 # If click wasn't consumed by settings, let game handle it
                 pass
+
+    def update(self):
+        """Advance the simulation by one fixed tick"""
+        timer_scheduler.tick()
+        input_router.advance()
+        audio_manager.set_listener(self.player.rect.center)
+        player_stats.sample_level(3, timer_scheduler.now)
+
+        # CHEAT: Apply cheat effects (remove for final version)
+        cheat_system.apply_god_mode(self.player)
+        cheat_system.apply_max_energy(self.player)
         
-        # Only update game if settings menu is closed (pause when open)
-        # if not self.settings.is_menu_open():  # REMOVED
-        if True:  # Always run game update
-            # CHEAT: Apply cheat effects (remove for final version)
-            cheat_system.apply_god_mode(self.player)
-            cheat_system.apply_max_energy(self.player)
-            
-            # update and draw the game
+        # remember where everything was so draw() can interpolate
+        snapshot_positions(self.visible_sprites)
+        snapshot_positions(self.floating_text_sprites)
+
+        # update the game (movement and obstacle collision happen in the sprite updates)
+        with frame_profiler.scope('sprite update'):
             self.visible_sprites.update()
+        with frame_profiler.scope('enemy AI'):
             self.visible_sprites.enemy_update(self.player)
+        with frame_profiler.scope('attack logic'):
             self.player_attack_logic()
             self.magic_sprites.update()  # Update magic sprites
-            self.floating_text_sprites.update()  # Atualizar textos flutuantes
-        
-        # Always draw (but don't update when paused)
-        self.visible_sprites.custom_draw(self.player)
-        
-        # Desenhar textos flutuantes por cima de tudo com offset da câmera
-        for text in self.floating_text_sprites:
-            # Aplicar offset da câmera
-            screen_pos = text.rect.topleft - self.visible_sprites.offset
-            pygame.display.get_surface().blit(text.image, screen_pos)
-        
-        self.ui.display(self.player)
+        self.floating_text_sprites.update()  # Atualizar textos flutuantes
+
+        if self.player.health <= 0:
+            game_logger.info('game over')
+            # STATS: Record player death
+            player_stats.record_death()
+            self.gameover = True
+
+        # Orbs, itens, porta e saída: uma consulta local por tick
+        with frame_profiler.scope('pickups'):
+            self.pickups.resolve(self.player)
+
+        if self.player.inventory['zappaguriStone']==1:
+            game_logger.info('Pedra Mística do Zappaguri coletada!')
+            self.completed = True
+
+    def draw(self, alpha=1.0):
+        """Render the current state, interpolated between the last two ticks"""
+        with frame_profiler.scope('draw sprites'):
+            self.visible_sprites.custom_draw(self.player, alpha)
+            
+            # Desenhar textos flutuantes por cima de tudo com offset da câmera
+            for text in self.floating_text_sprites:
+                # Aplicar offset da câmera
+                screen_pos = interpolated_rect(text, alpha).topleft - self.visible_sprites.offset
+                pygame.display.get_surface().blit(text.image, screen_pos)
         
-        # CHEAT: Display cheat information (remove for final version)
-        cheat_system.display_cheat_info(pygame.display.get_surface())
+        with frame_profiler.scope('HUD'):
+            self.ui.display(self.player)
+            
+            # CHEAT: Display cheat information (remove for final version)
+            cheat_system.display_cheat_info(pygame.display.get_surface())
         
         # Draw settings button and menu
         # self.settings.draw(pygame.display.get_surface())  # REMOVED
@@ -333,102 +385,12 @@ class Level3:
         # Draw minimap if enabled
         if self.show_minimap:
             self.draw_minimap(pygame.display.get_surface())
-        
-        # Keep the rest of the original run() method logic after this point
-        if pygame.sprite.spritecollide(self.player, self.next_sprites, False):
-            self.completed = True
-        if self.player.health <= 0:
-            print('game over')
-            # STATS: Record player death
-            player_stats.record_death()
-            self.gameover = True
-        health_collisions = pygame.sprite.spritecollide(self.player, self.health_orbs, True)
-        if health_collisions:
-            for orb in health_collisions:
-                # Create collection animation
-                GemCollectAnimation(orb.rect.center, [self.visible_sprites])
-                for _ in range(10):
-                    CollectParticle(orb.rect.center, [self.visible_sprites], color=(255, 100, 100))
-                
-                # Animação de texto flutuante
-                FloatingText(orb.rect.center, [self.floating_text_sprites], "+VIDA", color=(255, 100, 100), size=16)
-                
-                self.player.inventory["healthOrbs"] += 1
-                audio_manager.play_sound('heal', 'collection')
-                if self.player.health < 450:
-                    self.player.health += 50
-                else:
-                    self.player.health = 500
-
-        speed_collisions = pygame.sprite.spritecollide(self.player, self.speed_orbs, True)
-        if speed_collisions:
-            for orb in speed_collisions:
-                # Create collection animation
-                GemCollectAnimation(orb.rect.center, [self.visible_sprites])
-                for _ in range(10):
-                    CollectParticle(orb.rect.center, [self.visible_sprites], color=(100, 100, 255))
-                
-                # Animação de texto flutuante
-                FloatingText(orb.rect.center, [self.floating_text_sprites], "+VELOCIDADE", color=(100, 255, 100), size=16)
-                
-                self.player.inventory["speedOrbs"] += 1
-                audio_manager.play_sound('heal', 'collection')
-                self.player.speed += 0.4
-                self.player.animation_speed += 0.04
-
-        gem_collisions = pygame.sprite.spritecollide(self.player, self.gem, True)
-        if gem_collisions:
-            for gem in gem_collisions:
-                # Create collection animation
-                GemCollectAnimation(gem.rect.center, [self.visible_sprites])
-                for _ in range(20):
-                    CollectParticle(gem.rect.center, [self.visible_sprites], color=(220, 180, 255))
-                
-                # Animação de texto flutuante especial para a pedra
-                FloatingText(gem.rect.center, [self.floating_text_sprites], "PEDRA MÍSTICA!", color=(220, 180, 255), size=24)
-                
-                self.player.inventory['zappaguriStone'] = 1
-                audio_manager.play_sound('heal', 'collection')
-
-        attack_collisions = pygame.sprite.spritecollide(self.player, self.attack_orbs, True)
-        if attack_collisions:
-            for orb in attack_collisions:
-                # Create collection animation
-                GemCollectAnimation(orb.rect.center, [self.visible_sprites])
-                for _ in range(10):
-                    CollectParticle(orb.rect.center, [self.visible_sprites], color=(255, 200, 100))
-                
-                # Animação de texto flutuante
-                FloatingText(orb.rect.center, [self.floating_text_sprites], "+ATAQUE", color=(255, 200, 100), size=16)
-                
-                self.player.inventory["attackOrbs"] += 1
-                audio_manager.play_sound('heal', 'collection')
-                self.player.attack += 10
-
-
-        key_collisions = pygame.sprite.spritecollide(self.player, self.key, True)
-        if key_collisions:
-            for key in key_collisions:
-                # Create collection animation
-                GemCollectAnimation(key.rect.center, [self.visible_sprites])
-                for _ in range(10):
-                    CollectParticle(key.rect.center, [self.visible_sprites], color=(255, 215, 0))
-                
-                # Animação de texto flutuante
-                FloatingText(key.rect.center, [self.floating_text_sprites], "+CHAVE", color=(255, 215, 0), size=18)
-                
-                self.player.inventory["keys"] += 1
-                audio_manager.play_sound('heal', 'collection')
-        if self.player.inventory['keys']<4:
-            if pygame.sprite.spritecollide(self.player,self.door, False):
-                self.ui.set_status_message('Você precisa de 4 chaves para abrir esta porta!')
-        else:
-            if pygame.sprite.spritecollide(self.player,self.door, True):
-                self.ui.set_status_message('Porta Aberta!')
 
-        if self.player.inventory['zappaguriStone']==1:
-            print('Pedra Mística do Zappaguri coletada!')
-            self.completed = True
+    def run(self):
+        with frame_profiler.scope('input'):
+            self.handle_events()
+        self.update()
+        self.draw()
 
 
 class YSortCameraGroup(pygame.sprite.Group):
@@ -442,32 +404,36 @@ class YSortCameraGroup(pygame.sprite.Group):
         self.offset = pygame.math.Vector2()
 
         # creating the floor
-        self.floor_surf = pygame.image.load('../map new/dungeon ground.png').convert()
+        self.floor_surf = asset_pipeline.image('../map new/dungeon ground.png', alpha=False)
         self.floor_surf = pygame.transform.scale2x(self.floor_surf)
         self.floor_rect = self.floor_surf.get_rect(topleft=(0, 0))
-        self.floor_surf2 = pygame.image.load('../map new/ala.png').convert_alpha()
+        self.floor_surf2 = asset_pipeline.image('../map new/ala.png')
         self.floor_surf2 = pygame.transform.scale2x(self.floor_surf2)
         self.floor_rect2 = self.floor_surf2.get_rect(topleft=(0, 0))
         self.vignette_radius = 1000
 
-    def custom_draw(self, player):
+    def custom_draw(self, player, alpha=1.0):
 
-        # getting the offset
-        self.offset.x = player.rect.centerx - self.half_width
-        self.offset.y = player.rect.centery - self.half_height
+        # getting the offset (camera follows the interpolated player position)
+        player_rect = interpolated_rect(player, alpha)
+        self.offset.x = player_rect.centerx - self.half_width
+        self.offset.y = player_rect.centery - self.half_height
 
         # drawing the floor
         floor_offset_pos = self.floor_rect.topleft - self.offset
-        self.display_surface.blit(self.floor_surf, floor_offset_pos)
+        with frame_profiler.scope('draw floor'):
+            self.display_surface.blit(self.floor_surf, floor_offset_pos)
 
         # for sprite in self.sprites():
         for sprite in sorted(self.sprites(), key=lambda sprite: sprite.rect.centery):
-            offset_pos = sprite.rect.topleft - self.offset
+            sprite_rect = interpolated_rect(sprite, alpha)
+            offset_pos = sprite_rect.topleft - self.offset
             self.display_surface.blit(sprite.image, offset_pos)
 
         # drawing the floor
         floor_offset_pos2 = self.floor_rect2.topleft - self.offset
-        self.display_surface.blit(self.floor_surf2, floor_offset_pos2)
+        with frame_profiler.scope('draw floor'):
+            self.display_surface.blit(self.floor_surf2, floor_offset_pos2)
         self.draw_vignette()
 
 
@@ -5,141 +5,193 @@ from settings import WIDTH, HEIGTH, TEXT_COLOR, UI_BG_COLOR, UI_BORDER_COLOR
 from font_manager import font_manager
 from professional_renderer import professional_renderer
 
+# Transparência do véu escuro sobre o fundo
+OVERLAY_ALPHA = 180
+
+# Textos mostrados enquanto ninguém informa o que está carregando
+LOADING_TEXTS = [
+    "Carregando...",
+    "Preparando Aventura...",
+    "Invocando Magias...",
+    "Carregando Relíquias..."
+]
+
 
 class LoadingScreen():
+    """Tela de carregamento.
+
+    Fundo e textos são montados uma vez; a animação depende só do tempo desde
+    start(), então fica igual com qualquer FPS (ou com frames espaçados durante
+    um carregamento pesado). Quem carrega informa o progresso com set_progress().
+    """
+
     def __init__(self):
         # Use home page as background
         self.displaysurface = pygame.display.get_surface()
-        
-        # Load the home page image as background
+
+        # Home page já escalada e escurecida pelo overlay, montada uma vez só
         self.background = pygame.image.load('../graphics/ui/home page.jpg').convert()
         self.background = pygame.transform.scale(self.background, (WIDTH, HEIGTH))
-        
-        # Create a semi-transparent overlay for better visibility of effects
-        self.overlay = pygame.Surface((WIDTH, HEIGTH))
-        self.overlay.set_alpha(180)  # Semi-transparent black overlay
-        self.overlay.fill((0, 0, 0))
-        
+        overlay = pygame.Surface((WIDTH, HEIGTH))
+        overlay.set_alpha(OVERLAY_ALPHA)  # Semi-transparent black overlay
+        overlay.fill((0, 0, 0))
+        self.background.blit(overlay, (0, 0))
+
         self.rect = self.background.get_rect(topleft=(0, 0))
-        self.music = pygame.mixer.Sound('../audio/Light Ambience 1.mp3')
-        self.music.set_volume(0.5)
-        
+        self.music = None
+        self.music_channel = None
+        try:
+            self.music = pygame.mixer.Sound('../audio/Light Ambience 1.mp3')
+            self.music.set_volume(0.5)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"⚠️ Música da tela de carregamento indisponível: {e}")
+
         # Loading animation variables
+        self.start_ticks = pygame.time.get_ticks()
         self.time = 0
-        self.particle_time = 0
-        self.particles = []
-        
-        # Modern font system - no more hardcoded fonts needed
-        
+
+        # Progresso real (None = indeterminado)
+        self.progress = None
+        self.message = None
+
+        # Sparkles ficam numa camada própria acima do fundo - um sprite por tamanho.
+        # Com o overlay por cima no desenho antigo, só ~30% do brilho aparecia.
+        self.sparkle_sprites = {}
+        dim = 1 - OVERLAY_ALPHA / 255
+        for size in range(1, 4):
+            sprite = pygame.Surface((size * 4, size * 4))
+            pygame.draw.circle(sprite, (int(255 * dim), int(255 * dim), int(200 * dim)), (size * 2, size * 2), size)
+            self.sparkle_sprites[size] = sprite
+
+        # Textos renderizados uma vez (cache por conteúdo)
+        self.text_cache = {}
+
         # Create mystical particles (brighter for visibility)
-        for _ in range(30):
+        self.particles = []
+        for i in range(30):
             self.particles.append({
-                'x': pygame.math.Vector2(WIDTH * 0.5, HEIGTH * 0.6).x + (pygame.math.Vector2(120, 0).rotate(360 * _ / 30)).x,
-                'y': pygame.math.Vector2(WIDTH * 0.5, HEIGTH * 0.6).y + (pygame.math.Vector2(120, 0).rotate(360 * _ / 30)).y,
-                'angle': 360 * _ / 30,
+                'angle': 360 * i / 30,
                 'radius': 120,
-                'size': pygame.math.Vector2(3, 8).length(),
-                'color': (150 + (_ * 4) % 105, 255, 255 - (_ * 3) % 100)
+                'size': 2,
+                'color': (150 + (i * 4) % 105, 255, 255 - (i * 3) % 100)
             })
 
-    def animate_background(self):
-        # Reload the clean background to avoid accumulating effects
-        self.background = pygame.image.load('../graphics/ui/home page.jpg').convert()
-        self.background = pygame.transform.scale(self.background, (WIDTH, HEIGTH))
-        
-        # Add subtle moving sparkles over the background
+    def start(self):
+        """Começa a animação do zero e toca a música (uma vez, em loop)"""
+        self.start_ticks = pygame.time.get_ticks()
+        self.time = 0
+        self.progress = None
+        self.message = None
+        if self.music and (self.music_channel is None or not self.music_channel.get_busy()):
+            self.music_channel = self.music.play(-1)
+
+    def stop(self, fadeout_ms=500):
+        """Para a música da tela de carregamento"""
+        if self.music:
+            self.music.fadeout(fadeout_ms)
+        self.music_channel = None
+
+    def set_progress(self, done, total, message=None):
+        """Progresso real de quem está carregando (done de total itens)"""
+        self.progress = min(1.0, done / total) if total else 1.0
+        self.message = message
+
+    def render_text(self, text, font_type, **effects):
+        """Texto com efeitos, renderizado só na primeira vez"""
+        key = (text, font_type)
+        if key not in self.text_cache:
+            self.text_cache[key] = professional_renderer.render_text_professional(
+                text, font_type, tuple(pygame.Color(TEXT_COLOR))[:3], anti_alias=True, **effects
+            )[0]
+        return self.text_cache[key]
+
+    def draw_sparkles(self):
+        # Subtle moving sparkles over the background
         for i in range(8):
             x = int((self.time * 40 + i * 160) % WIDTH)
             y = int((self.time * 25 + i * 100) % HEIGTH)
             size = int(2 + math.sin(self.time * 2 + i) * 1)
-            alpha = int(100 + math.sin(self.time * 3 + i * 0.5) * 50)
-            
-            # Create sparkle effect
-            sparkle_surface = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-            pygame.draw.circle(sparkle_surface, (255, 255, 200, alpha), (size * 2, size * 2), size)
-            pygame.draw.circle(sparkle_surface, (255, 255, 255, alpha // 2), (size * 2, size * 2), size // 2)
-            
-            self.background.blit(sparkle_surface, (x - size * 2, y - size * 2), special_flags=pygame.BLEND_ADD)
+            if size <= 0:
+                continue
+            self.displaysurface.blit(self.sparkle_sprites[size], (x - size * 2, y - size * 2),
+                                     special_flags=pygame.BLEND_ADD)
 
     def update_particles(self):
-        self.time += 0.05
-        self.particle_time += 1
-        
+        # 3 unidades de tempo e 60 graus por segundo (antes: +0.05 e +1 por frame a 60 FPS)
+        elapsed = (pygame.time.get_ticks() - self.start_ticks) / 1000
+        self.time = elapsed * 3
+
         center_x = WIDTH * 0.5
         center_y = HEIGTH * 0.6
-        
+
         for particle in self.particles:
             # Rotate particles around center
-            particle['angle'] += 1
-            new_radius = particle['radius'] + math.sin(self.time + particle['angle'] * 0.1) * 20
-            
-            particle['x'] = center_x + math.cos(math.radians(particle['angle'])) * new_radius
-            particle['y'] = center_y + math.sin(math.radians(particle['angle'])) * new_radius
-            
+            angle = particle['angle'] + elapsed * 60
+            new_radius = particle['radius'] + math.sin(self.time + angle * 0.1) * 20
+
+            particle['x'] = center_x + math.cos(math.radians(angle)) * new_radius
+            particle['y'] = center_y + math.sin(math.radians(angle)) * new_radius
+
             # Pulsing effect
-            particle['size'] = 2 + math.sin(self.time * 3 + particle['angle'] * 0.05) * 2
+            particle['size'] = 2 + math.sin(self.time * 3 + angle * 0.05) * 2
 
     def draw_loading_effects(self):
         # Draw mystical particles
         for particle in self.particles:
             pygame.draw.circle(
-                self.displaysurface, 
-                particle['color'], 
-                (int(particle['x']), int(particle['y'])), 
+                self.displaysurface,
+                particle['color'],
+                (int(particle['x']), int(particle['y'])),
                 int(particle['size'])
             )
-        
+
         # Draw central loading circle (brighter for visibility)
         center_x = WIDTH // 2
         center_y = HEIGTH * 0.6
-        
+
         # Outer glowing ring (brighter colors)
         for i in range(4):
             pygame.draw.circle(
-                self.displaysurface, 
-                (100 + i * 40, 150 + i * 30, 255), 
-                (int(center_x), int(center_y)), 
-                int(90 - i * 15 + math.sin(self.time * 2) * 8), 
+                self.displaysurface,
+                (100 + i * 40, 150 + i * 30, 255),
+                (int(center_x), int(center_y)),
+                int(90 - i * 15 + math.sin(self.time * 2) * 8),
                 4
             )
-        
-        # Loading text with glow effect
-        loading_texts = [
-            "Carregando...",
-            "Preparando Aventura...", 
-            "Invocando Magias...",
-            "Carregando Relíquias..."
-        ]
-        
-        current_text = loading_texts[int(self.time * 0.5) % len(loading_texts)]
-        
-        # Main text with modern rendering
-        text_surface, text_rect = professional_renderer.render_text_professional(
-            current_text, 'subtitle', TEXT_COLOR,
-            shadow=True, glow=True, anti_alias=True
-        )
-        text_rect.center = (center_x, center_y + 100)
+
+        # Mensagem de quem está carregando, ou os textos de ambientação
+        current_text = self.message or LOADING_TEXTS[int(self.time * 0.5) % len(LOADING_TEXTS)]
+        text_surface = self.render_text(current_text, 'subtitle', shadow=True, glow=True)
+        text_rect = text_surface.get_rect(center=(center_x, center_y + 100))
         self.displaysurface.blit(text_surface, text_rect)
-        
+
         # Progress dots with modern rendering
         dots = "." * (int(self.time * 2) % 4)
-        dots_surface, dots_rect = professional_renderer.render_text_professional(
-            dots, 'text', TEXT_COLOR,
-            shadow=True, anti_alias=True
-        )
-        dots_rect.center = (center_x + text_rect.width // 2 + 20, center_y + 100)
-        self.displaysurface.blit(dots_surface, dots_rect)
+        if dots:
+            dots_surface = self.render_text(dots, 'text', shadow=True)
+            dots_rect = dots_surface.get_rect(center=(center_x + text_rect.width // 2 + 20, center_y + 100))
+            self.displaysurface.blit(dots_surface, dots_rect)
+
+        if self.progress is not None:
+            self.draw_progress_bar(center_x, center_y + 140)
+
+    def draw_progress_bar(self, center_x, top):
+        """Barra com o progresso real do carregamento"""
+        bar_rect = pygame.Rect(0, 0, 360, 12)
+        bar_rect.midtop = (center_x, top)
+        pygame.draw.rect(self.displaysurface, UI_BG_COLOR, bar_rect)
+        fill_rect = bar_rect.inflate(-4, -4)
+        fill_rect.width = int(fill_rect.width * self.progress)
+        if fill_rect.width > 0:
+            pygame.draw.rect(self.displaysurface, (100, 200, 255), fill_rect)
+        pygame.draw.rect(self.displaysurface, UI_BORDER_COLOR, bar_rect, 2)
 
     def update(self):
-        self.animate_background()
         self.update_particles()
-        self.music.play(-1)
-        
-        # Draw the background (home page with sparkles)
+
+        # Draw the background (home page already darkened) and the sparkles on top
         self.displaysurface.blit(self.background, (0, 0))
-        
-        # Apply semi-transparent overlay for better contrast
-        self.displaysurface.blit(self.overlay, (0, 0))
-        
+        self.draw_sparkles()
+
         # Draw loading effects on top
         self.draw_loading_effects()
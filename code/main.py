@@ -10,24 +10,30 @@ from pygame.locals import *
 # from intro import * # Removed - no longer using intro animations
 
 from loading import LoadingScreen
+from assets import asset_pipeline
 from modern_audio_controls import modern_audio_controls
 from audio_manager import audio_manager
 from clean_main_menu import get_clean_menu
-from story_screen import StoryScreen
 # CHEAT: Import cheat system for testing (remove for final version)
 from cheat_system import cheat_system
 # STATS: Import player statistics system
 from player_stats import player_stats
+from achievement_toast import achievement_toast
 from name_input_screen import NameInputScreenV2
-from stats_screen import StatsScreen
-from achievements_screen import AchievementsScreen
 from difficulty_manager import difficulty_manager
-from difficulty_screen import DifficultyScreen
 from save_manager import save_manager
-from save_screen import SaveScreen
 from font_manager import font_manager
 from graphics_manager import GraphicsManager
+from game_clock import FixedTimestep
+from frame_profiler import frame_profiler
 from tutorial_system import tutorial_system
+from lazy_import import lazy_module
+# Telas fora do caminho até o primeiro frame: importadas quando forem abertas
+story_screen = lazy_module('story_screen')
+stats_screen = lazy_module('stats_screen')
+achievements_screen = lazy_module('achievements_screen')
+difficulty_screen = lazy_module('difficulty_screen')
+save_screen = lazy_module('save_screen')
 # Sistema de limpeza automática ao sair
 import cleanup_on_exit
 # pygame.mixer.pre_init(44100, 16, 2, 4096)
@@ -37,6 +43,7 @@ class Game:
     def __init__(self):
         pygame.mixer.pre_init(44100, 16, 2, 4096)
         pygame.init()
+        audio_manager.reserve_music_channels()  # ex.: a música do loading não cai num deck
         
         # Inicializar sistema de gráficos
         self.graphics_manager = GraphicsManager()
@@ -49,11 +56,25 @@ class Game:
         
         pygame.display.set_caption('CORRIDA PELA RELÍQUIA')
         self.clock = pygame.time.Clock()
+        # Simulação em passo fixo (TICK_RATE), renderização no limite de FPS configurado
+        self.timestep = FixedTimestep()
+        self.frame_time = 0.0
 
-        self.level1 = Level1()
-        self.level2 = Level2()
-        self.level3 = Level3()
-        self.level4 = Level4()
+        # Tela de carregamento com o progresso real: primeiro os assets das
+        # quatro fases (decodificados em threads), depois a montagem das fases
+        self.loading = LoadingScreen()
+        self.loading.start()
+        job = asset_pipeline.preload(['level1', 'level2', 'level3', 'level4'])
+        steps = job.total + 4
+        while not job.poll(budget_ms=12):
+            self.show_loading_progress(job.done, steps, "Carregando recursos")
+        levels = []
+        for number, level_class in enumerate((Level1, Level2, Level3, Level4), start=1):
+            self.show_loading_progress(job.total + number - 1, steps, f"Construindo a fase {number}")
+            levels.append(level_class())
+        self.show_loading_progress(steps, steps, "Pronto!")
+        self.loading.stop()
+        self.level1, self.level2, self.level3, self.level4 = levels
         # Intro animations removed - going directly to levels
 
         # Transition variables
@@ -65,7 +86,6 @@ class Game:
         self.homescreen_image = pygame.image.load('../graphics/ui/home page.jpg').convert()
         self.homescreen_image = pygame.transform.scale(self.homescreen_image,(1280,720))
         self.gameover_image = pygame.image.load('../graphics/ui/gameover.jpg').convert()
-        self.loading = LoadingScreen()
         self.gameover_image_rect = self.gameover_image.get_rect()
         self.homescreen_rect = self.homescreen_image.get_rect()
         # STATS: Start with name input if no name is set, otherwise homescreen
@@ -89,15 +109,16 @@ class Game:
         
         # STATS: Name input screen and stats screen
         self.name_input_screen = NameInputScreenV2()
-        self.stats_screen = StatsScreen()
-        self.achievements_screen = AchievementsScreen()
-        self.difficulty_screen = DifficultyScreen()
-        self.save_screen = None  # Will be initialized when needed
+        self.stats_screen = None  # Will be initialized when needed
+        self.achievements_screen = None
+        self.difficulty_screen = None
+        self.save_screen = None
         
         # Use AudioManager for music control
-        audio_manager.play_music('../audio/home.mp3')
+        self.play_home_music()
         
         # STATS: Initialize player stats session
+        player_stats.achievements.add_listener(achievement_toast.notify)
         player_stats.start_session()
 
 
@@ -139,27 +160,27 @@ class Game:
                 
                 if event.key == pygame.K_RETURN:
                     # Allow ENTER key to start game
-                    audio_manager.play_music('../audio/Ambient 2.mp3')
+                    self.play_level_music(1)
                     self.game_state = 3  # Go to Level 1
                     return
                 elif event.key == pygame.K_1:
                     # Ir direto para Level 1
-                    audio_manager.play_music('../audio/Ambient 2.mp3')
+                    self.play_level_music(1)
                     self.game_state = 3
                     return
                 elif event.key == pygame.K_2:
                     # Ir direto para Level 2
-                    audio_manager.play_music('../audio/Ambient 2.mp3')
+                    self.play_level_music(2)
                     self.game_state = 4
                     return
                 elif event.key == pygame.K_3:
                     # Ir direto para Level 3
-                    audio_manager.play_music('../audio/darkambience(from fable).mp3')
+                    self.play_level_music(3)
                     self.game_state = 5
                     return
                 elif event.key == pygame.K_4:
                     # Ir direto para Level 4
-                    audio_manager.play_music('../audio/home.mp3')
+                    self.play_level_music(4)
                     self.game_state = 6
                     return
                 elif event.key == pygame.K_s:
@@ -189,7 +210,7 @@ class Game:
                 if menu_event_action == "start_game":
                     # Show intro story first
                     if not hasattr(self, 'intro_story_shown'):
-                        story = StoryScreen("intro", custom_background="../graphics/ui/home page.jpg")
+                        story = story_screen.StoryScreen("intro", custom_background="../graphics/ui/home page.jpg")
                         story_finished = False
                         while not story_finished:
                             story_finished = story.update()
@@ -200,7 +221,7 @@ class Game:
                         self.intro_story_shown = True
                     
                     # Start the game
-                    audio_manager.play_music('../audio/Ambient 2.mp3')
+                    self.play_level_music(1)
                     self.game_state = 3  # Go to Level 1
                     return
                 elif menu_event_action == "quit_game":
@@ -233,7 +254,7 @@ class Game:
         if menu_action == "start_game":
             # Show intro story first
             if not hasattr(self, 'intro_story_shown'):
-                story = StoryScreen("intro", custom_background="../graphics/ui/home page.jpg")
+                story = story_screen.StoryScreen("intro", custom_background="../graphics/ui/home page.jpg")
                 story_finished = False
                 while not story_finished:
                     story_finished = story.update()
@@ -244,7 +265,7 @@ class Game:
                 self.intro_story_shown = True
             
             # Start the game
-            audio_manager.play_music('../audio/Ambient 2.mp3')
+            self.play_level_music(1)
             self.game_state = 3  # Go to Level 1
         elif menu_action == "quit_game":
             pygame.quit()
@@ -279,7 +300,7 @@ class Game:
                     return
                 elif event.key == pygame.K_RETURN or event.key == pygame.K_SPACE:
                     self.game_state = 0  # Return to main menu
-                    audio_manager.play_music('../audio/home.mp3')
+                    self.play_home_music()
                     self.reset_game()
                     return
             elif event.type == pygame.QUIT:
@@ -312,29 +333,63 @@ class Game:
         if hasattr(self, 'level4_story_shown'):
             del self.level4_story_shown
     
+    def show_loading_progress(self, done, total, message):
+        """Desenha um frame da tela de carregamento entre etapas de carga"""
+        pygame.event.pump()  # mantém a janela respondendo durante a carga
+        self.loading.set_progress(done, total, message)
+        self.loading.update()
+        pygame.display.update()
+
+    def play_level_music(self, number):
+        """Música da fase `number`, já decodificando a da fase seguinte"""
+        audio_manager.play_music(f'level{number}')
+        audio_manager.prefetch_music(f'level{number + 1}' if number < 4 else 'home')
+
+    def play_home_music(self):
+        """Música do menu, já decodificando a da primeira fase"""
+        audio_manager.play_music('home')
+        audio_manager.prefetch_music('level1')
+
     # CHEAT: Handle cheat actions from levels (remove for final version)
     def handle_cheat_action(self, cheat_action):
         """Handle cheat actions from levels"""
         if cheat_action == "level1":
-            audio_manager.play_music('../audio/Ambient 2.mp3')
+            self.play_level_music(1)
             self.game_state = 3
         elif cheat_action == "level2":
-            audio_manager.play_music('../audio/Ambient 2.mp3')
+            self.play_level_music(2)
             self.game_state = 4
         elif cheat_action == "level3":
-            audio_manager.play_music('../audio/darkambience(from fable).mp3')
+            self.play_level_music(3)
             self.game_state = 5
         elif cheat_action == "level4":
-            audio_manager.play_music('../audio/home.mp3')
+            self.play_level_music(4)
             self.game_state = 6
         elif cheat_action == "home":
-            audio_manager.play_music('../audio/home.mp3')
+            self.play_home_music()
             self.game_state = 0
             self.reset_game()
 
+    def run_level(self, level):
+        """Avança a fase em passos fixos e desenha o estado interpolado"""
+        with frame_profiler.scope('input'):
+            level.handle_events()
+        for _ in range(self.timestep.advance(self.frame_time)):
+            level.update()
+            if level.completed or level.gameover:
+                break
+        level.draw(self.timestep.alpha)
+        achievement_toast.draw(self.screen)
+        # Draw audio controls in level
+        with frame_profiler.scope('audio controls'):
+            modern_audio_controls.draw(self.screen)
+        frame_profiler.draw(self.screen)
+
     def run(self):
 
         while True:
+            frame_profiler.begin_frame()
+
             # Handle events based on game state
             if self.game_state == -1:  # Name input screen
                 events = pygame.event.get()
@@ -347,43 +402,49 @@ class Game:
             elif self.game_state == 0:  # Homescreen - events handled in homescreen() method
                 pass  # Events are handled inside homescreen()
             else:  # In levels - handle QUIT and CHEAT events, let levels handle the rest
-                events_for_level = []
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-                    elif event.type == pygame.KEYDOWN:
-                        # CHEAT: Handle cheat codes in main loop (remove for final version)
-                        cheat_action = cheat_system.handle_cheat_input(event)
-                        if cheat_action:
-                            self.handle_cheat_action(cheat_action)
-                            continue  # Don't pass this event to level
+                with frame_profiler.scope('input'):
+                    events_for_level = []
+                    for event in pygame.event.get():
+                        if event.type == pygame.QUIT:
+                            pygame.quit()
+                            sys.exit()
+                        elif event.type == pygame.KEYDOWN:
+                            # CHEAT: Handle cheat codes in main loop (remove for final version)
+                            cheat_action = cheat_system.handle_cheat_input(event)
+                            if cheat_action:
+                                self.handle_cheat_action(cheat_action)
+                                continue  # Don't pass this event to level
                         
-                        # Save/Load controls during game
-                        if event.key == pygame.K_F5:
-                            # Quick save
-                            if save_manager.quick_save(self):
-                                print("💾 Quick save realizado!")
-                            continue
-                        elif event.key == pygame.K_F9:
-                            # Quick load (go to load screen)
-                            self.game_state = 50
-                            continue
-                        elif event.key == pygame.K_F6:
-                            # Save screen
-                            self.game_state = 51
-                            continue
+                            # Profiler overlay
+                            if event.key == pygame.K_F3:
+                                frame_profiler.toggle()
+                                continue
+
+                            # Save/Load controls during game
+                            if event.key == pygame.K_F5:
+                                # Quick save
+                                if save_manager.quick_save(self):
+                                    print("💾 Quick save realizado!")
+                                continue
+                            elif event.key == pygame.K_F9:
+                                # Quick load (go to load screen)
+                                self.game_state = 50
+                                continue
+                            elif event.key == pygame.K_F6:
+                                # Save screen
+                                self.game_state = 51
+                                continue
                     
-                    # Handle audio controls in levels
-                    if modern_audio_controls.handle_event(event):
-                        continue  # Event consumed by audio controls
+                        # Handle audio controls in levels
+                        if modern_audio_controls.handle_event(event):
+                            continue  # Event consumed by audio controls
                     
-                    # Put non-consumed events back for the level to handle
-                    events_for_level.append(event)
+                        # Put non-consumed events back for the level to handle
+                        events_for_level.append(event)
                 
-                # Repost events for levels
-                for event in events_for_level:
-                    pygame.event.post(event)
+                    # Repost events for levels
+                    for event in events_for_level:
+                        pygame.event.post(event)
 
             self.screen.fill((0, 0, 0))  # Fill with black
 
@@ -397,7 +458,7 @@ class Game:
             elif self.game_state == 3:  # Level 1 (skipped intro animations)
                 # Mostrar história antes da fase 1
                 if not hasattr(self, 'level1_story_shown'):
-                    story = StoryScreen("phase_1", custom_background="../map new/map.png")
+                    story = story_screen.StoryScreen("phase_1", custom_background="../map new/map.png")
                     story_finished = False
                     while not story_finished:
                         story_finished = story.update()
@@ -407,9 +468,7 @@ class Game:
                                 sys.exit()
                     self.level1_story_shown = True
                 
-                self.level1.run()
-                # Draw audio controls in level
-                modern_audio_controls.draw(self.screen)
+                self.run_level(self.level1)
                 if self.level1.gameover:
                     audio_manager.stop_music()
                     self.game_state = 20  # Game over, return to homescreen
@@ -419,13 +478,14 @@ class Game:
                     # Auto-save progress
                     save_manager.auto_save(self)
                     self.transition_start_time = pygame.time.get_ticks()
+                    self.play_level_music(2)
                     self.game_state = 4  # Set game state to transition
 
 
             elif self.game_state == 4:  # Level 2 (simplified)
                 # Mostrar história antes da fase 2
                 if not hasattr(self, 'level2_story_shown'):
-                    story = StoryScreen("phase_2", custom_background="../map new/maze1.png")
+                    story = story_screen.StoryScreen("phase_2", custom_background="../map new/maze1.png")
                     story_finished = False
                     while not story_finished:
                         story_finished = story.update()
@@ -435,9 +495,7 @@ class Game:
                                 sys.exit()
                     self.level2_story_shown = True
                 
-                self.level2.run()
-                # Draw audio controls in level
-                modern_audio_controls.draw(self.screen)
+                self.run_level(self.level2)
                 if self.level2.gameover:
                     self.game_state = 20
                     audio_manager.stop_music()
@@ -447,12 +505,12 @@ class Game:
                     # Auto-save progress
                     save_manager.auto_save(self)
                     self.game_state = 5  # Go to Level 3
-                    audio_manager.play_music('../audio/darkambience(from fable).mp3')
+                    self.play_level_music(3)
 
             elif self.game_state == 5:  # Level 3 (simplified)
                 # Mostrar história antes da fase 3
                 if not hasattr(self, 'level3_story_shown'):
-                    story = StoryScreen("phase_3", custom_background="../map new/dungeon.png")
+                    story = story_screen.StoryScreen("phase_3", custom_background="../map new/dungeon.png")
                     story_finished = False
                     while not story_finished:
                         story_finished = story.update()
@@ -462,21 +520,19 @@ class Game:
                                 sys.exit()
                     self.level3_story_shown = True
                 
-                self.level3.run()
-                # Draw audio controls in level
-                modern_audio_controls.draw(self.screen)
+                self.run_level(self.level3)
                 if self.level3.completed:
                     # STATS: Record level completion
                     player_stats.complete_level(3)
                     # Auto-save progress
                     save_manager.auto_save(self)
                     self.game_state = 6  # Go to Level 4
-                    audio_manager.play_music('../audio/home.mp3')
+                    self.play_level_music(4)
 
             elif self.game_state == 6:  # Level 4 (simplified)
                 # Mostrar história antes da fase 4
                 if not hasattr(self, 'level4_story_shown'):
-                    story = StoryScreen("phase_4", custom_background="../map new/final.png")
+                    story = story_screen.StoryScreen("phase_4", custom_background="../map new/final.png")
                     story_finished = False
                     while not story_finished:
                         story_finished = story.update()
@@ -486,16 +542,14 @@ class Game:
                                 sys.exit()
                     self.level4_story_shown = True
                 
-                self.level4.run()
-                # Draw audio controls in level
-                modern_audio_controls.draw(self.screen)
+                self.run_level(self.level4)
                 if self.level4.completed:
                     # STATS: Record level completion and game completion
                     player_stats.complete_level(4)
                     # Auto-save final progress
                     save_manager.auto_save(self)
                     # Mostrar história de vitória
-                    story = StoryScreen("victory", custom_background="../graphics/ui/home page.jpg")
+                    story = story_screen.StoryScreen("victory", custom_background="../graphics/ui/home page.jpg")
                     story_finished = False
                     while not story_finished:
                         story_finished = story.update()
@@ -515,12 +569,14 @@ class Game:
                 # Don't reset automatically - let gameover() handle it
             
             elif self.game_state == 30:  # Statistics Screen
+                if self.stats_screen is None:
+                    self.stats_screen = stats_screen.StatsScreen()
                 events = pygame.event.get()
                 result = self.stats_screen.handle_events(events)
                 if result == 'main_menu':
                     self.game_state = 0  # Return to homescreen
                     # Refresh stats screen for next time
-                    self.stats_screen = StatsScreen()
+                    self.stats_screen = None
                 elif result == 'achievements':
                     self.game_state = 31  # Go to achievements screen
                 elif result == 'quit':
@@ -530,12 +586,14 @@ class Game:
                     self.stats_screen.draw()
             
             elif self.game_state == 31:  # Achievements Screen
+                if self.achievements_screen is None:
+                    self.achievements_screen = achievements_screen.AchievementsScreen()
                 events = pygame.event.get()
                 result = self.achievements_screen.handle_events(events)
                 if result == 'stats':
                     self.game_state = 30  # Return to stats screen
                     # Refresh achievements screen for next time
-                    self.achievements_screen = AchievementsScreen()
+                    self.achievements_screen = None
                 elif result == 'quit':
                     pygame.quit()
                     sys.exit()
@@ -543,12 +601,14 @@ class Game:
                     self.achievements_screen.draw()
             
             elif self.game_state == 40:  # Difficulty Screen
+                if self.difficulty_screen is None:
+                    self.difficulty_screen = difficulty_screen.DifficultyScreen()
                 events = pygame.event.get()
                 result = self.difficulty_screen.handle_events(events)
                 if result == 'main_menu' or result == 'confirm':
                     self.game_state = 0  # Return to homescreen
                     # Refresh difficulty screen for next time
-                    self.difficulty_screen = DifficultyScreen()
+                    self.difficulty_screen = None
                 elif result == 'quit':
                     pygame.quit()
                     sys.exit()
@@ -558,7 +618,7 @@ class Game:
             elif self.game_state == 50:  # Save/Load Screen
                 # Initialize save screen if needed
                 if self.save_screen is None:
-                    self.save_screen = SaveScreen("load")
+                    self.save_screen = save_screen.SaveScreen("load")
                 
                 events = pygame.event.get()
                 result = self.save_screen.handle_events(events)
@@ -592,7 +652,7 @@ class Game:
             elif self.game_state == 51:  # Save Screen
                 # Initialize save screen if needed
                 if self.save_screen is None:
-                    self.save_screen = SaveScreen("save")
+                    self.save_screen = save_screen.SaveScreen("save")
                 
                 events = pygame.event.get()
                 result = self.save_screen.handle_events(events)
@@ -617,21 +677,24 @@ class Game:
                     if save_manager.delete_save(slot):
                         print(f"🗑️ Save slot {slot} deletado")
                         # Refresh save screen
-                        self.save_screen = SaveScreen("save")
+                        self.save_screen = save_screen.SaveScreen("save")
                 elif result == 'quit':
                     pygame.quit()
                     sys.exit()
                 else:
                     self.save_screen.update(self.clock.get_time())
                     self.save_screen.draw()
-            pygame.display.update()
+            audio_manager.update()  # troca de música quando a faixa nova fica pronta
+            with frame_profiler.scope('display flip'):
+                pygame.display.update()
+            frame_profiler.end_frame()
             
             # Usar FPS dinâmico baseado nas configurações gráficas
             fps_limit = self.graphics_manager.get_fps_limit()
             if fps_limit > 0:
-                self.clock.tick(fps_limit)
+                self.frame_time = self.clock.tick(fps_limit) / 1000.0
             else:
-                self.clock.tick()  # Sem limite de FPS
+                self.frame_time = self.clock.tick() / 1000.0  # Sem limite de FPS
 
 if __name__ == '__main__':
     game = Game()
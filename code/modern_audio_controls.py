@@ -8,6 +8,7 @@ from typing import Tuple, Optional
 from audio_manager import audio_manager
 from graphics_manager import GraphicsManager
 from icon_manager import icon_manager
+import gradients
 
 
 class ModernAudioControls:
@@ -54,6 +55,10 @@ class ModernAudioControls:
             'gear_rotation': 0.0,
         }
         
+        # Fundo do painel: gradiente opaco copiado uma vez (por tamanho); o fade
+        # do slide usa set_alpha nele em vez de um gradiente novo por frame
+        self.panel_background = None
+        
         # Fontes
         self._load_fonts()
         
@@ -415,14 +420,12 @@ class ModernAudioControls:
     
     def _draw_button_background(self, screen: pygame.Surface, rect: pygame.Rect, is_hovered: bool) -> None:
         """Desenha fundo do botão com gradiente."""
-        # Gradiente
-        for i in range(rect.height):
-            ratio = i / rect.height
-            if is_hovered:
-                color = self._lerp_color(self.colors['surface'], self.colors['hover'], ratio * 0.3)
-            else:
-                color = self._lerp_color(self.colors['background'], self.colors['surface'], ratio * 0.5)
-            pygame.draw.line(screen, color, (rect.x, rect.y + i), (rect.right, rect.y + i))
+        # Gradiente (só avança 30% / 50% do caminho até a segunda cor)
+        if is_hovered:
+            top, bottom = self.colors['surface'], self._lerp_color(self.colors['surface'], self.colors['hover'], 0.3)
+        else:
+            top, bottom = self.colors['background'], self._lerp_color(self.colors['background'], self.colors['surface'], 0.5)
+        screen.blit(gradients.linear_gradient(rect.width + 1, rect.height, top, bottom), rect.topleft)
         
         # Borda
         border_color = self.colors['primary'] if is_hovered else self.colors['text_secondary']
@@ -435,21 +438,16 @@ class ModernAudioControls:
         panel_rect = self.audio_panel_rect.copy()
         panel_rect.x += slide_offset
         
-        # Background do painel com transparência
-        panel_surface = pygame.Surface((panel_rect.width, panel_rect.height), pygame.SRCALPHA)
-        
-        # Gradiente de fundo
-        for i in range(panel_rect.height):
-            ratio = i / panel_rect.height
-            color = self._lerp_color(self.colors['background'], self.colors['surface'], ratio * 0.7)
-            alpha_color = (*color, int(240 * self.animations['panel_slide']))
-            pygame.draw.line(panel_surface, alpha_color, (0, i), (panel_rect.width, i))
-        
-        # Borda do painel
-        pygame.draw.rect(panel_surface, self.colors['primary'], 
-                        (0, 0, panel_rect.width, panel_rect.height), 2, border_radius=12)
+        # Background do painel com transparência e gradiente de fundo
+        if self.panel_background is None or self.panel_background.get_size() != panel_rect.size:
+            bottom = self._lerp_color(self.colors['background'], self.colors['surface'], 0.7)
+            self.panel_background = gradients.linear_gradient(panel_rect.width, panel_rect.height,
+                                                              self.colors['background'], bottom).copy()
+        self.panel_background.set_alpha(int(240 * self.animations['panel_slide']))
+        screen.blit(self.panel_background, panel_rect)
         
-        screen.blit(panel_surface, panel_rect)
+        # Borda do painel (opaca, por cima do fundo translúcido)
+        pygame.draw.rect(screen, self.colors['primary'], panel_rect, 2, border_radius=12)
         
         # Conteúdo do painel
         alpha = int(255 * self.animations['panel_slide'])
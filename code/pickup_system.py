@@ -0,0 +1,127 @@
+from spatial_hash import SpatialHash
+from particles import CollectParticle, GemCollectAnimation, FloatingText
+# STATS: Import player statistics system
+from player_stats import player_stats
+from audio_manager import audio_manager
+
+# Feedback visual de cada tipo de coleta: cor das partículas, quantidade e texto flutuante
+PICKUP_FEEDBACK = {
+    'health': {'particle_color': (255, 100, 100), 'particles': 10, 'text': "+VIDA", 'text_color': (255, 100, 100), 'size': 16},
+    'speed': {'particle_color': (100, 100, 255), 'particles': 10, 'text': "+VELOCIDADE", 'text_color': (100, 255, 100), 'size': 16},
+    'attack': {'particle_color': (255, 200, 100), 'particles': 10, 'text': "+ATAQUE", 'text_color': (255, 200, 100), 'size': 16},
+    'gem': {'particle_color': (220, 180, 255), 'particles': 20, 'text': "PEDRA MÍSTICA!", 'text_color': (220, 180, 255), 'size': 24},
+    'key': {'particle_color': (255, 215, 0), 'particles': 10, 'text': "+CHAVE", 'text_color': (255, 215, 0), 'size': 18},
+}
+
+
+class PickupSystem:
+    """Coletas do jogador (orbs, chaves, pedra, porta e saída) num só lugar.
+
+    Todos os coletáveis de uma fase ficam num SpatialHash; a cada tick uma única
+    consulta ao redor do jogador encontra o que ele está tocando e despacha para
+    o handler do tipo correspondente.
+    """
+
+    def __init__(self, level, exit_message=None, cell_size=128):
+        self.level = level
+        self.exit_message = exit_message
+        self.index = SpatialHash(cell_size)
+        self.kinds = {}  # sprite -> tipo de coleta
+
+        self.handlers = {
+            'health': self.collect_health,
+            'speed': self.collect_speed,
+            'attack': self.collect_attack,
+            'gem': self.collect_gem,
+            'key': self.collect_key,
+            'door': self.touch_door,
+            'next': self.touch_exit,
+        }
+
+    def clear(self):
+        self.index.clear()
+        self.kinds.clear()
+
+    def register(self, group, kind):
+        """Indexa todos os sprites de um grupo como coletáveis do tipo `kind`"""
+        for sprite in group:
+            self.index.insert(sprite)
+            self.kinds[sprite] = kind
+
+    def remove(self, sprite):
+        sprite.kill()
+        self.index.remove(sprite)
+        self.kinds.pop(sprite, None)
+
+    def resolve(self, player):
+        """Uma consulta local por tick; a margem cobre frames de animação maiores"""
+        player_rect = player.rect
+        for sprite in self.index.query(player_rect.inflate(64, 64)):
+            if player_rect.colliderect(sprite.rect):
+                self.handlers[self.kinds[sprite]](sprite, player)
+
+    def collect(self, sprite, kind):
+        """Remove o item e cria a animação, partículas e texto flutuante"""
+        feedback = PICKUP_FEEDBACK[kind]
+        center = sprite.rect.center
+        self.remove(sprite)
+
+        # Create collection animation
+        GemCollectAnimation(center, [self.level.visible_sprites])
+        for _ in range(feedback['particles']):
+            CollectParticle(center, [self.level.visible_sprites], color=feedback['particle_color'])
+
+        # Animação de texto flutuante
+        FloatingText(center, [self.level.floating_text_sprites], feedback['text'],
+                     color=feedback['text_color'], size=feedback['size'])
+        audio_manager.play_sound('heal', 'collection')
+
+    # Handlers por tipo
+    def collect_health(self, sprite, player):
+        self.collect(sprite, 'health')
+        player.inventory["healthOrbs"] += 1
+        # STATS: Record health orb collection
+        player_stats.record_orb_collection("health_orbs")
+        if player.health < 450:
+            player.health += 50
+        else:
+            player.health = 500
+
+    def collect_speed(self, sprite, player):
+        self.collect(sprite, 'speed')
+        player.inventory["speedOrbs"] += 1
+        # STATS: Record speed orb collection
+        player_stats.record_orb_collection("speed_orbs")
+        player.speed += 0.4
+        player.animation_speed += 0.04
+
+    def collect_attack(self, sprite, player):
+        self.collect(sprite, 'attack')
+        player.inventory["attackOrbs"] += 1
+        # STATS: Record attack orb collection
+        player_stats.record_orb_collection("attack_orbs")
+        player.attack += 10
+
+    def collect_gem(self, sprite, player):
+        self.collect(sprite, 'gem')
+        player.inventory['zappaguriStone'] = 1
+        # STATS: Record gem collection
+        player_stats.record_gem_collected()
+
+    def collect_key(self, sprite, player):
+        self.collect(sprite, 'key')
+        player.inventory["keys"] += 1
+        # STATS: Record key found
+        player_stats.record_key_found()
+
+    def touch_door(self, sprite, player):
+        if player.inventory['keys'] < 4:
+            self.level.ui.set_status_message('Você precisa de 4 chaves para abrir esta porta!')
+        else:
+            self.remove(sprite)
+            self.level.ui.set_status_message('Porta Aberta!')
+
+    def touch_exit(self, sprite, player):
+        self.level.completed = True
+        if self.exit_message:
+            self.level.ui.set_status_message(self.exit_message)
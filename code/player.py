@@ -1,14 +1,19 @@
 import pygame 
 from settings import *
 from support import import_folder
+from assets import asset_pipeline
 from entity import Entity
 from difficulty_manager import difficulty_manager
 from audio_manager import audio_manager
+from timer_scheduler import timer_scheduler
+from utils.logger import game_logger
+from frame_profiler import frame_profiler
+from input_source import input_router
 
 class Player(Entity):
 	def __init__(self,pos,groups,obstacle_sprites,create_attack,destroy_attack,create_magic):
 		super().__init__(groups)
-		self.image = pygame.image.load('../graphics/player/down_idle/tile000.png').convert_alpha()
+		self.image = asset_pipeline.image('../graphics/player/down_idle/tile000.png')
 		self.image = pygame.transform.scale2x(self.image)
 		self.rect = self.image.get_rect(topleft = pos)
 		self.hitbox = self.rect.inflate(-100,-52)
@@ -22,6 +27,7 @@ class Player(Entity):
 		self.attacking = False
 		self.attack_cooldown = 200
 		self.attack_time = 25
+		self.attack_timer = None
 		self.obstacle_sprites = obstacle_sprites
 		# Audio now handled by AudioManager - removed walking_sound
 		# weapon
@@ -58,6 +64,14 @@ class Player(Entity):
 		self.vulnerable = True
 		self.hurt_time = None
 		self.invulnerability_duration = 500
+		self.invulnerability_timer = None
+
+	def kill(self):
+		# timers pendentes não podem chamar de volta uma fase descartada
+		timer_scheduler.cancel(self.attack_timer)
+		timer_scheduler.cancel(self.invulnerability_timer)
+		self.attack_timer = self.invulnerability_timer = None
+		super().kill()
 
 	def import_player_assets(self):
 		character_path = '../graphics/player/'
@@ -71,7 +85,7 @@ class Player(Entity):
 
 	def input(self):
 		self.speedmod = 0
-		keys = pygame.key.get_pressed()
+		keys = input_router.get_pressed()
 		if not self.attacking:
 			self.speedmod = 0
 
@@ -111,15 +125,13 @@ class Player(Entity):
 
 			# attack input - prevent overlapping animations
 			if keys[pygame.K_SPACE] and not self.attacking:
-				print('SPACE UP')
-				self.attacking = True
-				self.attack_time = pygame.time.get_ticks()
+				game_logger.debug('SPACE UP')
+				self.start_attack_cooldown()
 				self.create_attack()
 
 			# magic input - prevent overlapping with attacks
 			if keys[pygame.K_LCTRL] and not self.attacking:
-				self.attacking = True
-				self.attack_time = pygame.time.get_ticks()
+				self.start_attack_cooldown()
 				style = list(magic_data.keys())[self.magic_index]
 				strength = list(magic_data.values())[self.magic_index]['strength'] + self.stats['magic']
 				cost = list(magic_data.values())[self.magic_index]['cost']
@@ -127,7 +139,8 @@ class Player(Entity):
 
 			if keys[pygame.K_q] and self.can_switch_weapon:
 				self.can_switch_weapon = False
-				self.weapon_switch_time = pygame.time.get_ticks()
+				self.weapon_switch_time = timer_scheduler.now
+				timer_scheduler.schedule(self.switch_duration_cooldown, setattr, self, 'can_switch_weapon', True)
 
 				if self.weapon_index < len(list(weapon_data.keys())) - 1:
 					self.weapon_index += 1
@@ -137,11 +150,12 @@ class Player(Entity):
 				self.weapon = list(weapon_data.keys())[self.weapon_index]
 				# Mostrar nome da arma
 				weapon_names = {'sword': 'Espada', 'lance': 'Lança', 'axe': 'Machado', 'rapier': 'Florete', 'sai': 'Sai'}
-				print(f"Arma trocada para: {weapon_names.get(self.weapon, self.weapon)}")
+				game_logger.debug("Arma trocada para: %s", weapon_names.get(self.weapon, self.weapon))
 			#
 			if keys[pygame.K_e] and self.can_switch_magic:
 				self.can_switch_magic = False
-				self.magic_switch_time = pygame.time.get_ticks()
+				self.magic_switch_time = timer_scheduler.now
+				timer_scheduler.schedule(self.switch_duration_cooldown, setattr, self, 'can_switch_magic', True)
 
 				if self.magic_index < len(list(magic_data.keys())) - 1:
 					self.magic_index += 1
@@ -151,7 +165,7 @@ class Player(Entity):
 				self.magic = list(magic_data.keys())[self.magic_index]
 				# Mostrar nome da magia
 				magic_names = {'flame': 'Chama', 'heal': 'Cura'}
-				print(f"Magia trocada para: {magic_names.get(self.magic, self.magic)}")
+				game_logger.debug("Magia trocada para: %s", magic_names.get(self.magic, self.magic))
 
 	def get_status(self):
 
@@ -172,25 +186,22 @@ class Player(Entity):
 			if 'attack' in self.status:
 				self.status = self.status.replace('_attack','')
 
-	def cooldowns(self):
-		current_time = pygame.time.get_ticks()
+	# cooldowns are timers on the simulation clock - nothing is polled per frame
+	def start_attack_cooldown(self):
+		self.attacking = True
+		self.attack_time = timer_scheduler.now
+		self.attack_timer = timer_scheduler.schedule(self.attack_cooldown + weapon_data[self.weapon]['cooldown'], self.end_attack)
 
-		if self.attacking:
-			if current_time - self.attack_time >= self.attack_cooldown + weapon_data[self.weapon]['cooldown']:
-				self.attacking = False
-				self.destroy_attack()
-
-		if not self.can_switch_weapon:
-			if current_time - self.weapon_switch_time >= self.switch_duration_cooldown:
-				self.can_switch_weapon = True
-		#
-		if not self.can_switch_magic:
-			if current_time - self.magic_switch_time >= self.switch_duration_cooldown:
-				self.can_switch_magic = True
+	def end_attack(self):
+		self.attack_timer = None
+		self.attacking = False
+		self.destroy_attack()
 
-		if not self.vulnerable:
-			if current_time - self.hurt_time >= self.invulnerability_duration:
-				self.vulnerable = True
+	def start_invulnerability(self):
+		self.vulnerable = False
+		self.hurt_time = timer_scheduler.now
+		timer_scheduler.cancel(self.invulnerability_timer)
+		self.invulnerability_timer = timer_scheduler.schedule(self.invulnerability_duration, setattr, self, 'vulnerable', True)
 
 	def animate(self):
 		animation = self.animations[self.status]
@@ -218,8 +229,8 @@ class Player(Entity):
 		return base_damage + weapon_damage
 
 	def update(self):
-		self.input()
-		self.cooldowns()
+		with frame_profiler.scope('input'):
+			self.input()
 		self.get_status()
 		self.animate()
 		self.move(self.speed+self.speedmod)
\ No newline at end of file
@@ -1,18 +1,187 @@
+import atexit
 import json
 import os
+import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
+from achievements import AchievementEngine
+from utils.logger import game_logger
+
+# Gravação adiada: espera STATS_SAVE_DELAY sem novos pedidos, mas nunca mais
+# que STATS_SAVE_MAX_DELAY desde o primeiro pedido pendente
+STATS_SAVE_DELAY = 2.0
+STATS_SAVE_MAX_DELAY = 10.0
+
+# Contadores dos eventos de jogo: o código quente só incrementa uma posição de
+# uma lista; os valores vão para o dicionário aninhado em flush_counters()
+COUNTERS = (
+    ("combat_stats", "enemies_killed"),
+    ("combat_stats", "damage_dealt"),
+    ("combat_stats", "damage_taken"),
+    ("combat_stats", "deaths"),
+    ("combat_stats", "attacks_made"),
+    ("combat_stats", "magic_cast"),
+    ("combat_stats", "enemies_by_type", "golu"),
+    ("combat_stats", "enemies_by_type", "black"),
+    ("combat_stats", "enemies_by_type", "bigboi"),
+    ("combat_stats", "magic_by_type", "flame"),
+    ("combat_stats", "magic_by_type", "heal"),
+    ("equipment_stats", "weapon_usage", "sword"),
+    ("equipment_stats", "weapon_usage", "axe"),
+    ("equipment_stats", "weapon_usage", "lance"),
+    ("equipment_stats", "weapon_usage", "rapier"),
+    ("equipment_stats", "weapon_usage", "sai"),
+    ("collection_stats", "health_orbs"),
+    ("collection_stats", "attack_orbs"),
+    ("collection_stats", "speed_orbs"),
+    ("collection_stats", "keys_found"),
+    ("collection_stats", "eldritch_gems"),
+    ("performance", "steps_taken"),
+    ("performance", "distance_traveled"),
+)
+COUNTER_INDEX = {path: slot for slot, path in enumerate(COUNTERS)}
+
+
+def _slots(*prefix):
+    """Nome -> posição dos contadores logo abaixo de `prefix`"""
+    return {path[-1]: slot for slot, path in enumerate(COUNTERS)
+            if path[:-1] == prefix}
+
+
+ENEMIES_KILLED = COUNTER_INDEX[("combat_stats", "enemies_killed")]
+DAMAGE_DEALT = COUNTER_INDEX[("combat_stats", "damage_dealt")]
+DAMAGE_TAKEN = COUNTER_INDEX[("combat_stats", "damage_taken")]
+DEATHS = COUNTER_INDEX[("combat_stats", "deaths")]
+ATTACKS_MADE = COUNTER_INDEX[("combat_stats", "attacks_made")]
+MAGIC_CAST = COUNTER_INDEX[("combat_stats", "magic_cast")]
+KEYS_FOUND = COUNTER_INDEX[("collection_stats", "keys_found")]
+GEMS_COLLECTED = COUNTER_INDEX[("collection_stats", "eldritch_gems")]
+STEPS_TAKEN = COUNTER_INDEX[("performance", "steps_taken")]
+DISTANCE_TRAVELED = COUNTER_INDEX[("performance", "distance_traveled")]
+ENEMY_SLOTS = _slots("combat_stats", "enemies_by_type")
+MAGIC_SLOTS = _slots("combat_stats", "magic_by_type")
+WEAPON_SLOTS = _slots("equipment_stats", "weapon_usage")
+COLLECTION_SLOTS = _slots("collection_stats")
+
+# Série temporal por fase: uma amostra a cada STATS_SAMPLE_INTERVAL ms de
+# simulação com os contadores acumulados desde o início da fase
+STATS_SAMPLE_INTERVAL = 5000
+STATS_SERIES_LENGTH = 360  # 30 minutos por fase
+SERIES_FIELDS = ("time_s", "enemies_killed", "damage_dealt", "damage_taken",
+                 "deaths", "attacks_made", "magic_cast")
+SERIES_SLOTS = (ENEMIES_KILLED, DAMAGE_DEALT, DAMAGE_TAKEN, DEATHS, ATTACKS_MADE, MAGIC_CAST)
+COUNTER_PATHS = tuple('.'.join(path) for path in COUNTERS)  # tópicos das conquistas
+
+# Durante a fase os contadores vão para o dicionário (e para as conquistas)
+# no máximo a cada STATS_FLUSH_INTERVAL ms, não a cada evento
+STATS_FLUSH_INTERVAL = 250
+
+
+class StatsWriter:
+    """
+    Grava o JSON num thread de fundo: o jogo só entrega o texto já codificado.
+    Pedidos próximos viram uma gravação só, sempre da versão mais recente.
+    A escrita vai para um arquivo temporário (com fsync) que substitui o
+    original com os.replace, então o arquivo nunca fica pela metade.
+    """
+
+    def __init__(self, path: str, delay: float = STATS_SAVE_DELAY,
+                 max_delay: float = STATS_SAVE_MAX_DELAY):
+        self.path = path
+        self.temp_path = path + '.tmp'
+        self.delay = delay
+        self.max_delay = max_delay
+        self.pending = None        # texto esperando gravação
+        self.first_request = None  # quando o pedido pendente mais antigo chegou
+        self.due = None            # quando gravar
+        self.writes = 0
+        self._busy = False
+        self._running = True
+        self._wakeup = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="stats-writer", daemon=True)
+        self._thread.start()
+
+    def request(self, data: str) -> None:
+        """Agenda a gravação de `data` (substitui o que ainda não foi gravado)"""
+        now = time.monotonic()
+        with self._wakeup:
+            if self.pending is None:
+                self.first_request = now
+            self.pending = data
+            self.due = min(now + self.delay, self.first_request + self.max_delay)
+            self._wakeup.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._wakeup:
+                while self._running and (self.pending is None or time.monotonic() < self.due):
+                    self._wakeup.wait(None if self.pending is None else self.due - time.monotonic())
+                if self.pending is None:
+                    return
+                data, self.pending = self.pending, None
+                self._busy = True
+            try:
+                self._write(data)
+            except OSError as e:
+                game_logger.error("❌ Erro ao salvar estatísticas: %s", e)
+            with self._wakeup:
+                self._busy = False
+                self._wakeup.notify_all()
+
+    def _write(self, data: str) -> None:
+        with open(self.temp_path, 'w', encoding='utf-8') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(self.temp_path, self.path)
+        self.writes += 1
+        game_logger.info("💾 Estatísticas salvas com sucesso!")
+
+    def flush(self) -> None:
+        """Grava agora o que estiver pendente e espera terminar"""
+        with self._wakeup:
+            if self.pending is not None:
+                self.due = time.monotonic()
+                self._wakeup.notify_all()
+            while (self.pending is not None or self._busy) and self._thread.is_alive():
+                self._wakeup.wait(0.1)
+
+    def close(self) -> None:
+        """Grava o pendente e encerra o thread"""
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+
 class PlayerStats:
     def __init__(self):
         self.stats_file = "player_stats.json"
+        self.writer = StatsWriter(self.stats_file)
+        atexit.register(self.writer.close)
         self.session_start_time = time.time()
         self.level_start_time = None
         self.current_level = 1
         
+        # Contadores quentes (acumulados no processo) e o quanto já foi para self.stats
+        self.counts = [0] * len(COUNTERS)
+        self.flushed_counts = list(self.counts)
+        self.next_flush = 0.0
+        
+        # Conquistas: só as inscritas nos contadores que mudaram são reavaliadas
+        self.achievements = AchievementEngine()
+        
+        # Série temporal da fase em andamento
+        self.series_level = None
+        self.series_start = 0.0
+        self.series_base = None
+        self.next_sample = 0.0
+        
         # Inicializar estatísticas padrão
-        self.stats = {
+        self._stats = {
             "player_name": "",
             "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "last_played": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -85,24 +254,108 @@ class PlayerStats:
                 },
                 "favorite_weapon": "sword",
                 "favorite_magic": "flame"
-            }
+            },
+            
+            # Séries temporais da última partida de cada fase (ver sample_level)
+            "level_series": {
+                "fields": list(SERIES_FIELDS),
+                "level1": [],
+                "level2": [],
+                "level3": [],
+                "level4": []
+            },
+            
+            # Conquistas desbloqueadas: [[nome, data], ...] na ordem em que saíram
+            "unlocked_achievements": []
         }
         
         # Carregar estatísticas existentes
         self.load_stats()
     
+    @property
+    def stats(self) -> Dict:
+        """Estatísticas no formato aninhado (com os contadores pendentes somados)"""
+        if self.counts != self.flushed_counts:
+            self.flush_counters()
+        return self._stats
+    
+    def flush_counters(self):
+        """Soma no dicionário aninhado o que os contadores acumularam desde o último flush
+        e reavalia as conquistas que observam os contadores alterados"""
+        changed = []
+        for slot, path in enumerate(COUNTERS):
+            delta = self.counts[slot] - self.flushed_counts[slot]
+            if not delta:
+                continue
+            node = self._stats
+            for key in path[:-1]:
+                node = node[key]
+            node[path[-1]] += delta
+            changed.append(COUNTER_PATHS[slot])
+        self.flushed_counts = list(self.counts)
+        if changed:
+            self.achievements.changed(self._stats, changed)
+    
+    def stats_changed(self, *paths: str):
+        """Avisa as conquistas de mudanças feitas direto no dicionário (fora dos contadores)"""
+        self.achievements.changed(self.stats, paths)
+    
+    def end_level_run(self):
+        """Fim de uma partida (fase completada ou reiniciada): a próxima começa outra série"""
+        self.series_level = None
+    
+    def sample_level(self, level_num: int, now: float):
+        """Chamado a cada tick da fase: amostra a série temporal a cada STATS_SAMPLE_INTERVAL ms
+        e leva os contadores às conquistas a cada STATS_FLUSH_INTERVAL ms"""
+        if now >= self.next_flush:
+            self.next_flush = now + STATS_FLUSH_INTERVAL
+            if self.counts != self.flushed_counts:
+                self.flush_counters()
+        if level_num == self.series_level and now < self.next_sample:
+            return
+        if level_num != self.series_level:
+            # Nova partida nesta fase: série do zero, relativa aos contadores atuais
+            self.series_level = level_num
+            self.series_start = now
+            self.series_base = list(self.counts)
+            self.next_sample = now
+            self._stats["level_series"][f"level{level_num}"] = []
+        series = self._stats["level_series"][f"level{level_num}"]
+        if len(series) < STATS_SERIES_LENGTH:
+            counts, base = self.counts, self.series_base
+            series.append([round((now - self.series_start) / 1000, 1)] +
+                          [counts[slot] - base[slot] for slot in SERIES_SLOTS])
+        self.next_sample += STATS_SAMPLE_INTERVAL
+    
     def load_stats(self):
-        """Carrega estatísticas do arquivo JSON"""
-        if os.path.exists(self.stats_file):
+        """Carrega estatísticas do arquivo JSON.
+        
+        Se o arquivo estiver corrompido ele é guardado como .corrupt e, se um
+        .tmp completo tiver sobrado de uma gravação interrompida, ele é usado.
+        """
+        corrupted = False
+        for path in (self.stats_file, self.writer.temp_path):
+            if not os.path.exists(path):
+                continue
             try:
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                with open(path, 'r', encoding='utf-8') as f:
                     loaded_stats = json.load(f)
-                    # Mesclar com estatísticas padrão para garantir todas as chaves
-                    self._merge_stats(loaded_stats)
-                    print(f"✅ Estatísticas carregadas para {self.stats['player_name']}")
-            except Exception as e:
-                print(f"❌ Erro ao carregar estatísticas: {e}")
-                self.save_stats()  # Salvar com dados padrão
+            except (OSError, ValueError) as e:
+                print(f"❌ Erro ao carregar estatísticas de {path}: {e}")
+                if path == self.stats_file:
+                    os.replace(path, path + '.corrupt')
+                    corrupted = True
+                continue
+            # Mesclar com estatísticas padrão para garantir todas as chaves
+            self._merge_stats(loaded_stats)
+            # Arquivos antigos não guardavam desbloqueios: calcula uma vez, sem avisos
+            self.achievements.evaluate_all(self._stats)
+            print(f"✅ Estatísticas carregadas para {self.stats['player_name']}")
+            if path != self.stats_file:
+                self.save_stats()  # Recuperado: volta para o arquivo principal
+            return
+        if corrupted:
+            self.save_stats()  # Salvar com dados padrão
     
     def _merge_stats(self, loaded_stats):
         """Mescla estatísticas carregadas com padrão"""
@@ -114,19 +367,18 @@ class PlayerStats:
                     else:
                         default[key] = value
         
-        merge_dict(self.stats, loaded_stats)
+        merge_dict(self._stats, loaded_stats)
     
     def save_stats(self):
-        """Salva estatísticas no arquivo JSON"""
-        try:
-            # Atualizar tempo de sessão
-            self.stats["last_played"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=2, ensure_ascii=False)
-            print("💾 Estatísticas salvas com sucesso!")
-        except Exception as e:
-            print(f"❌ Erro ao salvar estatísticas: {e}")
+        """Agenda a gravação das estatísticas (não bloqueia em disco)"""
+        # Atualizar tempo de sessão
+        self.stats["last_played"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Codificado aqui (compacto, ~microssegundos) para o thread gravar uma foto consistente
+        self.writer.request(json.dumps(self.stats, separators=(',', ':'), ensure_ascii=False))
+    
+    def flush_stats(self):
+        """Grava imediatamente o que estiver pendente"""
+        self.writer.flush()
     
     def set_player_name(self, name: str):
         """Define o nome do jogador"""
@@ -139,12 +391,14 @@ class PlayerStats:
         """Inicia uma nova sessão de jogo"""
         self.session_start_time = time.time()
         self.stats["game_sessions"] += 1
+        self.stats_changed("game_sessions")
         print(f"🎮 Sessão iniciada para {self.stats['player_name']}")
     
     def end_session(self):
         """Finaliza a sessão atual"""
         session_time = time.time() - self.session_start_time
         self.stats["total_playtime"] += int(session_time)
+        self.stats_changed("total_playtime")
         self.save_stats()
         print(f"⏰ Sessão finalizada: {int(session_time)}s")
     
@@ -174,59 +428,69 @@ class PlayerStats:
                 print(f"✅ Fase {level_num} completada pela primeira vez!")
             
             self.level_start_time = None
+            self.end_level_run()
+            self.stats_changed("levels_completed", "performance.best_times")
             self.save_stats()
     
-    # Métodos para registrar eventos de combate
+    # Métodos para registrar eventos de combate (só incrementam contadores)
     def record_enemy_kill(self, enemy_type: str):
         """Registra morte de inimigo"""
-        self.stats["combat_stats"]["enemies_killed"] += 1
-        if enemy_type in self.stats["combat_stats"]["enemies_by_type"]:
-            self.stats["combat_stats"]["enemies_by_type"][enemy_type] += 1
+        counts = self.counts
+        counts[ENEMIES_KILLED] += 1
+        slot = ENEMY_SLOTS.get(enemy_type)
+        if slot is not None:
+            counts[slot] += 1
     
     def record_damage_dealt(self, damage: int):
         """Registra dano causado"""
-        self.stats["combat_stats"]["damage_dealt"] += damage
+        self.counts[DAMAGE_DEALT] += damage
     
     def record_damage_taken(self, damage: int):
         """Registra dano recebido"""
-        self.stats["combat_stats"]["damage_taken"] += damage
+        self.counts[DAMAGE_TAKEN] += damage
     
     def record_death(self):
         """Registra morte do jogador"""
-        self.stats["combat_stats"]["deaths"] += 1
+        self.counts[DEATHS] += 1
         print(f"💀 Mortes: {self.stats['combat_stats']['deaths']}")
     
     def record_attack(self, weapon: str):
         """Registra ataque realizado"""
-        self.stats["combat_stats"]["attacks_made"] += 1
-        if weapon in self.stats["equipment_stats"]["weapon_usage"]:
-            self.stats["equipment_stats"]["weapon_usage"][weapon] += 1
+        counts = self.counts
+        counts[ATTACKS_MADE] += 1
+        slot = WEAPON_SLOTS.get(weapon)
+        if slot is not None:
+            counts[slot] += 1
     
     def record_magic_cast(self, magic_type: str):
         """Registra magia lançada"""
-        self.stats["combat_stats"]["magic_cast"] += 1
-        if magic_type in self.stats["combat_stats"]["magic_by_type"]:
-            self.stats["combat_stats"]["magic_by_type"][magic_type] += 1
+        counts = self.counts
+        counts[MAGIC_CAST] += 1
+        slot = MAGIC_SLOTS.get(magic_type)
+        if slot is not None:
+            counts[slot] += 1
     
     # Métodos para registrar coleta de itens
     def record_orb_collection(self, orb_type: str):
         """Registra coleta de orb"""
-        if orb_type in self.stats["collection_stats"]:
-            self.stats["collection_stats"][orb_type] += 1
+        slot = COLLECTION_SLOTS.get(orb_type)
+        if slot is not None:
+            self.counts[slot] += 1
     
     def record_key_found(self):
         """Registra chave encontrada"""
-        self.stats["collection_stats"]["keys_found"] += 1
+        self.counts[KEYS_FOUND] += 1
     
     def record_gem_collected(self):
         """Registra gema coletada"""
-        self.stats["collection_stats"]["eldritch_gems"] += 1
+        self.counts[GEMS_COLLECTED] += 1
     
     # Métodos para registrar movimento
     def record_movement(self, distance: float):
         """Registra movimentação"""
-        self.stats["performance"]["steps_taken"] += 1
-        self.stats["performance"]["distance_traveled"] += distance
+        counts = self.counts
+        counts[STEPS_TAKEN] += 1
+        counts[DISTANCE_TRAVELED] += distance
     
     def get_formatted_stats(self) -> Dict:
         """Retorna estatísticas formatadas para exibição"""
@@ -259,139 +523,12 @@ class PlayerStats:
         return "N/A"
     
     def check_achievements(self) -> List[str]:
-        """Verifica e retorna conquistas desbloqueadas"""
-        achievements = []
-        stats = self.stats
-        
-        # Conquistas básicas de progressão
-        if len(stats["levels_completed"]) >= 1:
-            achievements.append("🏁 Primeiro Passo")
-        if len(stats["levels_completed"]) >= 2:
-            achievements.append("🚀 Em Movimento")
-        if len(stats["levels_completed"]) >= 3:
-            achievements.append("💪 Quase Lá")
-        if len(stats["levels_completed"]) >= 4:
-            achievements.append("🏆 Campeão")
-        
-        # Conquistas de sobrevivência
-        if stats["combat_stats"]["deaths"] == 0 and len(stats["levels_completed"]) >= 1:
-            achievements.append("🛡️ Invencível")
-        if stats["combat_stats"]["deaths"] == 0 and len(stats["levels_completed"]) >= 4:
-            achievements.append("💀 Imortal")
-        
-        # Conquistas de combate
-        if stats["combat_stats"]["enemies_killed"] >= 10:
-            achievements.append("⚔️ Caçador")
-        if stats["combat_stats"]["enemies_killed"] >= 50:
-            achievements.append("🗡️ Guerreiro")
-        if stats["combat_stats"]["enemies_killed"] >= 100:
-            achievements.append("⚡ Devastador")
-        if stats["combat_stats"]["enemies_killed"] >= 200:
-            achievements.append("🔥 Lenda")
-        
-        # Conquistas de coleta
-        total_orbs = sum(stats["collection_stats"].values())
-        if total_orbs >= 10:
-            achievements.append("💎 Coletor")
-        if total_orbs >= 25:
-            achievements.append("🔮 Colecionador")
-        if total_orbs >= 50:
-            achievements.append("💰 Tesouro")
-        if total_orbs >= 100:
-            achievements.append("👑 Rei dos Orbs")
-        
-        # Conquistas de tempo
-        if stats["total_playtime"] >= 1800:  # 30 minutos
-            achievements.append("⏰ Dedicado")
-        if stats["total_playtime"] >= 3600:  # 1 hora
-            achievements.append("🕐 Persistente")
-        if stats["total_playtime"] >= 7200:  # 2 horas
-            achievements.append("⌚ Veterano")
-        
-        # Conquistas especiais de performance
-        best_times = stats["performance"]["best_times"]
-        if any(t for t in best_times.values() if t is not None and t < 120):  # Menos de 2 minutos
-            achievements.append("🚄 Velocista")
-        if any(t for t in best_times.values() if t is not None and t < 60):   # Menos de 1 minuto
-            achievements.append("💨 Relâmpago")
-        
-        # Conquistas de dano
-        if stats["combat_stats"]["damage_dealt"] >= 1000:
-            achievements.append("💥 Destruidor")
-        if stats["combat_stats"]["damage_dealt"] >= 5000:
-            achievements.append("🌪️ Tempestade")
-        
-        # Conquistas de magia
-        total_magic = sum(stats["combat_stats"]["magic_by_type"].values())
-        if total_magic >= 20:
-            achievements.append("🔮 Mago Novato")
-        if total_magic >= 50:
-            achievements.append("✨ Feiticeiro")
-        if total_magic >= 100:
-            achievements.append("🌟 Arcano")
-        
-        # Conquistas de sessões
-        if stats["game_sessions"] >= 5:
-            achievements.append("🔄 Habitual")
-        if stats["game_sessions"] >= 10:
-            achievements.append("📅 Frequente")
-        
-        # Conquistas específicas por tipo de inimigo
-        enemies_by_type = stats["combat_stats"]["enemies_by_type"]
-        if enemies_by_type["golu"] >= 20:
-            achievements.append("🐉 Caçador de Golus")
-        if enemies_by_type["black"] >= 15:
-            achievements.append("🖤 Sombras Vencidas")
-        if enemies_by_type["bigboi"] >= 5:
-            achievements.append("👹 Gigante Slayer")
-        
-        # Conquista especial de coleta por tipo
-        if stats["collection_stats"]["health_orbs"] >= 20:
-            achievements.append("❤️ Curandeiro")
-        if stats["collection_stats"]["attack_orbs"] >= 20:
-            achievements.append("💪 Berserker")
-        if stats["collection_stats"]["speed_orbs"] >= 20:
-            achievements.append("💨 Corredor")
-        
-        return achievements
+        """Conquistas desbloqueadas (mantidas em dia por eventos, sem recalcular tudo)"""
+        return self.achievements.unlocked(self.stats)
     
     def get_achievement_description(self, achievement_name: str) -> str:
         """Retorna descrição de uma conquista"""
-        descriptions = {
-            "🏁 Primeiro Passo": "Complete a primeira fase",
-            "🚀 Em Movimento": "Complete duas fases",
-            "💪 Quase Lá": "Complete três fases",
-            "🏆 Campeão": "Complete todas as fases",
-            "🛡️ Invencível": "Complete uma fase sem morrer",
-            "💀 Imortal": "Complete o jogo sem morrer",
-            "⚔️ Caçador": "Derrote 10 inimigos",
-            "🗡️ Guerreiro": "Derrote 50 inimigos",
-            "⚡ Devastador": "Derrote 100 inimigos",
-            "🔥 Lenda": "Derrote 200 inimigos",
-            "💎 Coletor": "Colete 10 orbs",
-            "🔮 Colecionador": "Colete 25 orbs",
-            "💰 Tesouro": "Colete 50 orbs",
-            "👑 Rei dos Orbs": "Colete 100 orbs",
-            "⏰ Dedicado": "Jogue por 30 minutos",
-            "🕐 Persistente": "Jogue por 1 hora",
-            "⌚ Veterano": "Jogue por 2 horas",
-            "🚄 Velocista": "Complete uma fase em menos de 2 minutos",
-            "💨 Relâmpago": "Complete uma fase em menos de 1 minuto",
-            "💥 Destruidor": "Cause 1000 de dano",
-            "🌪️ Tempestade": "Cause 5000 de dano",
-            "🔮 Mago Novato": "Lance 20 magias",
-            "✨ Feiticeiro": "Lance 50 magias",
-            "🌟 Arcano": "Lance 100 magias",
-            "🔄 Habitual": "Jogue 5 sessões",
-            "📅 Frequente": "Jogue 10 sessões",
-            "🐉 Caçador de Golus": "Derrote 20 Golus",
-            "🖤 Sombras Vencidas": "Derrote 15 Blacks",
-            "👹 Gigante Slayer": "Derrote 5 Bigbois",
-            "❤️ Curandeiro": "Colete 20 Health Orbs",
-            "💪 Berserker": "Colete 20 Attack Orbs",
-            "💨 Corredor": "Colete 20 Speed Orbs"
-        }
-        return descriptions.get(achievement_name, "Conquista especial")
+        return self.achievements.description(achievement_name)
     
     def print_stats(self):
         """Imprime estatísticas no console"""
@@ -1,10 +1,15 @@
 import pygame
-import numpy as np
 import math
 import time
 from typing import Tuple, Optional, List, Dict, Any
-from PIL import Image, ImageFilter, ImageDraw, ImageFont
 from font_manager import font_manager
+from lazy_import import lazy_module
+import gradients
+
+# NumPy e PIL só são usados no blur - carregados no primeiro uso, não na abertura do jogo
+np = lazy_module('numpy')
+Image = lazy_module('PIL.Image')
+ImageFilter = lazy_module('PIL.ImageFilter')
 
 class AdvancedRenderer:
     """Sistema de renderização profissional com efeitos avançados"""
@@ -120,31 +125,9 @@ class AdvancedRenderer:
                               color_end: Tuple[int, int, int],
                               direction: str = 'vertical') -> pygame.Surface:
         """Cria surface com gradiente profissional"""
-        
-        cache_key = f"gradient_{width}_{height}_{color_start}_{color_end}_{direction}"
-        
-        if cache_key in self.surface_cache:
-            return self.surface_cache[cache_key].copy()
-        
-        surface = pygame.Surface((width, height))
-        
-        if direction == 'vertical':
-            for y in range(height):
-                ratio = y / height
-                r = int(color_start[0] + (color_end[0] - color_start[0]) * ratio)
-                g = int(color_start[1] + (color_end[1] - color_start[1]) * ratio)
-                b = int(color_start[2] + (color_end[2] - color_start[2]) * ratio)
-                pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
-        else:  # horizontal
-            for x in range(width):
-                ratio = x / width
-                r = int(color_start[0] + (color_end[0] - color_start[0]) * ratio)
-                g = int(color_start[1] + (color_end[1] - color_start[1]) * ratio)
-                b = int(color_start[2] + (color_end[2] - color_start[2]) * ratio)
-                pygame.draw.line(surface, (r, g, b), (x, 0), (x, height))
-        
-        self.surface_cache[cache_key] = surface.copy()
-        return surface
+        # Cópia: os chamadores desenham máscaras por cima
+        return gradients.linear_gradient(width, height, tuple(color_start), tuple(color_end),
+                                         direction == 'vertical').copy()
     
     def apply_blur_effect(self, surface: pygame.Surface, radius: int = 2) -> pygame.Surface:
         """Aplica efeito de blur usando PIL"""
@@ -0,0 +1,238 @@
+"""
+Gravação e replay determinístico de partidas.
+
+Um arquivo de replay guarda a fase, a semente do `random` global e as teclas
+seguradas em cada tick, compactadas em sequências (quantidade de ticks, máscara
+de teclas). Como a simulação roda em passo fixo e todo o resto depende só do
+input e do `random`, reproduzir o arquivo refaz a mesma partida.
+
+Uso (a partir de code/):
+    python replay.py record --level 1 --out partida.replay   # joga numa janela
+    python replay.py play partida.replay                     # o mais rápido possível
+    python replay.py play partida.replay --realtime          # numa janela, a 60 ticks/s
+"""
+import argparse
+import random
+import struct
+import sys
+import time
+
+import pygame
+
+from input_source import PressedKeys, input_router
+
+REPLAY_MAGIC = b'GREC'
+REPLAY_VERSION = 1
+_HEADER = struct.Struct('<4sBBQI')  # magic, versão, fase, semente, ticks
+_KEY = struct.Struct('<I')
+_RUN = struct.Struct('<IH')          # ticks repetidos, máscara
+
+# Teclas que o Player lê - cada uma vira um bit da máscara
+RECORDED_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT,
+                 pygame.K_SPACE, pygame.K_LCTRL, pygame.K_LSHIFT, pygame.K_q, pygame.K_e)
+
+
+class Recording:
+    """Conteúdo de um arquivo de replay: fase, semente e teclas por tick (RLE)"""
+
+    def __init__(self, level_number, seed, keys=RECORDED_KEYS):
+        self.level_number = level_number
+        self.seed = seed
+        self.keys = tuple(keys)
+        self.runs = []  # [ticks, máscara]
+
+    @property
+    def ticks(self):
+        return sum(count for count, _ in self.runs)
+
+    def append(self, held):
+        mask = 0
+        for bit, key in enumerate(self.keys):
+            if held[key]:
+                mask |= 1 << bit
+        if self.runs and self.runs[-1][1] == mask:
+            self.runs[-1][0] += 1
+        else:
+            self.runs.append([1, mask])
+
+    def held_keys(self):
+        """Gera o conjunto de teclas seguradas em cada tick, em ordem"""
+        for count, mask in self.runs:
+            held = frozenset(key for bit, key in enumerate(self.keys) if mask & (1 << bit))
+            for _ in range(count):
+                yield held
+
+    def save(self, path):
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.level_number,
+                                    self.seed, self.ticks))
+            file.write(bytes([len(self.keys)]))
+            for key in self.keys:
+                file.write(_KEY.pack(key))
+            for count, mask in self.runs:
+                file.write(_RUN.pack(count, mask))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, level_number, seed, ticks = _HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+            raise ValueError(f"{path} não é um replay compatível")
+        offset = _HEADER.size
+        key_count = data[offset]
+        offset += 1
+        keys = [_KEY.unpack_from(data, offset + i * _KEY.size)[0] for i in range(key_count)]
+        offset += key_count * _KEY.size
+
+        recording = cls(level_number, seed, keys)
+        recording.runs = [list(run) for run in _RUN.iter_unpack(data[offset:])]
+        if recording.ticks != ticks:
+            raise ValueError(f"{path} está truncado ({recording.ticks}/{ticks} ticks)")
+        return recording
+
+
+class InputRecorder:
+    """Fonte de input que repassa outra fonte e grava o que o jogador viu em cada tick"""
+
+    def __init__(self, source, recording):
+        self.source = source
+        self.recording = recording
+        self.current = PressedKeys(frozenset())
+
+    def advance(self):
+        advance = getattr(self.source, 'advance', None)
+        if advance is not None:
+            advance()
+        # Congela o estado do tick: o Player lê exatamente o que foi gravado
+        pressed = self.source.get_pressed()
+        self.current = PressedKeys(frozenset(key for key in self.recording.keys if pressed[key]))
+        self.recording.append(self.current)
+
+    def get_pressed(self):
+        return self.current
+
+
+class ReplayInput:
+    """Fonte de input que devolve as teclas gravadas, tick a tick"""
+
+    def __init__(self, recording):
+        self.recording = recording
+        self._ticks = recording.held_keys()
+        self.current = PressedKeys(frozenset())
+        self.finished = False
+
+    def advance(self):
+        try:
+            self.current = PressedKeys(next(self._ticks))
+        except StopIteration:
+            self.current = PressedKeys(frozenset())
+            self.finished = True
+
+    def get_pressed(self):
+        return self.current
+
+
+def start_run(level_number, source, seed):
+    """Cria a fase, injeta o input e semeia o `random` antes do primeiro tick"""
+    from headless import LEVELS
+    from importlib import import_module
+
+    module_name, class_name = LEVELS[level_number]
+    level = getattr(import_module(module_name), class_name)()
+    input_router.use(source)
+    random.seed(seed)
+    return level
+
+
+def run_window(level, until_finished):
+    """Loop com janela a 60 ticks/s (gravação ao vivo ou replay em tempo real)"""
+    from settings import TICK_RATE
+
+    clock = pygame.time.Clock()
+    ticks = 0
+    while not (level.completed or level.gameover or until_finished()):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                return ticks
+        level.update()
+        pygame.display.get_surface().fill((0, 0, 0))
+        level.draw()
+        pygame.display.update()
+        clock.tick(TICK_RATE)
+        ticks += 1
+    return ticks
+
+
+def record(level_number, path, seed=None):
+    """Joga uma fase numa janela gravando input e semente"""
+    from settings import WIDTH, HEIGTH
+
+    pygame.init()
+    pygame.display.set_mode((WIDTH, HEIGTH))
+    seed = int(time.time() * 1000) if seed is None else seed
+    recording = Recording(level_number, seed)
+    level = start_run(level_number, InputRecorder(input_router.keyboard, recording), seed)
+    try:
+        run_window(level, lambda: False)
+    finally:
+        input_router.use(None)
+        recording.save(path)
+    print(f"🎬 Replay salvo em {path}: fase {level_number}, {recording.ticks} ticks, "
+          f"{len(recording.runs)} trechos")
+    return recording
+
+
+def play(path, realtime=False):
+    """Reproduz um replay; retorna a fase no estado final"""
+    recording = Recording.load(path)
+    if realtime:
+        from settings import WIDTH, HEIGTH
+        pygame.init()
+        pygame.display.set_mode((WIDTH, HEIGTH))
+    else:
+        from headless import init_headless
+        init_headless()
+
+    source = ReplayInput(recording)
+    level = start_run(recording.level_number, source, recording.seed)
+    start = time.perf_counter()
+    try:
+        if realtime:
+            ticks = run_window(level, lambda: source.finished)
+        else:
+            ticks = 0
+            while ticks < recording.ticks and not (level.completed or level.gameover):
+                level.update()
+                ticks += 1
+    finally:
+        input_router.use(None)
+    elapsed = time.perf_counter() - start
+    print(f"▶️ Replay fase {recording.level_number}: {ticks}/{recording.ticks} ticks em {elapsed:.2f}s")
+    return level
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Grava e reproduz partidas')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    record_parser = commands.add_parser('record', help='joga uma fase gravando o input')
+    record_parser.add_argument('--level', type=int, choices=(1, 2, 3, 4), default=1)
+    record_parser.add_argument('--out', required=True)
+    record_parser.add_argument('--seed', type=int)
+
+    play_parser = commands.add_parser('play', help='reproduz um replay')
+    play_parser.add_argument('path')
+    play_parser.add_argument('--realtime', action='store_true',
+                             help='mostra a partida numa janela na velocidade normal')
+
+    args = parser.parse_args(argv)
+    if args.command == 'record':
+        record(args.level, args.out, args.seed)
+    else:
+        play(args.path, args.realtime)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
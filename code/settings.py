@@ -4,6 +4,12 @@ HEIGTH   = 800
 FPS      = 60
 TILESIZE = 32
 
+# simulation (fixed timestep - speeds are in pixels per tick)
+TICK_RATE           = 60
+TICK_DURATION       = 1 / TICK_RATE
+MAX_TICKS_PER_FRAME = 5     # acima disso o jogo desacelera em vez de travar
+MAX_FRAME_TIME      = 0.25  # ignora pausas longas (telas de história, janela arrastada)
+
 # ui 
 BAR_HEIGHT = 20
 HEALTH_BAR_WIDTH = 200
@@ -36,8 +42,30 @@ magic_data = {
 	'flame': {'strength': 5,'cost': 20,'graphic':'../graphics/particles/flame/fire.png'},
 	'heal' : {'strength': 20,'cost': 10,'graphic':'../graphics/particles/heal/heal.png'}}
 
+# sounds (name -> file)
+sound_paths = {
+	'heal': '../audio/heal.wav',
+	'walk': '../audio/walk.wav',
+	'stomp': '../audio/stomp.wav',
+	'ambience': '../audio/Light Ambience 1.mp3',
+	'sword': '../audio/sword.wav',
+	'hit': '../audio/hit.wav',
+	'monster_scream': '../audio/monsterScream.wav',
+	'bigboi_death': '../audio/bigboi death.wav',
+	'slash': '../audio/attack/slash.wav',
+	'claw': '../audio/attack/claw.wav',
+	'fireball': '../audio/attack/fireball.wav'}
+
+# music (name -> file)
+music_paths = {
+	'home': '../audio/home.mp3',
+	'level1': '../audio/Ambient 2.mp3',
+	'level2': '../audio/Ambient 2.mp3',
+	'level3': '../audio/darkambience(from fable).mp3',
+	'level4': '../audio/home.mp3'}
+
 # enemy
 monster_data = {
-	'bigboi': {'health': 450, 'exp': 120, 'damage': 180, 'attack_type': 'leaf_attack', 'attack_sound': '../audio/attack/slash.wav', 'speed': 1.3, 'resistance': 3, 'attack_radius': 90,'notice_radius': 150},
+	'bigboi': {'health': 450, 'exp': 120, 'damage': 180, 'attack_type': 'leaf_attack', 'attack_sound': '../audio/attack/slash.wav', 'death_sound': '../audio/bigboi death.wav', 'speed': 1.3, 'resistance': 3, 'attack_radius': 90,'notice_radius': 150},
 	'black': {'health': 10, 'exp': 120, 'damage': 6, 'attack_type': 'leaf_attack','attack_sound': '../audio/attack/slash.wav', 'speed': 4, 'resistance': 3, 'attack_radius': 80,'notice_radius': 1200},
 	'golu': {'health': 200, 'exp': 120, 'damage': 60, 'attack_type': 'leaf_attack', 'attack_sound': '../audio/attack/slash.wav', 'speed': 1.5, 'resistance': 3, 'attack_radius': 60,'notice_radius': 1000}}
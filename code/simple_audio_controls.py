@@ -2,6 +2,7 @@ import pygame
 import math
 from audio_manager import audio_manager
 from font_manager import font_manager
+import gradients
 
 class SimpleAudioControls:
     """Controles de áudio simples e estáticos para música e efeitos separados"""
@@ -201,26 +202,10 @@ class SimpleAudioControls:
     
     def _create_gradient_surface(self, width, height, color1, color2, vertical=True):
         """Cria uma superfície com gradiente"""
-        surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        
-        if vertical:
-            for y in range(height):
-                ratio = y / height
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                a = int(color1[3] * (1 - ratio) + color2[3] * ratio) if len(color1) > 3 else 255
-                pygame.draw.line(surface, (r, g, b, a), (0, y), (width, y))
-        else:
-            for x in range(width):
-                ratio = x / width
-                r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-                g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-                b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-                a = int(color1[3] * (1 - ratio) + color2[3] * ratio) if len(color1) > 3 else 255
-                pygame.draw.line(surface, (r, g, b, a), (x, 0), (x, height))
-        
-        return surface
+        # Sempre com alpha, como antes (cores RGB viram alpha 255)
+        color1 = (*color1[:3], color1[3] if len(color1) > 3 else 255)
+        color2 = (*color2[:3], color2[3] if len(color2) > 3 else 255)
+        return gradients.linear_gradient(width, height, color1, color2, vertical)
     
     def _draw_glow_effect(self, surface, rect, color, intensity=0.5):
         """Desenha efeito glow ao redor de um retângulo"""
@@ -0,0 +1,81 @@
+class SpatialHash:
+    """Grade uniforme de sprites para consultas de vizinhança.
+
+    Cada sprite fica registrado em todas as células que o rect dele toca, então
+    uma consulta só olha os sprites próximos em vez do grupo inteiro. As células
+    são dicts (e não sets) para manter a ordem de inserção e os resultados
+    determinísticos.
+    """
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}
+        self._sprite_cells = {}  # sprite -> células ocupadas
+
+    def _cells_for(self, rect):
+        size = self.cell_size
+        return tuple((x, y)
+                     for x in range(rect.left // size, (rect.right - 1) // size + 1)
+                     for y in range(rect.top // size, (rect.bottom - 1) // size + 1))
+
+    def insert(self, sprite):
+        """Registra (ou reposiciona) um sprite de acordo com o rect atual"""
+        keys = self._cells_for(sprite.rect)
+        old_keys = self._sprite_cells.get(sprite)
+        if old_keys == keys:
+            return
+        if old_keys is not None:
+            self._discard(sprite, old_keys)
+        for key in keys:
+            self.cells.setdefault(key, {})[sprite] = None
+        self._sprite_cells[sprite] = keys
+
+    def track(self, sprite):
+        """Registra um sprite que mantém o índice em dia sozinho.
+
+        Entity.move chama insert() (que não faz nada se as células não mudaram)
+        e Entity.kill chama remove(), então ninguém precisa varrer o grupo.
+        """
+        sprite.spatial_index = self
+        self.insert(sprite)
+
+    def remove(self, sprite):
+        """Remove um sprite do índice (ignora sprites não registrados)"""
+        keys = self._sprite_cells.pop(sprite, None)
+        if keys is not None:
+            self._discard(sprite, keys)
+
+    def _discard(self, sprite, keys):
+        for key in keys:
+            cell = self.cells.get(key)
+            if cell is not None:
+                cell.pop(sprite, None)
+                if not cell:
+                    del self.cells[key]
+
+    def sync(self, group):
+        """Atualiza o índice para refletir um grupo cujos sprites se movem"""
+        for sprite in [s for s in self._sprite_cells if s not in group]:
+            self.remove(sprite)
+        for sprite in group:
+            self.insert(sprite)
+
+    def query(self, rect):
+        """Sprites registrados nas células tocadas por rect (fase ampla)"""
+        found = {}
+        cells = self.cells
+        for key in self._cells_for(rect):
+            cell = cells.get(key)
+            if cell:
+                found.update(cell)
+        return list(found)
+
+    def clear(self):
+        self.cells.clear()
+        self._sprite_cells.clear()
+
+    def __len__(self):
+        return len(self._sprite_cells)
+
+    def __contains__(self, sprite):
+        return sprite in self._sprite_cells
@@ -2,6 +2,7 @@ import pygame
 import sys
 from settings import *
 from player_stats import player_stats
+from achievements import ACHIEVEMENTS
 from datetime import timedelta
 from font_manager import font_manager
 
@@ -138,7 +139,7 @@ class StatsScreen:
         achievements = player_stats.check_achievements()
         
         # Show achievement count
-        count_text = f"({len(achievements)}/32 desbloqueadas)"
+        count_text = f"({len(achievements)}/{len(ACHIEVEMENTS)} desbloqueadas)"
         count_surface = self.small_font.render(count_text, True, self.label_color)
         count_rect = count_surface.get_rect(x=x + 180, y=y + 5)
         self.display_surface.blit(count_surface, count_rect)
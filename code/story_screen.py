@@ -9,6 +9,94 @@ from font_manager import font_manager
 # CHEAT: Import cheat system for testing (remove for final version)
 from cheat_system import cheat_system
 
+# Scroll surfaces are built once per story and screen size, then reused:
+# (story_key, WIDTH, HEIGTH) -> (full size surface, surface at MIN_PERSPECTIVE_SCALE)
+STORY_CACHE_SIZE = 2
+MIN_PERSPECTIVE_SCALE = 0.8
+_story_cache = {}
+
+
+def build_story_surface(story_data):
+    """Create the scrolling text surface with modern rendering"""
+    # Calculate total height needed with better spacing
+    line_height = 40          # Espaçamento otimizado entre linhas
+    title_height = 120        # Mais espaço para título com efeitos
+    subtitle_height = 80      # Mais espaço para subtítulo
+    gap_height = 60           # Gap entre seções
+    
+    total_lines = len(story_data["text"])
+    total_height = title_height + subtitle_height + gap_height + (total_lines * line_height) + 200
+    
+    # Create surface with modern background
+    story_surface = pygame.Surface((WIDTH - 100, total_height), pygame.SRCALPHA)
+    
+    # Add subtle background panel
+    panel_surface = professional_renderer.create_modern_panel(
+        WIDTH - 100, total_height, background_alpha=120
+    )
+    story_surface.blit(panel_surface, (0, 0))
+    
+    y_pos = 30  # Padding from top
+    
+    # Title with modern effects
+    title_surface, title_rect = professional_renderer.render_text_professional(
+        story_data["title"], 
+        'title', 
+        (255, 215, 0),  # Dourado elegante
+        shadow=True, 
+        glow=True, 
+        anti_alias=True
+    )
+    title_x = (story_surface.get_width() - title_rect.width) // 2
+    story_surface.blit(title_surface, (title_x, y_pos))
+    y_pos += title_height
+    
+    # Subtitle with professional rendering
+    subtitle_surface, subtitle_rect = professional_renderer.render_text_professional(
+        story_data["subtitle"], 
+        'subtitle', 
+        (100, 200, 255),  # Azul elegante
+        shadow=True, 
+        anti_alias=True
+    )
+    subtitle_x = (story_surface.get_width() - subtitle_rect.width) // 2
+    story_surface.blit(subtitle_surface, (subtitle_x, y_pos))
+    y_pos += subtitle_height + gap_height
+    
+    # Story text with enhanced rendering
+    for line in story_data["text"]:
+        if line.strip():  # Non-empty line
+            text_surface, text_rect = professional_renderer.render_text_professional(
+                line, 
+                'text', 
+                (230, 230, 250),  # Branco suave
+                shadow=True, 
+                anti_alias=True
+            )
+            text_x = (story_surface.get_width() - text_rect.width) // 2
+            story_surface.blit(text_surface, (text_x, y_pos))
+        y_pos += line_height
+    
+    return story_surface.convert_alpha()
+
+
+def get_story_surfaces(story_key):
+    """Cached scroll surfaces for a story (built on first use)"""
+    if story_key not in PHASE_STORIES:
+        story_key = "intro"
+    key = (story_key, WIDTH, HEIGTH)
+    surfaces = _story_cache.get(key)
+    if surfaces is None:
+        while len(_story_cache) >= STORY_CACHE_SIZE:
+            _story_cache.pop(next(iter(_story_cache)))
+        story_surface = build_story_surface(PHASE_STORIES[story_key])
+        width, height = story_surface.get_size()
+        small_surface = pygame.transform.scale(
+            story_surface, (int(width * MIN_PERSPECTIVE_SCALE), int(height * MIN_PERSPECTIVE_SCALE)))
+        surfaces = _story_cache[key] = (story_surface, small_surface)
+    return surfaces
+
+
 class StoryScreen:
     def __init__(self, story_key="intro", custom_background=None):
         self.display_surface = pygame.display.get_surface()
@@ -42,6 +130,29 @@ class StoryScreen:
             print(f"⚠️ Erro ao carregar background {background_path}: {e}")
             self.background_image = None
         
+        # Scroll text, compiled once per story
+        self.story_surface, self.small_story_surface = get_story_surfaces(story_key)
+        
+        # Skip instruction panel and text never change
+        self.skip_bg = pygame.Surface((520, 50), pygame.SRCALPHA)
+        self.skip_bg.fill((20, 20, 40, 180))  # Semi-transparent background
+        # Add inner glow for elegance
+        inner_bg = pygame.Surface((500, 35), pygame.SRCALPHA)
+        inner_bg.fill((60, 60, 80, 120))
+        self.skip_bg.blit(inner_bg, (10, 7.5))
+        self.skip_bg_rect = pygame.Rect((WIDTH // 2 - 260, HEIGTH - 60), (520, 50))
+        
+        # Modern skip instruction with professional rendering
+        self.skip_surface, skip_rect = professional_renderer.render_text_professional(
+            "Pressione ESPACO para pular a historia", 
+            'text',  # Use text size from font manager
+            (255, 255, 100),  # Amarelo elegante
+            shadow=True, 
+            glow=True,
+            anti_alias=True
+        )
+        self.skip_pos = ((WIDTH - skip_rect.width) // 2, HEIGTH - 35)
+        
         # Create starfield background
         self.stars = []
         for _ in range(100):
@@ -53,67 +164,8 @@ class StoryScreen:
             })
     
     def create_story_surface(self):
-        """Create the scrolling text surface with modern rendering"""
-        # Calculate total height needed with better spacing
-        line_height = 40          # Espaçamento otimizado entre linhas
-        title_height = 120        # Mais espaço para título com efeitos
-        subtitle_height = 80      # Mais espaço para subtítulo
-        gap_height = 60           # Gap entre seções
-        
-        total_lines = len(self.story_data["text"])
-        total_height = title_height + subtitle_height + gap_height + (total_lines * line_height) + 200
-        
-        # Create surface with modern background
-        story_surface = pygame.Surface((WIDTH - 100, total_height), pygame.SRCALPHA)
-        
-        # Add subtle background panel
-        panel_surface = professional_renderer.create_modern_panel(
-            WIDTH - 100, total_height, background_alpha=120
-        )
-        story_surface.blit(panel_surface, (0, 0))
-        
-        y_pos = 30  # Padding from top
-        
-        # Title with modern effects
-        title_surface, title_rect = professional_renderer.render_text_professional(
-            self.story_data["title"], 
-            'title', 
-            (255, 215, 0),  # Dourado elegante
-            shadow=True, 
-            glow=True, 
-            anti_alias=True
-        )
-        title_x = (story_surface.get_width() - title_rect.width) // 2
-        story_surface.blit(title_surface, (title_x, y_pos))
-        y_pos += title_height
-        
-        # Subtitle with professional rendering
-        subtitle_surface, subtitle_rect = professional_renderer.render_text_professional(
-            self.story_data["subtitle"], 
-            'subtitle', 
-            (100, 200, 255),  # Azul elegante
-            shadow=True, 
-            anti_alias=True
-        )
-        subtitle_x = (story_surface.get_width() - subtitle_rect.width) // 2
-        story_surface.blit(subtitle_surface, (subtitle_x, y_pos))
-        y_pos += subtitle_height + gap_height
-        
-        # Story text with enhanced rendering
-        for line in self.story_data["text"]:
-            if line.strip():  # Non-empty line
-                text_surface, text_rect = professional_renderer.render_text_professional(
-                    line, 
-                    'text', 
-                    (230, 230, 250),  # Branco suave
-                    shadow=True, 
-                    anti_alias=True
-                )
-                text_x = (story_surface.get_width() - text_rect.width) // 2
-                story_surface.blit(text_surface, (text_x, y_pos))
-            y_pos += line_height
-        
-        return story_surface
+        """The scrolling text surface (built once per story, see get_story_surfaces)"""
+        return self.story_surface
     
     def update_stars(self):
         """Update starfield animation"""
@@ -138,6 +190,35 @@ class StoryScreen:
         if keys[pygame.K_RETURN] or keys[pygame.K_SPACE] or keys[pygame.K_ESCAPE]:
             self.skip_requested = True
     
+    def draw_story(self):
+        """Blit the visible part of the scroll text with the perspective effect"""
+        # Calculate position with perspective effect
+        perspective_scale = max(MIN_PERSPECTIVE_SCALE, 1.0 - abs(self.scroll_y) / (HEIGTH * 2))
+        width, height = self.story_surface.get_size()
+        scaled_width = int(width * perspective_scale)
+        scaled_height = int(height * perspective_scale)
+        
+        # Position in center of screen
+        x = (WIDTH - scaled_width) // 2
+        y = int(self.scroll_y * perspective_scale)
+        
+        if perspective_scale <= MIN_PERSPECTIVE_SCALE:
+            # Most of the scroll: already scaled, a plain (clipped) blit
+            self.display_surface.blit(self.small_story_surface, (x, y))
+            return
+        
+        # Zooming near the middle of the screen: scale only the rows on screen
+        top = max(0, -y)
+        bottom = min(scaled_height, HEIGTH - y)
+        if bottom <= top:
+            return
+        src_top = int(top / perspective_scale)
+        src_bottom = min(height, math.ceil(bottom / perspective_scale))
+        viewport = self.story_surface.subsurface((0, src_top, width, src_bottom - src_top))
+        scaled_viewport = pygame.transform.scale(
+            viewport, (scaled_width, int((src_bottom - src_top) * perspective_scale)))
+        self.display_surface.blit(scaled_viewport, (x, y + int(src_top * perspective_scale)))
+    
     def update(self):
         """Update story screen"""
         self.time += 0.1
@@ -151,8 +232,7 @@ class StoryScreen:
             self.update_stars()
             
             # Check if story finished scrolling
-            story_surface = self.create_story_surface()
-            if self.scroll_y < -story_surface.get_height() - 200:
+            if self.scroll_y < -self.story_surface.get_height() - 200:
                 self.finished = True
         
         # Clear screen and draw background
@@ -164,51 +244,16 @@ class StoryScreen:
         # Draw stars
         self.draw_stars()
         
-        # Create and draw story text
-        story_surface = self.create_story_surface()
-        
-        # Calculate position with perspective effect
-        perspective_scale = max(0.8, 1.0 - abs(self.scroll_y) / (HEIGTH * 2))
-        scaled_width = int(story_surface.get_width() * perspective_scale)
-        scaled_height = int(story_surface.get_height() * perspective_scale)
-        
-        if scaled_width > 0 and scaled_height > 0:
-            scaled_surface = pygame.transform.scale(story_surface, (scaled_width, scaled_height))
-            
-            # Position in center of screen
-            x = (WIDTH - scaled_width) // 2
-            y = int(self.scroll_y * perspective_scale)
-            
-            self.display_surface.blit(scaled_surface, (x, y))
+        # Draw story text
+        self.draw_story()
         
         # Draw elegant skip instruction with translucent background
-        skip_bg = pygame.Surface((520, 50), pygame.SRCALPHA)
-        skip_bg.fill((20, 20, 40, 180))  # Semi-transparent background
-        
-        # Add inner glow for elegance
-        inner_bg = pygame.Surface((500, 35), pygame.SRCALPHA)
-        inner_bg.fill((60, 60, 80, 120))
-        skip_bg.blit(inner_bg, (10, 7.5))
-        
-        skip_bg_rect = pygame.Rect((WIDTH // 2 - 260, HEIGTH - 60), (520, 50))
-        self.display_surface.blit(skip_bg, skip_bg_rect)
+        self.display_surface.blit(self.skip_bg, self.skip_bg_rect)
         
         # Add elegant borders
-        pygame.draw.rect(self.display_surface, (120, 120, 140), skip_bg_rect, 2)
-        pygame.draw.rect(self.display_surface, (180, 180, 200), skip_bg_rect, 1)
-        
-        # Modern skip instruction with professional rendering
-        skip_surface, skip_rect = professional_renderer.render_text_professional(
-            "Pressione ESPACO para pular a historia", 
-            'text',  # Use text size from font manager
-            (255, 255, 100),  # Amarelo elegante
-            shadow=True, 
-            glow=True,
-            anti_alias=True
-        )
-        skip_x = (WIDTH - skip_rect.width) // 2
-        skip_y = HEIGTH - 35
-        self.display_surface.blit(skip_surface, (skip_x, skip_y))
+        pygame.draw.rect(self.display_surface, (120, 120, 140), self.skip_bg_rect, 2)
+        pygame.draw.rect(self.display_surface, (180, 180, 200), self.skip_bg_rect, 1)
+        self.display_surface.blit(self.skip_surface, self.skip_pos)
         
         # CHEAT: Display cheat information in story screen (remove for final version)
         cheat_system.display_cheat_info(self.display_surface)
@@ -1,6 +1,7 @@
 from csv import reader
 from os import walk
 import pygame
+from assets import asset_pipeline
 
 def import_csv_layout(path):
 	terrain_map = []
@@ -11,12 +12,5 @@ def import_csv_layout(path):
 		return terrain_map
 
 def import_folder(path):
-	surface_list = []
-
-	for _,__,img_files in walk(path):
-		for image in img_files:
-			full_path = path + '/' + image
-			image_surf = pygame.image.load(full_path).convert_alpha()
-			surface_list.append(image_surf)
-
-	return surface_list
+	# Frames vêm do cache de assets: cada arquivo é decodificado uma vez só
+	return asset_pipeline.folder(path)
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Teste da gravação das estatísticas (StatsWriter) e da recuperação de arquivo
+corrompido. Roda num diretório temporário: não toca no player_stats.json real.
+
+    python test_player_stats.py      (ou python -m pytest test_player_stats.py)
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from player_stats import PlayerStats, StatsWriter
+
+
+@contextmanager
+def temp_cwd():
+    """Executa o bloco dentro de um diretório temporário"""
+    old_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as path:
+        os.chdir(path)
+        try:
+            yield path
+        finally:
+            os.chdir(old_cwd)
+
+
+def read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_debounce_writes_latest_once():
+    with temp_cwd():
+        writer = StatsWriter('stats.json', delay=0.05, max_delay=1.0)
+        for i in range(20):
+            writer.request(json.dumps({"n": i}))
+        assert writer.writes == 0  # ainda esperando o silêncio de `delay`
+        time.sleep(0.3)
+        assert writer.writes == 1
+        assert read_json('stats.json') == {"n": 19}
+        assert not os.path.exists('stats.json.tmp')
+        writer.close()
+
+
+def test_max_delay_bounds_waiting():
+    with temp_cwd():
+        writer = StatsWriter('stats.json', delay=0.1, max_delay=0.2)
+        start = time.monotonic()
+        while time.monotonic() - start < 0.5:  # pedidos sem pausa, mais rápidos que `delay`
+            writer.request(json.dumps({"t": time.monotonic()}))
+            time.sleep(0.02)
+        assert writer.writes >= 2
+        writer.close()
+
+
+def test_flush_and_close_write_pending():
+    with temp_cwd():
+        writer = StatsWriter('stats.json', delay=60, max_delay=60)
+        writer.request('{"a": 1}')
+        writer.flush()
+        assert read_json('stats.json') == {"a": 1}
+
+        writer.request('{"a": 2}')
+        writer.close()  # o que o atexit chama na saída do jogo
+        assert read_json('stats.json') == {"a": 2}
+        assert writer.writes == 2
+
+
+def test_corrupt_file_recovered_from_tmp():
+    with temp_cwd():
+        with open('player_stats.json', 'w', encoding='utf-8') as f:
+            f.write('{"player_name": "Tes')  # gravação interrompida
+        with open('player_stats.json.tmp', 'w', encoding='utf-8') as f:
+            json.dump({"player_name": "Tester", "game_sessions": 7}, f)
+
+        stats = PlayerStats()
+        assert stats.stats["player_name"] == "Tester"
+        assert stats.stats["game_sessions"] == 7
+        assert os.path.exists('player_stats.json.corrupt')
+
+        stats.flush_stats()
+        assert read_json('player_stats.json')["player_name"] == "Tester"
+        stats.writer.close()
+
+
+def test_corrupt_file_without_tmp_saves_defaults():
+    with temp_cwd():
+        with open('player_stats.json', 'w', encoding='utf-8') as f:
+            f.write('not json')
+
+        stats = PlayerStats()
+        assert stats.stats["player_name"] == ""
+        stats.flush_stats()
+        saved = read_json('player_stats.json')
+        assert saved["game_sessions"] == 0
+        with open('player_stats.json.corrupt', encoding='utf-8') as f:
+            assert f.read() == 'not json'
+        stats.writer.close()
+
+
+def main():
+    tests = [value for name, value in sorted(globals().items()) if name.startswith('test_')]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✅ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"❌ {test.__name__}: {e!r}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
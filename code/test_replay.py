@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Teste de determinismo do replay: grava N ticks de input scriptado numa fase,
+reproduz o arquivo e compara, tick a tick, a posição e a vida do jogador e
+dos inimigos. Se o relógio de simulação, o input ou o `random` deixarem de ser
+determinísticos, as duas partidas se separam.
+
+    python test_replay.py            (ou python -m pytest test_replay.py)
+"""
+import os
+import sys
+import tempfile
+
+CODE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, CODE_DIR)
+os.chdir(CODE_DIR)  # as fases carregam '../graphics', '../map new' etc.
+
+from headless import init_headless
+
+init_headless()
+
+import pygame
+
+from input_source import ScriptedInput, input_router
+from replay import InputRecorder, Recording, ReplayInput, start_run
+
+REPLAY_TICKS = 600
+REPLAY_SEED = 1234
+
+
+def scripted_keys(tick):
+    """Anda em várias direções, ataca e lança magia em ticks fixos"""
+    keys = {pygame.K_RIGHT} if (tick // 90) % 4 == 0 else \
+           {pygame.K_DOWN} if (tick // 90) % 4 == 1 else \
+           {pygame.K_LEFT} if (tick // 90) % 4 == 2 else {pygame.K_UP}
+    if tick % 40 < 3:
+        keys.add(pygame.K_SPACE)
+    if tick % 150 == 75:
+        keys.add(pygame.K_LCTRL)
+    return keys
+
+
+def place_near_enemy(level):
+    """Põe o jogador ao lado do inimigo mais próximo para a partida ter combate
+    (o spawn da fase 1 fica longe de todos), com vida para durar a partida toda"""
+    player = level.player
+    center = pygame.math.Vector2(player.hitbox.center)
+    enemy = min(level.attackable_sprites, key=lambda e: center.distance_to(e.hitbox.center))
+    player.hitbox.center = (enemy.hitbox.centerx - 100, enemy.hitbox.centery)
+    player.rect.center = player.hitbox.center
+    player.health = player.stats['health'] * 20
+
+
+def snapshot(level):
+    """Estado comparável da fase num tick.
+
+    Além de jogador e inimigos, guarda um hash das posições de todos os sprites
+    visíveis: as partículas usam o `random`, então a semente também é conferida.
+    """
+    enemies = sorted((enemy.rect.topleft, enemy.health) for enemy in level.attackable_sprites)
+    sprites = hash(tuple(sprite.rect.topleft for sprite in level.visible_sprites))
+    return (level.player.rect.topleft, level.player.health, tuple(enemies), sprites)
+
+
+def run(level, ticks):
+    states = []
+    try:
+        for _ in range(ticks):
+            if level.completed or level.gameover:
+                break
+            level.update()
+            states.append(snapshot(level))
+    finally:
+        input_router.use(None)
+    return states
+
+
+def test_record_then_replay_matches():
+    recording = Recording(1, REPLAY_SEED)
+    level = start_run(1, InputRecorder(ScriptedInput(scripted_keys), recording), REPLAY_SEED)
+    place_near_enemy(level)
+    recorded = run(level, REPLAY_TICKS)
+
+    with tempfile.TemporaryDirectory() as path:
+        replay_path = os.path.join(path, 'teste.replay')
+        recording.save(replay_path)
+        loaded = Recording.load(replay_path)
+    assert loaded.runs == recording.runs and loaded.seed == REPLAY_SEED
+
+    level = start_run(1, ReplayInput(loaded), loaded.seed)
+    place_near_enemy(level)
+    replayed = run(level, REPLAY_TICKS)
+
+    assert len(recorded) == REPLAY_TICKS
+    assert len(replayed) == len(recorded)
+    for tick, (expected, actual) in enumerate(zip(recorded, replayed)):
+        assert expected == actual, f"replay divergiu no tick {tick}: {expected} != {actual}"
+    # A partida precisa ter movimento e combate, senão o teste não prova nada
+    assert recorded[0][0] != recorded[-1][0]
+    assert recorded[0][2] != recorded[-1][2]
+
+
+def main():
+    try:
+        test_record_then_replay_matches()
+    except AssertionError as e:
+        print(f"❌ test_record_then_replay_matches: {e}")
+        return 1
+    print(f"✅ test_record_then_replay_matches ({REPLAY_TICKS} ticks)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
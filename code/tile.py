@@ -1,10 +1,20 @@
 import pygame 
 from settings import *
 
+# Versão 2x de cada surface de tile: milhares de tiles usam as mesmas poucas
+# surfaces, então a escala é feita uma vez por surface e não uma vez por tile
+scaled_surfaces = {}
+
+def scaled_tile_surface(surface):
+	scaled = scaled_surfaces.get(surface)
+	if scaled is None:
+		scaled = scaled_surfaces[surface] = pygame.transform.scale2x(surface)
+	return scaled
+
 class Tile(pygame.sprite.Sprite):
 	def __init__(self,pos,groups,sprite_type,surface = pygame.Surface((TILESIZE,TILESIZE))):
 		super().__init__(groups)
-		surface = pygame.transform.scale2x(surface)
+		surface = scaled_tile_surface(surface)
 		self.sprite_type = sprite_type
 		self.image = surface
 
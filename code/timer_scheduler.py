@@ -0,0 +1,87 @@
+import heapq
+import itertools
+from settings import TICK_DURATION
+
+
+class Timer:
+    """Expiração agendada no TimerScheduler (due em microssegundos)"""
+    __slots__ = ('due', 'callback', 'args', 'active')
+
+    def __init__(self, due, callback, args):
+        self.due = due
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+
+class TimerScheduler:
+    """Agenda expirações (cooldowns, invulnerabilidade, efeitos mágicos) num heap.
+
+    O relógio é o tempo de simulação em milissegundos e avança um passo fixo
+    por tick, então o custo por tick depende só dos timers que vencem - entidades
+    paradas não custam nada. Internamente o tempo é contado em microssegundos
+    inteiros: sem acúmulo de erro de ponto flutuante, um timer vence sempre no
+    mesmo tick, não importa há quanto tempo o jogo está rodando (replays).
+    """
+
+    def __init__(self):
+        self.now = 0.0          # ms, para leitura pelas entidades
+        self._now_us = 0
+        self.tick_ms = TICK_DURATION * 1000
+        self._tick_us = round(TICK_DURATION * 1_000_000)
+        self._heap = []
+        self._sequence = itertools.count()  # desempate estável para o mesmo instante
+        self._cancelled = 0
+
+    def schedule(self, delay, callback, *args):
+        """Chama callback(*args) daqui a `delay` ms e retorna o Timer"""
+        timer = Timer(self._now_us + round(delay * 1000), callback, args)
+        heapq.heappush(self._heap, (timer.due, next(self._sequence), timer))
+        return timer
+
+    def cancel(self, timer):
+        """Cancela um timer pendente (ignora None e timers já disparados)"""
+        if timer is None or not timer.active:
+            return
+        timer.active = False
+        self._cancelled += 1
+
+        # Remove os cancelados de uma vez quando passam a dominar o heap
+        if self._cancelled > 64 and self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[2].active]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
+
+    def tick(self):
+        """Avança um passo de simulação"""
+        self._advance_us(self._tick_us)
+
+    def advance(self, milliseconds):
+        """Avança o relógio e dispara os timers vencidos em ordem"""
+        self._advance_us(round(milliseconds * 1000))
+
+    def _advance_us(self, microseconds):
+        self._now_us += microseconds
+        self.now = self._now_us / 1000
+        heap = self._heap
+        while heap and heap[0][0] <= self._now_us:
+            timer = heapq.heappop(heap)[2]
+            if not timer.active:
+                self._cancelled -= 1
+                continue
+            timer.active = False
+            timer.callback(*timer.args)
+
+    def clear(self):
+        """Descarta todos os timers pendentes (ao montar uma fase); o relógio continua"""
+        for entry in self._heap:
+            entry[2].active = False  # cancel() posterior desses handles não faz nada
+        self._heap.clear()
+        self._cancelled = 0
+
+    def __len__(self):
+        return len(self._heap) - self._cancelled
+
+
+# Instância global - relógio da simulação
+timer_scheduler = TimerScheduler()
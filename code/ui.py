@@ -6,10 +6,23 @@ import math
 from settings import * 
 from player import Player
 from font_manager import font_manager
+from timer_scheduler import timer_scheduler
+import gradients
+from assets import asset_pipeline
 
 class EnhancedUI:
     """UI melhorada com efeitos visuais modernos mas mantendo simplicidade"""
     
+    # Ordem de composição das camadas do HUD
+    LAYER_ORDER = ('health', 'energy', 'instructions', 'status', 'weapon', 'magic')
+    
+    INSTRUCTIONS = {
+        1: "Espaço: Atacar | Q: Trocar arma | E: Trocar magia | Ctrl: Usar magia",
+        2: "Encontre uma saída do labirinto! | Q: Trocar arma | E: Magia",
+        3: "Você tem {keys} chaves | Q: Trocar arma",
+        4: "Fuja! | Q: Trocar arma | E: Magia"
+    }
+    
     def __init__(self):
         # General
         self.display_surface = pygame.display.get_surface()
@@ -36,13 +49,13 @@ class EnhancedUI:
         self.weapon_graphics = []
         for weapon in weapon_data.values():
             path = weapon['graphic']
-            weapon = pygame.image.load(path).convert_alpha()
+            weapon = asset_pipeline.image(path)
             self.weapon_graphics.append(weapon)
 
         # Convert magic dictionary
         self.magic_graphics = []
         for magic in magic_data.values():
-            magic = pygame.image.load(magic['graphic']).convert_alpha()
+            magic = asset_pipeline.image(magic['graphic'])
             self.magic_graphics.append(magic)
 
         self.pixelated_font = font_manager.get('text')
@@ -51,6 +64,7 @@ class EnhancedUI:
         self.status_message = ""
         self.status_message_duration = 2000
         self.status_message_start_time = 0
+        self.status_message_timer = None
         self.current_level = 1
         
         # Cache para superfícies
@@ -58,26 +72,23 @@ class EnhancedUI:
         
         # Timer para animações
         self.animation_time = 0
+        
+        # HUD em camadas: nome -> (estado, superfície, rect na tela)
+        self.layers = {}
+        self.hud_surface = pygame.Surface(self.display_surface.get_size(), pygame.SRCALPHA)
+        self.hud_regions = []
+        self.hud_dirty = True
 
     def create_gradient_bar(self, width, height, color1, color2):
-        """Cria uma barra com gradiente"""
-        cache_key = f"gradient_{width}_{height}_{color1}_{color2}"
+        """Cria uma barra com gradiente horizontal"""
+        return gradients.linear_gradient(width, height, color1, color2, vertical=False)
+
+    def create_glowing_border(self, rect, color, intensity=1.0):
+        """Cria um efeito de borda brilhante (cacheado por tamanho/cor/intensidade)"""
+        cache_key = f"glow_{rect.width}_{rect.height}_{color}_{intensity:.2f}"
         if cache_key in self.surface_cache:
             return self.surface_cache[cache_key]
         
-        surface = pygame.Surface((width, height))
-        for x in range(width):
-            ratio = x / width
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), (x, 0), (x, height))
-        
-        self.surface_cache[cache_key] = surface
-        return surface
-
-    def create_glowing_border(self, rect, color, intensity=1.0):
-        """Cria um efeito de borda brilhante"""
         glow_surface = pygame.Surface((rect.width + 20, rect.height + 20), pygame.SRCALPHA)
         
         # Múltiplas camadas para efeito glow
@@ -87,254 +98,257 @@ class EnhancedUI:
             glow_rect = pygame.Rect(10 - i, 10 - i, rect.width + i*2, rect.height + i*2)
             pygame.draw.rect(glow_surface, glow_color, glow_rect, width=2)
         
+        self.surface_cache[cache_key] = glow_surface
         return glow_surface
 
-    def show_modern_bar(self, current, max_amount, bg_rect, base_color, label=""):
-        """Desenha uma barra moderna com gradiente e efeitos"""
+    def create_vertical_fade(self, width, height, top_alpha, bottom_alpha):
+        """Fundo com alpha variando de cima para baixo"""
+        return gradients.alpha_gradient(width, height, self.colors['background'][:3], top_alpha, bottom_alpha)
+
+    @staticmethod
+    def blit_layer(target, source, position, alpha=255):
+        """Blit com alpha pré-multiplicado: camadas translúcidas se acumulam certo
+        numa superfície transparente e depois na tela"""
+        # convert_alpha() também normaliza o pitch do texto renderizado, que
+        # premul_alpha() não respeita
+        premultiplied = source.convert_alpha().premul_alpha()
+        if alpha < 255:
+            premultiplied.fill((alpha, alpha, alpha, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        target.blit(premultiplied, position, special_flags=pygame.BLEND_PREMULTIPLIED)
+
+    def blit_text(self, target, font, text, position, antialias=True):
+        """Texto com sombra (1px) na posição dada; retorna o rect do texto"""
+        text_surface = font.render(text, antialias, self.colors['text'])
+        shadow_surface = font.render(text, antialias, self.colors['text_shadow'])
+        text_rect = text_surface.get_rect(**position)
+        self.blit_layer(target, shadow_surface, text_rect.move(1, 1))
+        self.blit_layer(target, text_surface, text_rect)
+        return text_rect
+
+    # --- Camadas do HUD -------------------------------------------------
+    # Cada render_* desenha um elemento numa superfície própria e retorna
+    # (superfície, posição na tela). Só são chamados quando o estado muda.
+
+    def bar_colors(self, ratio, base_color, label):
+        """Cores do gradiente da barra para o progresso atual"""
+        if label == "health":
+            if ratio > 0.6:
+                return self.colors['health_high'], (50, 200, 50)
+            if ratio > 0.3:
+                return self.colors['health_med'], (200, 200, 50)
+            return self.colors['health_low'], (200, 50, 50)
+        return base_color, tuple(max(0, c - 50) for c in base_color)
+
+    def render_bar(self, current, max_amount, bg_rect, base_color, label=""):
+        """Barra moderna com gradiente, bordas e valor"""
+        surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+        local_rect = surface.get_rect()
+        
         # Background com transparência
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-        bg_surface.fill(self.colors['background'])
-        self.display_surface.blit(bg_surface, bg_rect)
+        background = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
+        background.fill(self.colors['background'])
+        self.blit_layer(surface, background, (0, 0))
         
         # Calcular progresso
         ratio = max(0, current / max_amount) if max_amount > 0 else 0
         current_width = int(bg_rect.width * ratio)
-        
         if current_width > 0:
-            # Determinar cores baseadas no progresso
-            if label == "health":
-                if ratio > 0.6:
-                    color1, color2 = self.colors['health_high'], (50, 200, 50)
-                elif ratio > 0.3:
-                    color1, color2 = self.colors['health_med'], (200, 200, 50)
-                else:
-                    color1, color2 = self.colors['health_low'], (200, 50, 50)
-            else:
-                color1, color2 = base_color, tuple(max(0, c - 50) for c in base_color)
-            
-            # Criar gradiente da barra
-            if current_width > 0:
-                gradient_bar = self.create_gradient_bar(current_width, bg_rect.height, color1, color2)
-                self.display_surface.blit(gradient_bar, bg_rect)
-        
-        # Efeito pulse para vida baixa
-        if label == "health" and ratio < 0.2:
-            pulse = 0.5 + 0.5 * math.sin(self.animation_time * 0.1)
-            glow = self.create_glowing_border(bg_rect, self.colors['health_low'], pulse)
-            self.display_surface.blit(glow, (bg_rect.x - 10, bg_rect.y - 10))
-        
-        # Borda principal
-        pygame.draw.rect(self.display_surface, self.colors['border'], bg_rect, 2)
+            color1, color2 = self.bar_colors(ratio, base_color, label)
+            # Um gradiente da largura total, recortado no progresso atual
+            gradient = self.create_gradient_bar(bg_rect.width, bg_rect.height, color1, color2)
+            surface.blit(gradient, (0, 0), (0, 0, current_width, bg_rect.height))
         
-        # Borda interna sutil
-        inner_rect = pygame.Rect(bg_rect.x + 2, bg_rect.y + 2, bg_rect.width - 4, bg_rect.height - 4)
-        pygame.draw.rect(self.display_surface, (60, 60, 80), inner_rect, 1)
+        # Borda principal e borda interna sutil
+        pygame.draw.rect(surface, self.colors['border'], local_rect, 2)
+        pygame.draw.rect(surface, (60, 60, 80), local_rect.inflate(-4, -4), 1)
         
         # Texto de valor se houver espaço
         if bg_rect.width > 100:
-            text = f"{int(current)}/{int(max_amount)}"
-            text_surface = self.font.render(text, True, self.colors['text'])
-            text_rect = text_surface.get_rect(center=bg_rect.center)
-            
-            # Sombra do texto
-            shadow_surface = self.font.render(text, True, self.colors['text_shadow'])
-            shadow_rect = text_rect.copy()
-            shadow_rect.x += 1
-            shadow_rect.y += 1
-            
-            self.display_surface.blit(shadow_surface, shadow_rect)
-            self.display_surface.blit(text_surface, text_rect)
-
-    def show_enhanced_instructions(self, player):
-        """Mostra instruções com visual melhorado"""
-        instructions = {
-            1: "Espaço: Atacar | Q: Trocar arma | E: Trocar magia | Ctrl: Usar magia",
-            2: "Encontre uma saída do labirinto! | Q: Trocar arma | E: Magia", 
-            3: f"Você tem {player.inventory['keys']} chaves | Q: Trocar arma",
-            4: "Fuja! | Q: Trocar arma | E: Magia"
-        }
-        
-        text = instructions.get(self.current_level, "")
-        if not text:
-            return
+            self.blit_text(surface, self.font, f"{int(current)}/{int(max_amount)}",
+                           {'center': local_rect.center})
         
+        return surface, bg_rect.topleft
+
+    def render_instructions(self, text):
+        """Instruções com visual melhorado"""
         text_surf = self.font.render(text, False, self.colors['text'])
         x = self.display_surface.get_size()[0] - 20
         y = self.display_surface.get_size()[1] - 20
         text_rect = text_surf.get_rect(bottomright=(x, y))
-
-        # Background com gradiente sutil
         bg_rect = text_rect.inflate(25, 15)
-        bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-        
-        # Gradiente de fundo
-        for i in range(bg_rect.height):
-            alpha = int(200 - (i / bg_rect.height) * 50)
-            color = (*self.colors['background'][:3], alpha)
-            pygame.draw.line(bg_surface, color, (0, i), (bg_rect.width, i))
         
-        # Borda externa com glow sutil
-        glow = self.create_glowing_border(bg_rect, self.colors['border'], 0.3)
-        self.display_surface.blit(glow, (bg_rect.x - 10, bg_rect.y - 10))
+        # Margem de 10px para o glow
+        surface = pygame.Surface((bg_rect.width + 20, bg_rect.height + 20), pygame.SRCALPHA)
+        local_bg = pygame.Rect(10, 10, bg_rect.width, bg_rect.height)
         
-        self.display_surface.blit(bg_surface, bg_rect)
+        # Borda externa com glow sutil e fundo com gradiente
+        self.blit_layer(surface, self.create_glowing_border(bg_rect, self.colors['border'], 0.3), (0, 0))
+        self.blit_layer(surface, self.create_vertical_fade(bg_rect.width, bg_rect.height, 200, 150), local_bg)
         
-        # Sombra do texto
+        # Texto com sombra
+        text_pos = text_rect.move(10 - bg_rect.x, 10 - bg_rect.y)
         shadow_surf = self.font.render(text, False, self.colors['text_shadow'])
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += 2
-        shadow_rect.y += 2
-        self.display_surface.blit(shadow_surf, shadow_rect)
-        
-        # Texto principal
-        self.display_surface.blit(text_surf, text_rect)
+        self.blit_layer(surface, shadow_surf, text_pos.move(2, 2))
+        self.blit_layer(surface, text_surf, text_pos)
         
         # Bordas elegantes
-        pygame.draw.rect(self.display_surface, self.colors['border'], bg_rect, 2)
-        pygame.draw.rect(self.display_surface, (180, 180, 200), bg_rect, 1)
-
-    def enhanced_selection_box(self, left, top, has_switched):
-        """Caixa de seleção com efeitos visuais melhorados"""
-        bg_rect = pygame.Rect(left, top, ITEM_BOX_SIZE, ITEM_BOX_SIZE)
+        pygame.draw.rect(surface, self.colors['border'], local_bg, 2)
+        pygame.draw.rect(surface, (180, 180, 200), local_bg, 1)
         
-        # Background com gradiente
-        bg_surface = pygame.Surface((ITEM_BOX_SIZE, ITEM_BOX_SIZE), pygame.SRCALPHA)
-        
-        # Gradiente de fundo
-        for y in range(ITEM_BOX_SIZE):
-            ratio = y / ITEM_BOX_SIZE
-            alpha = int(160 + 40 * (1 - ratio))
-            color = (*self.colors['background'][:3], alpha)
-            pygame.draw.line(bg_surface, color, (0, y), (ITEM_BOX_SIZE, y))
+        return surface, (bg_rect.x - 10, bg_rect.y - 10)
+
+    def render_selection_box(self, left, top, item_surf, has_switched):
+        """Caixa de seleção com o item centralizado"""
+        # Margem de 10px para o glow
+        surface = pygame.Surface((ITEM_BOX_SIZE + 20, ITEM_BOX_SIZE + 20), pygame.SRCALPHA)
+        bg_rect = pygame.Rect(10, 10, ITEM_BOX_SIZE, ITEM_BOX_SIZE)
         
-        self.display_surface.blit(bg_surface, bg_rect)
+        self.blit_layer(surface, self.create_vertical_fade(ITEM_BOX_SIZE, ITEM_BOX_SIZE, 200, 160), bg_rect)
         
-        # Efeito de estado ativo
         if has_switched:
-            # Glow dourado para item ativo
-            glow = self.create_glowing_border(bg_rect, self.colors['border_active'], 0.8)
-            self.display_surface.blit(glow, (bg_rect.x - 10, bg_rect.y - 10))
-            
-            # Borda dourada
-            pygame.draw.rect(self.display_surface, self.colors['border_active'], bg_rect, 3)
-            pygame.draw.rect(self.display_surface, (255, 255, 200), bg_rect, 1)
-            
-            # Highlight interno
-            inner_rect = pygame.Rect(bg_rect.x + 4, bg_rect.y + 4, bg_rect.width - 8, bg_rect.height - 8)
-            pygame.draw.rect(self.display_surface, (255, 255, 150, 50), inner_rect)
+            # Glow dourado, borda dourada e highlight interno para item ativo
+            self.blit_layer(surface, self.create_glowing_border(bg_rect, self.colors['border_active'], 0.8), (0, 0))
+            pygame.draw.rect(surface, self.colors['border_active'], bg_rect, 3)
+            pygame.draw.rect(surface, (255, 255, 200), bg_rect, 1)
+            pygame.draw.rect(surface, (255, 255, 150), bg_rect.inflate(-8, -8))
         else:
             # Estado normal
-            pygame.draw.rect(self.display_surface, self.colors['border'], bg_rect, 2)
-            pygame.draw.rect(self.display_surface, (160, 160, 180), bg_rect, 1)
+            pygame.draw.rect(surface, self.colors['border'], bg_rect, 2)
+            pygame.draw.rect(surface, (160, 160, 180), bg_rect, 1)
         
-        return bg_rect
+        self.blit_layer(surface, item_surf, item_surf.get_rect(center=bg_rect.center))
+        return surface, (left - 10, top - 10)
 
-    def weapon_overlay(self, weapon_index, has_switched):
-        """Overlay de arma melhorado"""
-        bg_rect = self.enhanced_selection_box(15, 630, has_switched)
-        weapon_surf = self.weapon_graphics[weapon_index]
-        weapon_rect = weapon_surf.get_rect(center=bg_rect.center)
-        self.display_surface.blit(weapon_surf, weapon_rect)
+    def render_status_message(self, message, alpha_mult):
+        """Mensagem de status com fundo, glow e bordas no alpha do fade"""
+        text_surface = self.pixelated_font.render(message, True, self.colors['text'])
+        x = self.display_surface.get_size()[0] // 2 - text_surface.get_width() // 2
+        y = self.display_surface.get_size()[1] - 100
+        text_rect = text_surface.get_rect(topleft=(x, y))
+        bg_rect = text_rect.inflate(40, 20)
+        
+        surface = pygame.Surface((bg_rect.width + 20, bg_rect.height + 20), pygame.SRCALPHA)
+        local_bg = pygame.Rect(10, 10, bg_rect.width, bg_rect.height)
+        
+        # Glow baseado no fade e gradiente com alpha dinâmico
+        if alpha_mult > 0.5:
+            self.blit_layer(surface, self.create_glowing_border(bg_rect, self.colors['border'], alpha_mult * 0.5), (0, 0))
+        base_alpha = int(200 * alpha_mult)
+        self.blit_layer(surface, self.create_vertical_fade(bg_rect.width, bg_rect.height, base_alpha, base_alpha - 60), local_bg)
+        
+        # Sombra e texto com alpha
+        text_pos = text_rect.move(10 - bg_rect.x, 10 - bg_rect.y)
+        shadow_surface = self.pixelated_font.render(message, True, self.colors['text_shadow'])
+        self.blit_layer(surface, shadow_surface, text_pos.move(2, 2), int(255 * alpha_mult))
+        self.blit_layer(surface, text_surface, text_pos, int(255 * alpha_mult))
+        
+        # Bordas com alpha
+        border = pygame.Surface(local_bg.size, pygame.SRCALPHA)
+        pygame.draw.rect(border, (*self.colors['border'], int(255 * alpha_mult)), border.get_rect(), 2)
+        self.blit_layer(surface, border, local_bg)
+        
+        return surface, (bg_rect.x - 10, bg_rect.y - 10)
 
-    def magic_overlay(self, magic_index, has_switched):
-        """Overlay de magia melhorado"""
-        bg_rect = self.enhanced_selection_box(85, 630, has_switched)
-        magic_surf = self.magic_graphics[magic_index]
-        magic_rect = magic_surf.get_rect(center=bg_rect.center)
-        self.display_surface.blit(magic_surf, magic_rect)
-
-    def show_enhanced_status_message(self):
-        """Mensagem de status com visual melhorado"""
+    def status_alpha(self):
+        """Alpha do fade in/out da mensagem de status (None = sem mensagem)"""
         if not self.status_message:
+            return None
+        elapsed_time = timer_scheduler.now - self.status_message_start_time
+        if elapsed_time >= self.status_message_duration:
+            return None
+        progress = elapsed_time / self.status_message_duration
+        if progress < 0.1:
+            return progress / 0.1
+        if progress > 0.9:
+            return (1 - progress) / 0.1
+        return 1.0
+
+    def update_layer(self, name, state, render, *args):
+        """Re-renderiza a camada só se o estado dela mudou"""
+        layer = self.layers.get(name)
+        if layer is not None and layer[0] == state:
             return
-        
-        current_time = pygame.time.get_ticks()
-        elapsed_time = current_time - self.status_message_start_time
+        if state is None:
+            self.layers.pop(name, None)
+        else:
+            surface, position = render(*args)
+            self.layers[name] = (state, surface, surface.get_rect(topleft=position))
+        self.hud_dirty = True
 
-        if elapsed_time < self.status_message_duration:
-            # Efeito fade in/out
-            progress = elapsed_time / self.status_message_duration
-            if progress < 0.1:
-                alpha_mult = progress / 0.1
-            elif progress > 0.9:
-                alpha_mult = (1 - progress) / 0.1
-            else:
-                alpha_mult = 1.0
-            
-            text_surface = self.pixelated_font.render(self.status_message, True, self.colors['text'])
-            x = self.display_surface.get_size()[0] // 2 - text_surface.get_width() // 2
-            y = self.display_surface.get_size()[1] - 100
-            text_rect = text_surface.get_rect(topleft=(x, y))
+    def compose_hud(self):
+        """Junta as camadas na superfície única do HUD"""
+        self.hud_surface.fill((0, 0, 0, 0))
+        self.hud_regions = []
+        for name in self.LAYER_ORDER:
+            layer = self.layers.get(name)
+            if layer is None:
+                continue
+            _, surface, rect = layer
+            self.hud_surface.blit(surface, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
+            self.hud_regions.append((self.hud_surface, rect.topleft, rect, pygame.BLEND_PREMULTIPLIED))
+        self.hud_dirty = False
 
-            # Background elegante com fade
-            bg_rect = text_rect.inflate(40, 20)
-            bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA)
-            
-            # Gradiente com alpha dinâmico
-            for i in range(bg_rect.height):
-                base_alpha = int(200 * alpha_mult)
-                alpha = int(base_alpha - (i / bg_rect.height) * 60)
-                color = (*self.colors['background'][:3], alpha)
-                pygame.draw.line(bg_surface, color, (0, i), (bg_rect.width, i))
-            
-            # Glow baseado no fade
-            if alpha_mult > 0.5:
-                glow = self.create_glowing_border(bg_rect, self.colors['border'], alpha_mult * 0.5)
-                self.display_surface.blit(glow, (bg_rect.x - 10, bg_rect.y - 10))
-            
-            self.display_surface.blit(bg_surface, bg_rect)
-            
-            # Sombra com alpha
-            shadow_surface = self.pixelated_font.render(self.status_message, True, self.colors['text_shadow'])
-            shadow_surface.set_alpha(int(255 * alpha_mult))
-            shadow_rect = text_rect.copy()
-            shadow_rect.x += 2
-            shadow_rect.y += 2
-            self.display_surface.blit(shadow_surface, shadow_rect)
-            
-            # Texto principal com alpha
-            text_surface.set_alpha(int(255 * alpha_mult))
-            self.display_surface.blit(text_surface, text_rect)
-            
-            # Bordas com alpha
-            border_color = (*self.colors['border'], int(255 * alpha_mult))
-            pygame.draw.rect(self.display_surface, border_color, bg_rect, 2)
-        else:
-            self.status_message = ""
+    def bar_state(self, current, max_amount, bg_rect, label):
+        """O que muda o desenho de uma barra: largura, texto e faixa de cor"""
+        ratio = max(0, current / max_amount) if max_amount > 0 else 0
+        band = (ratio > 0.6, ratio > 0.3) if label == "health" else None
+        return int(bg_rect.width * ratio), int(current), int(max_amount), band
 
     def display(self, player):
-        """Display principal da UI melhorada"""
+        """Display principal da UI melhorada.
+
+        Cada elemento é uma camada cacheada; só as que mudaram são redesenhadas
+        e o HUD chega à tela num único blits() quando nada muda.
+        """
         # Atualizar timer de animação
         self.animation_time += 0.1
         
         # Barras modernas
-        self.show_modern_bar(
-            player.health, 
-            player.stats['health'], 
-            self.health_bar_rect, 
-            self.colors['health_high'],
-            "health"
-        )
-        
-        self.show_modern_bar(
-            player.energy, 
-            player.stats['energy'], 
-            self.energy_bar_rect, 
-            self.colors['energy']
-        )
+        max_health = player.stats['health']
+        self.update_layer('health', self.bar_state(player.health, max_health, self.health_bar_rect, "health"),
+                          self.render_bar, player.health, max_health, self.health_bar_rect,
+                          self.colors['health_high'], "health")
+        max_energy = player.stats['energy']
+        self.update_layer('energy', self.bar_state(player.energy, max_energy, self.energy_bar_rect, ""),
+                          self.render_bar, player.energy, max_energy, self.energy_bar_rect,
+                          self.colors['energy'])
         
         # Elementos de UI melhorados
-        self.show_enhanced_instructions(player)
-        self.show_enhanced_status_message()
+        instructions = self.INSTRUCTIONS.get(self.current_level, "").format(keys=player.inventory['keys'])
+        self.update_layer('instructions', instructions or None, self.render_instructions, instructions)
+        
+        alpha_mult = self.status_alpha()
+        status_state = None if alpha_mult is None else (self.status_message, round(alpha_mult, 2))
+        self.update_layer('status', status_state, self.render_status_message,
+                          self.status_message, alpha_mult)
         
         # Overlays de arma e magia
-        self.weapon_overlay(player.weapon_index, not player.can_switch_weapon)
-        self.magic_overlay(player.magic_index, not player.can_switch_magic)
+        weapon_switched = not player.can_switch_weapon
+        self.update_layer('weapon', (player.weapon_index, weapon_switched), self.render_selection_box,
+                          15, 630, self.weapon_graphics[player.weapon_index], weapon_switched)
+        magic_switched = not player.can_switch_magic
+        self.update_layer('magic', (player.magic_index, magic_switched), self.render_selection_box,
+                          85, 630, self.magic_graphics[player.magic_index], magic_switched)
+        
+        if self.hud_dirty:
+            self.compose_hud()
+        self.display_surface.blits(self.hud_regions, doreturn=False)
+        
+        # Efeito pulse para vida baixa - o único elemento animado a cada frame
+        ratio = player.health / max_health if max_health > 0 else 0
+        if ratio < 0.2:
+            pulse = 0.5 + 0.5 * math.sin(self.animation_time * 0.1)
+            glow = self.create_glowing_border(self.health_bar_rect, self.colors['health_low'])
+            glow.set_alpha(int(255 * pulse))
+            self.display_surface.blit(glow, (self.health_bar_rect.x - 10, self.health_bar_rect.y - 10))
 
     def set_status_message(self, message):
         """Define mensagem de status"""
         self.status_message = message
-        self.status_message_start_time = pygame.time.get_ticks()
+        self.status_message_start_time = timer_scheduler.now
+        # A mensagem some sozinha ao fim da duração
+        timer_scheduler.cancel(self.status_message_timer)
+        self.status_message_timer = timer_scheduler.schedule(self.status_message_duration, setattr, self, 'status_message', "")
 
 # Rename class to maintain compatibility
 UI = EnhancedUI
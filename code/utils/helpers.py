@@ -173,30 +173,10 @@ def create_gradient_surface(width: int, height: int,
         vertical (bool): Se o gradiente é vertical
         
     Returns:
-        pygame.Surface: Surface com gradiente
-    """
-    surface = pygame.Surface((width, height))
-    
-    if vertical:
-        for y in range(height):
-            t = y / height
-            color = (
-                lerp(start_color[0], end_color[0], t),
-                lerp(start_color[1], end_color[1], t),
-                lerp(start_color[2], end_color[2], t)
-            )
-            pygame.draw.line(surface, color, (0, y), (width, y))
-    else:
-        for x in range(width):
-            t = x / width
-            color = (
-                lerp(start_color[0], end_color[0], t),
-                lerp(start_color[1], end_color[1], t),
-                lerp(start_color[2], end_color[2], t)
-            )
-            pygame.draw.line(surface, color, (x, 0), (x, height))
-    
-    return surface
+        pygame.Surface: Surface com gradiente (nova, pode ser modificada)
+    """
+    from gradients import linear_gradient
+    return linear_gradient(width, height, tuple(start_color), tuple(end_color), vertical).copy()
 
 
 def format_time(seconds: float) -> str:
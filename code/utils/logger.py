@@ -1,21 +1,113 @@
 """
 Sistema de logging para o jogo
 """
+import atexit
 import logging
 import os
 import sys
-from datetime import datetime
+import threading
+from collections import deque
+from logging.handlers import RotatingFileHandler
 from typing import Optional
 
+# Arquivo de log só quando pedido (GAME_LOG_FILE=logs/game.log): cada processo
+# do jogo, do bench e dos testes headless importa o logger
+LOG_FILE_ENV = "GAME_LOG_FILE"
+LOG_FILE_MAX_BYTES = 1024 * 1024
+LOG_FILE_BACKUPS = 3
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Handler assíncrono: o thread do jogo só enfileira o LogRecord num buffer
+    circular; formatação e I/O (console/arquivo) acontecem num thread de fundo.
+    Se o buffer encher, os registros mais antigos são descartados - o jogo
+    nunca espera pelo terminal.
+    """
+    
+    def __init__(self, targets, capacity: int = 1024):
+        super().__init__(logging.DEBUG)
+        self.targets = targets
+        self.buffer = deque(maxlen=capacity)
+        self.dropped = 0
+        self._wakeup = threading.Condition()
+        self._running = True
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._drain, name="game-log", daemon=True)
+        self._thread.start()
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        with self._wakeup:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.dropped += 1
+            self.buffer.append(record)
+            self._wakeup.notify()
+    
+    def _drain(self) -> None:
+        while True:
+            with self._wakeup:
+                while self._running and not self.buffer:
+                    self._wakeup.wait()
+                if not self.buffer:
+                    return
+                records = list(self.buffer)
+                self.buffer.clear()
+                self._busy = True
+            for record in records:
+                for target in self.targets:
+                    if record.levelno >= target.level:
+                        target.handle(record)
+            with self._wakeup:
+                self._busy = False
+                self._wakeup.notify_all()
+    
+    def flush(self) -> None:
+        """Espera o thread de fundo escrever o que já está no buffer."""
+        with self._wakeup:
+            while (self.buffer or self._busy) and self._thread.is_alive():
+                self._wakeup.wait(0.1)
+        for target in self.targets:
+            target.flush()
+    
+    def close(self) -> None:
+        """Escreve o restante do buffer e encerra o thread de fundo."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=2)
+        if self.dropped:
+            record = logging.LogRecord("game-log", logging.WARNING, __file__, 0,
+                                       "⚠️ %d registros de log descartados (buffer cheio)",
+                                       (self.dropped,), None)
+            for target in self.targets:
+                if record.levelno >= target.level:
+                    target.handle(record)
+        for target in self.targets:
+            try:
+                target.flush()
+                target.close()
+            except (ValueError, OSError):
+                pass  # stream já fechado por quem o criou (ex.: captura do pytest)
+        super().close()
+
 
 class GameLogger:
     """
     Logger customizado para o jogo.
     """
     
-    def __init__(self, name: str = "game", log_file: Optional[str] = None):
+    def __init__(self, name: str = "game", log_file: Optional[str] = None,
+                 level: Optional[str] = None):
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        # Nível mínimo (GAME_LOG_LEVEL=DEBUG mostra as mensagens dos loops de jogo);
+        # abaixo dele as chamadas retornam antes de criar qualquer registro
+        self.logger.setLevel(level or os.environ.get("GAME_LOG_LEVEL", "INFO").upper())
         
         # Evita duplicação de handlers
         if not self.logger.handlers:
@@ -32,54 +124,73 @@ class GameLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         
+        targets = []
+        
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
+        console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        targets.append(console_handler)
         
         # File handler
         if log_file:
             try:
                 # Cria diretório se não existir
-                os.makedirs(os.path.dirname(log_file), exist_ok=True)
+                os.makedirs(os.path.dirname(log_file) or '.', exist_ok=True)
                 
-                file_handler = logging.FileHandler(log_file, encoding='utf-8')
+                # Nome fixo com rotação: não acumula um arquivo novo por execução
+                file_handler = RotatingFileHandler(log_file, maxBytes=LOG_FILE_MAX_BYTES,
+                                                   backupCount=LOG_FILE_BACKUPS, encoding='utf-8')
                 file_handler.setLevel(logging.DEBUG)
                 file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+                targets.append(file_handler)
             except Exception as e:
                 print(f"Erro ao criar arquivo de log: {e}")
+        
+        # Console e arquivo são alimentados pelo thread de fundo
+        self.handler = RingBufferHandler(targets)
+        self.logger.addHandler(self.handler)
+        atexit.register(self.handler.close)
+    
+    def is_enabled(self, level: int) -> bool:
+        """Permite pular trabalho caro antes de montar os argumentos."""
+        return self.logger.isEnabledFor(level)
+    
+    def set_level(self, level) -> None:
+        """Altera o nível mínimo em tempo de execução."""
+        self.logger.setLevel(level)
     
-    def debug(self, message: str) -> None:
+    # As mensagens aceitam argumentos no estilo %: a formatação só acontece
+    # se o nível estiver habilitado, e então no thread de fundo
+    def debug(self, message: str, *args) -> None:
         """Log de debug."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """Log de informação."""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """Log de aviso."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
     
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args) -> None:
         """Log de erro."""
-        self.logger.error(message)
+        self.logger.error(message, *args)
     
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args) -> None:
         """Log crítico."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args)
     
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args) -> None:
         """Log de exceção com traceback."""
-        self.logger.exception(message)
+        self.logger.exception(message, *args)
 
 
 # Instância global do logger
 game_logger = GameLogger(
     name="corrida_reliquia",
-    log_file=f"logs/game_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    log_file=os.environ.get(LOG_FILE_ENV)
 )
 
 # Aliases para facilitar uso
@@ -1,93 +1,154 @@
 import pygame 
 import math
-from settings import weapon_data
+from settings import weapon_data, magic_data, TICK_DURATION
+from timer_scheduler import timer_scheduler
+from assets import asset_pipeline
+from utils.logger import game_logger
+
+# Superfícies compartilhadas por todos os golpes - carregadas do disco uma única vez
+weapon_surfaces = {}        # (weapon_type, direction) -> Surface
+damage_area_surfaces = {}   # radius -> Surface
+magic_frames = {}           # style -> [Surface]
+
+
+class SpritePool:
+	"""Reaproveita sprites de ataque entre golpes em vez de recriá-los"""
+	def __init__(self, sprite_class):
+		self.sprite_class = sprite_class
+		self.free = []
+
+	def acquire(self, *args):
+		"""Retorna um sprite reiniciado com os argumentos do construtor"""
+		if self.free:
+			sprite = self.free.pop()
+			# Sem isso a interpolação do primeiro frame partiria do golpe anterior
+			sprite.previous_center = None
+			sprite.reset(*args)
+		else:
+			sprite = self.sprite_class(*args)
+			sprite.pool = self
+		return sprite
+
+	def release(self, sprite):
+		self.free.append(sprite)
+
+	def prewarm(self, count, *args):
+		"""Garante `count` sprites livres, construídos fora dos grupos"""
+		while len(self.free) < count:
+			sprite = self.sprite_class(*args)
+			sprite.pool = self
+			sprite.kill()
+			self.release(sprite)
+
 
 class Weapon(pygame.sprite.Sprite):
 	def __init__(self,player,groups):
-		super().__init__(groups)
+		super().__init__()
 		self.sprite_type = 'weapon'
+		self.pool = None
+		self.duration = 200  # Attack animation duration
+		self.reset(player, groups)
+
+	def reset(self, player, groups):
+		"""Start a new swing (on creation and when reused from the pool)"""
 		self.player = player
 		self.direction = player.status.split('_')[0]
 		self.weapon_type = player.weapon
 		
 		# Animation properties
-		self.start_time = pygame.time.get_ticks()
-		self.duration = 200  # Attack animation duration
+		self.start_time = timer_scheduler.now
 		self.animation_progress = 0.0
 
-		# Load weapon graphic with proper scaling
-		self.original_weapon_surf = self.load_weapon_graphic()
+		# Weapon graphic with proper scaling (cached per weapon and direction)
+		self.original_weapon_surf = self.get_weapon_graphic(self.weapon_type, self.direction)
 		
 		# Calculate proper positioning
 		self.base_position = self.calculate_base_position()
 		
 		# Initialize with first frame
 		self.update_animation()
+		self.add(groups)
+
+	def kill(self):
+		"""Leave all groups and go back to the pool"""
+		if self.alive():
+			super().kill()
+			if self.pool:
+				self.pool.release(self)
 
-	def load_weapon_graphic(self):
+	@staticmethod
+	def get_weapon_graphic(weapon_type, direction):
+		key = (weapon_type, direction)
+		if key not in weapon_surfaces:
+			weapon_surfaces[key] = Weapon.load_weapon_graphic(weapon_type, direction)
+		return weapon_surfaces[key]
+
+	@staticmethod
+	def load_weapon_graphic(weapon_type, direction):
 		"""Load directional weapon graphic (the correct approach!)"""
 		try:
 			# Use directional files instead of full.png - this is the key!
-			direction_file = f"../graphics/weapons/{self.weapon_type}/{self.direction}.png"
-			print(f"🔧 Carregando: {direction_file}")
+			direction_file = f"../graphics/weapons/{weapon_type}/{direction}.png"
+			game_logger.debug("🔧 Carregando: %s", direction_file)
 			
-			weapon_surf = pygame.image.load(direction_file).convert_alpha()
+			weapon_surf = asset_pipeline.image(direction_file)
 			original_size = weapon_surf.get_size()
-			print(f"📏 Tamanho original: {original_size}")
+			game_logger.debug("📏 Tamanho original: %s", original_size)
 			
 			# Scale 2x to make it visible but preserve aspect ratio
 			new_width = original_size[0] * 2
 			new_height = original_size[1] * 2
 			weapon_surf = pygame.transform.scale(weapon_surf, (new_width, new_height))
 			
-			print(f"✅ {self.weapon_type} {self.direction}: {original_size} -> {weapon_surf.get_size()}")
+			game_logger.debug("✅ %s %s: %s -> %s", weapon_type, direction, original_size, weapon_surf.get_size())
 			return weapon_surf
 			
 		except Exception as e:
-			print(f"⚠️ Erro ao carregar {self.weapon_type}/{self.direction}.png: {e}")
-			print(f"🔄 Tentando fallback para full.png...")
+			game_logger.warning("⚠️ Erro ao carregar %s/%s.png: %s", weapon_type, direction, e)
+			game_logger.debug("🔄 Tentando fallback para full.png...")
 			
 			# Fallback to full.png if directional file doesn't exist
 			try:
-				weapon_surf = pygame.image.load(weapon_data[self.weapon_type]['graphic']).convert_alpha()
+				weapon_surf = asset_pipeline.image(weapon_data[weapon_type]['graphic'])
 				# Scale 3x for full.png since they're smaller
 				original_size = weapon_surf.get_size()
 				weapon_surf = pygame.transform.scale(weapon_surf, (original_size[0] * 3, original_size[1] * 3))
-				print(f"🔄 Fallback {self.weapon_type}: {original_size} -> {weapon_surf.get_size()}")
+				game_logger.debug("🔄 Fallback %s: %s -> %s", weapon_type, original_size, weapon_surf.get_size())
 				return weapon_surf
 			except Exception as e2:
-				print(f"❌ Fallback também falhou: {e2}")
-				return self.create_fallback_weapon()
+				game_logger.warning("❌ Fallback também falhou: %s", e2)
+				return Weapon.create_fallback_weapon(weapon_type)
 	
-	def create_fallback_weapon(self):
+	@staticmethod
+	def create_fallback_weapon(weapon_type):
 		"""Create enhanced fallback weapon graphics"""
-		if self.weapon_type == 'sword':
+		if weapon_type == 'sword':
 			surf = pygame.Surface([48, 48], pygame.SRCALPHA)
 			# Draw sword shape
 			pygame.draw.rect(surf, (192, 192, 192), (20, 8, 8, 32))  # Blade
 			pygame.draw.rect(surf, (139, 69, 19), (18, 36, 12, 8))   # Handle
 			pygame.draw.circle(surf, (255, 215, 0), (24, 42), 3)     # Pommel
 			
-		elif self.weapon_type == 'lance':
+		elif weapon_type == 'lance':
 			surf = pygame.Surface([64, 16], pygame.SRCALPHA)
 			# Draw lance shape
 			pygame.draw.rect(surf, (139, 69, 19), (8, 6, 48, 4))     # Shaft
 			pygame.draw.polygon(surf, (192, 192, 192), [(56, 2), (62, 8), (56, 14)])  # Tip
 			
-		elif self.weapon_type == 'axe':
+		elif weapon_type == 'axe':
 			surf = pygame.Surface([52, 52], pygame.SRCALPHA)
 			# Draw axe shape
 			pygame.draw.rect(surf, (139, 69, 19), (22, 16, 8, 28))   # Handle
 			pygame.draw.polygon(surf, (105, 105, 105), [(22, 16), (8, 12), (8, 28), (22, 24)])  # Blade
 			
-		elif self.weapon_type == 'rapier':
+		elif weapon_type == 'rapier':
 			surf = pygame.Surface([56, 12], pygame.SRCALPHA)
 			# Draw rapier shape
 			pygame.draw.rect(surf, (255, 215, 0), (8, 4, 40, 4))     # Thin blade
 			pygame.draw.rect(surf, (139, 69, 19), (44, 2, 8, 8))     # Handle
 			pygame.draw.circle(surf, (192, 192, 192), (50, 6), 2)    # Guard
 			
-		elif self.weapon_type == 'sai':
+		elif weapon_type == 'sai':
 			surf = pygame.Surface([32, 48], pygame.SRCALPHA)
 			# Draw sai shape
 			pygame.draw.rect(surf, (70, 130, 180), (14, 8, 4, 32))   # Main prong
@@ -128,7 +189,7 @@ class Weapon(pygame.sprite.Sprite):
 	
 	def update_animation(self):
 		"""Update weapon animation with smooth movement"""
-		elapsed_time = pygame.time.get_ticks() - self.start_time
+		elapsed_time = timer_scheduler.now - self.start_time
 		self.animation_progress = min(elapsed_time / self.duration, 1.0)
 		
 		# Create smooth animation based on weapon type
@@ -149,7 +210,7 @@ class Weapon(pygame.sprite.Sprite):
 		if abs(animation_offset) > 0:
 			self.image = pygame.transform.rotate(self.original_weapon_surf, animation_offset)
 		else:
-			self.image = self.original_weapon_surf.copy()
+			self.image = self.original_weapon_surf  # shared surface, never modified
 	
 	def get_base_rotation_angle(self):
 		"""Get base rotation angle for each weapon type and direction"""
@@ -235,58 +296,79 @@ class Weapon(pygame.sprite.Sprite):
 		self.update_animation()
 		
 		# Remove weapon when animation is complete
-		elapsed_time = pygame.time.get_ticks() - self.start_time
+		elapsed_time = timer_scheduler.now - self.start_time
 		if elapsed_time >= self.duration:
 			self.kill()
 
 
 class Weapon360Damage(pygame.sprite.Sprite):
 	"""Invisible sprite for 360-degree damage detection"""
+	# Adjust radius based on weapon type
+	radius_map = {
+		'sword': 80,
+		'lance': 100,  # Longer reach
+		'axe': 85,
+		'rapier': 75,
+		'sai': 70
+	}
+
 	def __init__(self, player, groups):
-		super().__init__(groups)
+		super().__init__()
 		self.sprite_type = 'weapon'
-		self.player = player
-		self.time_created = pygame.time.get_ticks()
+		self.pool = None
 		self.duration = 100  # Very short duration for damage detection
+		self.expire_timer = None
+		self.reset(player, groups)
+
+	def reset(self, player, groups):
+		"""Re-centre the damage area on the player (creation and pool reuse)"""
+		self.player = player
+		self.time_created = timer_scheduler.now
+		radius = self.radius_map.get(player.weapon, 80)
 		
-		# Adjust radius based on weapon type
-		radius_map = {
-			'sword': 80,
-			'lance': 100,  # Longer reach
-			'axe': 85,
-			'rapier': 75,
-			'sai': 70
-		}
-		radius = radius_map.get(player.weapon, 80)
-		
-		# Create invisible damage area
-		self.image = pygame.Surface([radius*2, radius*2], pygame.SRCALPHA)
-		# Make it completely transparent
+		# Invisible damage area, completely transparent (shared per radius)
+		if radius not in damage_area_surfaces:
+			damage_area_surfaces[radius] = pygame.Surface([radius*2, radius*2], pygame.SRCALPHA)
+		self.image = damage_area_surfaces[radius]
 		
 		# Position at player center
 		self.rect = self.image.get_rect(center=player.rect.center)
 		self.hitbox = self.rect
-	
-	def update(self):
+
 		# Remove after very short duration
-		if pygame.time.get_ticks() - self.time_created > self.duration:
-			self.kill()
+		self.expire_timer = timer_scheduler.schedule(self.duration, self.kill)
+		self.add(groups)
+
+	def kill(self):
+		"""Leave all groups and go back to the pool"""
+		timer_scheduler.cancel(self.expire_timer)
+		self.expire_timer = None
+		if self.alive():
+			super().kill()
+			if self.pool:
+				self.pool.release(self)
 
 class Magic(pygame.sprite.Sprite):
 	"""Magic projectile that travels to target"""
 	def __init__(self, player, groups, style, strength, cost, target_pos=None):
-		super().__init__(groups)
+		super().__init__()
 		self.sprite_type = 'magic'
+		self.pool = None
+		self.animation_speed = 0.2
+		self.speed = 300  # pixels per second
+		self.max_distance = 400  # Maximum travel distance
+		self.reset(player, groups, style, strength, cost, target_pos)
+
+	def reset(self, player, groups, style, strength, cost, target_pos=None):
+		"""Launch the projectile (creation and pool reuse)"""
 		self.player = player
 		self.style = style
 		self.strength = strength
 		self.cost = cost
 		self.frame_index = 0
-		self.animation_speed = 0.2
 		
 		# Projectile movement
 		self.pos = pygame.math.Vector2(player.rect.center)
-		self.speed = 300  # pixels per second
 		
 		# Target direction
 		if target_pos:
@@ -302,26 +384,41 @@ class Magic(pygame.sprite.Sprite):
 			player_direction = player.status.split('_')[0]
 			self.direction = direction_map.get(player_direction, pygame.math.Vector2(1, 0))
 		
-		# Create animated magic effect
-		self.frames = []
-		if style == 'flame':
-			self.frames = self.create_flame_projectile()
-		elif style == 'heal':
-			self.frames = self.create_water_projectile()  # Água/gelo para heal
-		else:
-			self.frames = self.create_default_projectile()
+		# Animated magic effect (frames shared by every projectile of the style)
+		self.frames = self.get_frames(style)
 		
 		self.image = self.frames[0]
 		self.rect = self.image.get_rect(center=self.pos)
 		
-		self.time_created = pygame.time.get_ticks()
-		self.max_distance = 400  # Maximum travel distance
+		self.time_created = timer_scheduler.now
 		self.start_pos = pygame.math.Vector2(player.rect.center)
 		
 		# Don't apply heal immediately - let projectile travel first
 		self.has_hit = False
-		
-	def create_flame_projectile(self):
+		# groups() is a set (arbitrary order): keep the visible group for the impact effect
+		self.effect_group = groups[0] if groups else None
+		self.add(groups)
+
+	def kill(self):
+		"""Leave all groups and go back to the pool"""
+		if self.alive():
+			super().kill()
+			if self.pool:
+				self.pool.release(self)
+
+	@classmethod
+	def get_frames(cls, style):
+		if style not in magic_frames:
+			if style == 'flame':
+				magic_frames[style] = cls.create_flame_projectile()
+			elif style == 'heal':
+				magic_frames[style] = cls.create_water_projectile()  # Água/gelo para heal
+			else:
+				magic_frames[style] = cls.create_default_projectile()
+		return magic_frames[style]
+		
+	@staticmethod
+	def create_flame_projectile():
 		"""Create animated flame projectile"""
 		frames = []
 		for frame in range(8):
@@ -355,7 +452,8 @@ class Magic(pygame.sprite.Sprite):
 			frames.append(surf)
 		return frames
 		
-	def create_water_projectile(self):
+	@staticmethod
+	def create_water_projectile():
 		"""Create animated water/ice projectile"""
 		frames = []
 		for frame in range(8):
@@ -388,7 +486,8 @@ class Magic(pygame.sprite.Sprite):
 			frames.append(surf)
 		return frames
 	
-	def create_default_projectile(self):
+	@staticmethod
+	def create_default_projectile():
 		"""Create default magic projectile"""
 		frames = []
 		for frame in range(6):
@@ -411,7 +510,7 @@ class Magic(pygame.sprite.Sprite):
 			# Heal player
 			if self.player.health < self.player.stats['health']:
 				self.player.health = min(self.player.stats['health'], self.player.health + self.strength)
-				print(f"Curado! Vida: {self.player.health}/{self.player.stats['health']}")
+				game_logger.debug("Curado! Vida: %s/%s", self.player.health, self.player.stats['health'])
 		elif self.style == 'flame' and target:
 			# Apply fire effect to enemy
 			target.apply_fire_effect(self.strength)
@@ -423,8 +522,10 @@ class Magic(pygame.sprite.Sprite):
 		"""Create visual effect when projectile hits"""
 		# This will be called when hitting enemies or reaching max distance
 		from particles import MagicImpactEffect
+		if self.effect_group is None:
+			return
 		try:
-			MagicImpactEffect(self.rect.center, [self.groups()[0]], self.style)
+			MagicImpactEffect(self.rect.center, [self.effect_group], self.style)
 		except:
 			pass  # Skip if particles module not available
 	
@@ -437,7 +538,7 @@ class Magic(pygame.sprite.Sprite):
 		self.image = self.frames[int(self.frame_index)]
 		
 		# Move projectile
-		dt = 1/60  # Assume 60 FPS
+		dt = TICK_DURATION  # simulação em passo fixo
 		self.pos += self.direction * self.speed * dt
 		self.rect.center = self.pos
 		
@@ -447,3 +548,24 @@ class Magic(pygame.sprite.Sprite):
 			self.apply_effect_on_hit()  # Apply effect at max range for heal
 			self.kill()
 
+
+
+# Pools globais - um golpe reaproveita o sprite do golpe anterior
+weapon_pool = SpritePool(Weapon)
+damage_area_pool = SpritePool(Weapon360Damage)
+magic_pool = SpritePool(Magic)
+
+def prewarm_attack_pools(player):
+	"""Carrega todas as armas e magias antes do jogo começar e deixa o pool abastecido"""
+	for weapon_type in weapon_data:
+		for direction in ('up', 'down', 'left', 'right'):
+			Weapon.get_weapon_graphic(weapon_type, direction)
+	for style in magic_data:
+		Magic.get_frames(style)
+	for radius in Weapon360Damage.radius_map.values():
+		if radius not in damage_area_surfaces:
+			damage_area_surfaces[radius] = pygame.Surface([radius*2, radius*2], pygame.SRCALPHA)
+
+	weapon_pool.prewarm(1, player, [])
+	damage_area_pool.prewarm(1, player, [])
+	magic_pool.prewarm(3, player, [], 'heal', 0, 0)